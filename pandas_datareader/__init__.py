@@ -7,24 +7,42 @@ from .data import (
     get_data_econdb,
     get_data_famafrench,
     get_data_fred,
-)
-from .macro import (
-    EurostatClient,
-    MacroResult,
-    OECDClient,
-    describe_macro_dataset,
-    read_macro,
-    search_macro_datasets,
+    read_batch,
 )
 
 PKG = os.path.dirname(__file__)
 
+# imported from pandas_datareader.macro on first access, which keeps pandas
+# out of ``import pandas_datareader``
+_MACRO_EXPORTS = (
+    "EurostatClient",
+    "MacroResult",
+    "OECDClient",
+    "describe_macro_dataset",
+    "read_macro",
+    "search_macro_datasets",
+)
+
+
+def __getattr__(name):
+    if name in _MACRO_EXPORTS:
+        from . import macro
+
+        return getattr(macro, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MACRO_EXPORTS))
+
+
 __all__ = [
     "__version__",
     "get_data_econdb",
     "get_data_famafrench",
     "get_data_fred",
     "DataReader",
+    "read_batch",
     "MacroResult",
     "OECDClient",
     "EurostatClient",
@@ -1,9 +1,25 @@
 import datetime as dt
 
-from pandas import to_datetime
+import numpy as np
+from pandas import (
+    Categorical,
+    DataFrame,
+    DatetimeIndex,
+    Float64Dtype,
+    Index,
+    MultiIndex,
+    Period,
+    PeriodIndex,
+    StringDtype,
+    Timestamp,
+    concat,
+    to_datetime,
+)
+from pandas.api.types import is_datetime64_any_dtype, is_float_dtype
 import requests
 
 from pandas_datareader.compat import is_number
+from pandas_datareader.session import get_session, is_shared_session
 
 
 class SymbolWarning(UserWarning):
@@ -11,6 +27,19 @@ class SymbolWarning(UserWarning):
 
 
 class RemoteDataError(IOError):
+    # HTTP status of the last response, None when no response arrived
+    status_code = None
+
+
+class CircuitOpenError(RemoteDataError):
+    pass
+
+
+class DeadlineExceededError(RemoteDataError, TimeoutError):
+    pass
+
+
+class OfflineError(RemoteDataError):
     pass
 
 
@@ -51,11 +80,256 @@ def _sanitize_dates(start, end):
     return start, end
 
 
+class _ReaderSession:
+    """
+    Descriptor for the ``session`` attribute of readers and macro clients
+
+    A shared session is not kept on the instance but looked up in the
+    registry on every access, so readers created before ``set_transport`` or
+    ``configure_session_pool`` replaced the shared sessions use the new ones.
+    """
+
+    def __set_name__(self, owner, name):
+        self.attr = f"_{name}"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        session = getattr(obj, self.attr, None)
+        return get_session() if session is None else session
+
+    def __set__(self, obj, session):
+        setattr(obj, self.attr, None if is_shared_session(session) else session)
+
+
 def _init_session(session):
     if session is None:
-        session = requests.Session()
-        # do not set requests max_retries here to support arbitrary pause
+        # draw from the process-wide pool so connections outlive the reader
+        session = get_session()
     else:
         if not isinstance(session, requests.Session):
             raise TypeError("session must be a request.Session")
     return session
+
+
+def _period_starts(index):
+    """
+    Start timestamps of the observation periods of ``index``
+
+    For a MultiIndex the periods are read from the last level, e.g. ``year``
+    in the World Bank ``(country, year)`` index. Period labels such as
+    ``"2020"``, ``"2020Q1"`` or ``"2020M01"`` are parsed once per unique value.
+    """
+    if isinstance(index, MultiIndex):
+        index = index.get_level_values(-1)
+    if isinstance(index, PeriodIndex):
+        return index.to_timestamp()
+    if is_datetime64_any_dtype(index):
+        return DatetimeIndex(index)
+    starts = {
+        label: Period(str(label).replace("M", "-")).start_time
+        for label in index.unique()
+    }
+    return DatetimeIndex(index.map(starts))
+
+
+def _last_observation(df):
+    """
+    Earliest of the last observation dates of the columns of ``df``
+
+    Re-reading from this date fetches every observation missing from any
+    column. Returns None when ``df`` is empty or a column has no observation.
+    """
+    if df.empty:
+        return None
+    valid = df.notna().to_numpy()
+    if not valid.any(axis=0).all():
+        return None
+    stamps = _period_starts(df.index).as_unit("ns").asi8
+    last = np.where(valid, stamps[:, None], np.iinfo(np.int64).min).max(axis=0)
+    return Timestamp(last.min())
+
+
+def _merge_tail(existing, new):
+    """
+    Merge freshly read rows into ``existing``
+
+    Rows of ``existing`` older than the first row of ``new`` are kept as they
+    are. From there on values of ``new`` take precedence, so revisions of
+    already stored observations are picked up, and gaps are filled from
+    ``existing``. Only the overlapping tail is aligned.
+    """
+    if new.empty:
+        return existing
+    if existing.empty:
+        return new
+    cutoff = _period_starts(new.index).min()
+    older = np.asarray(_period_starts(existing.index) < cutoff)
+    tail = new.combine_first(existing[~older])
+    merged = concat([existing[older], tail])
+    if existing.index.is_monotonic_increasing:
+        merged = merged.sort_index()
+    return merged
+
+
+def _outer_join(frames):
+    """
+    Outer-join ``frames`` on their indexes into one float DataFrame
+
+    The union of the indexes is built once and the values of every frame are
+    scattered into a preallocated 2-D array through ``get_indexer``, so
+    joining many frames is linear in their total size where pairwise merges
+    are quadratic. Like an outer ``concat`` or ``merge`` the union is sorted,
+    except for a single frame, which keeps its order.
+    """
+    if len(frames) == 1:
+        index = frames[0].index
+        columns = frames[0].columns
+    else:
+        index = frames[0].index.append([frame.index for frame in frames[1:]])
+        index = index.unique()
+        try:
+            index = index.sort_values()
+        except TypeError:
+            pass
+        columns = frames[0].columns.append([frame.columns for frame in frames[1:]])
+    values = np.full((len(index), len(columns)), np.nan)
+    start = 0
+    for frame in frames:
+        stop = start + frame.shape[1]
+        if frame.index.equals(index):
+            rows = slice(None)
+        else:
+            rows = index.get_indexer(frame.index)
+        values[rows, start:stop] = frame.to_numpy(dtype="float64", na_value=np.nan)
+        start = stop
+    return DataFrame(values, index=index, columns=columns)
+
+
+OUTPUTS = ("wide", "long")
+
+
+def _validate_output(output):
+    if output not in OUTPUTS:
+        raise ValueError(f"output must be one of {OUTPUTS}, got {output!r}")
+    return output
+
+
+def _to_long(frames):
+    """
+    Stack single-column frames into long ``(index..., series_id, value)`` rows
+
+    Each frame holds one series, named by its column. Missing values are
+    dropped, so sparse and mixed-frequency series are not aligned on a
+    common index first. The index levels become the leading columns and
+    ``series_id`` is categorical.
+    """
+    series_ids = [frame.columns[0] for frame in frames]
+    categories = list(dict.fromkeys(series_ids))
+    codes = {series_id: code for code, series_id in enumerate(categories)}
+
+    masks = [frame.iloc[:, 0].notna().to_numpy() for frame in frames]
+    lengths = [int(mask.sum()) for mask in masks]
+    indexes = [frame.index[mask] for frame, mask in zip(frames, masks, strict=True)]
+    index = indexes[0].append(indexes[1:]) if len(indexes) > 1 else indexes[0]
+    values = np.concatenate(
+        [
+            frame.iloc[:, 0].to_numpy()[mask]
+            for frame, mask in zip(frames, masks, strict=True)
+        ]
+    )
+    series = Categorical.from_codes(
+        np.repeat([codes[series_id] for series_id in series_ids], lengths),
+        categories=categories,
+    )
+    out = index.to_frame(index=False)
+    out["series_id"] = series
+    out["value"] = values
+    return out
+
+
+DTYPE_BACKENDS = ("numpy_nullable", "pyarrow")
+
+
+def _validate_dtype_backend(dtype_backend):
+    """Check a ``dtype_backend`` option, importing pyarrow when requested"""
+    if dtype_backend is None:
+        return None
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(
+            f"dtype_backend {dtype_backend!r} is invalid, only 'numpy_nullable' "
+            "and 'pyarrow' are allowed."
+        )
+    if dtype_backend == "pyarrow":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "Please install pyarrow if you want to use dtype_backend='pyarrow'"
+            ) from exc
+    return dtype_backend
+
+
+def _float_dtype(dtype_backend):
+    if dtype_backend == "pyarrow":
+        from pandas import ArrowDtype
+        import pyarrow as pa
+
+        return ArrowDtype(pa.float64())
+    return Float64Dtype()
+
+
+def _label_dtype(dtype_backend):
+    if dtype_backend == "pyarrow":
+        from pandas import ArrowDtype
+        import pyarrow as pa
+
+        # labels repeat a lot, so store each distinct label once
+        return ArrowDtype(pa.dictionary(pa.int32(), pa.string()))
+    return StringDtype()
+
+
+def _convert_labels(index, dtype_backend):
+    """Convert the string levels of ``index``, leaving dates and numbers"""
+    if isinstance(index, MultiIndex):
+        return index.set_levels(
+            [_convert_labels(level, dtype_backend) for level in index.levels]
+        )
+    if index.inferred_type != "string":
+        return index
+    return Index(index, dtype=_label_dtype(dtype_backend), name=index.name)
+
+
+def _to_dtype_backend(data, dtype_backend):
+    """
+    Convert reader output to the dtypes of ``dtype_backend``
+
+    Float columns become nullable floats, so missing observations are NA
+    rather than NaN, other columns go through ``convert_dtypes`` and string
+    index and column labels are converted by :func:`_convert_labels`. Dicts,
+    as returned by the Fama/French reader, are converted value by value.
+    """
+    if dtype_backend is None:
+        return data
+    if isinstance(data, dict):
+        return {
+            key: (
+                _to_dtype_backend(value, dtype_backend)
+                if isinstance(value, DataFrame)
+                else value
+            )
+            for key, value in data.items()
+        }
+    float_dtype = _float_dtype(dtype_backend)
+    out = data.copy(deep=False)
+    for i, dtype in enumerate(data.dtypes):
+        column = data.iloc[:, i]
+        if isinstance(dtype, type(float_dtype)):
+            continue
+        if is_float_dtype(dtype):
+            out.isetitem(i, column.astype(float_dtype))
+        else:
+            out.isetitem(i, column.convert_dtypes(dtype_backend=dtype_backend))
+    out.index = _convert_labels(out.index, dtype_backend)
+    out.columns = _convert_labels(out.columns, dtype_backend)
+    return out
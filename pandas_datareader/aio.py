@@ -0,0 +1,89 @@
+"""
+Asynchronous helpers for running readers from an asyncio event loop.
+
+The asynchronous readers require the optional ``httpx`` dependency.
+"""
+
+import asyncio
+
+__all__ = ["aread_many", "new_async_client"]
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as exc:
+        raise ImportError(
+            "Please install httpx if you want to use the asynchronous readers"
+        ) from exc
+    return httpx
+
+
+def new_async_client(max_connections=100, max_keepalive_connections=20, **kwargs):
+    """
+    Create an ``httpx.AsyncClient`` suitable for the asynchronous readers
+
+    Parameters
+    ----------
+    max_connections : int, default 100
+        Maximum number of concurrent connections across all hosts.
+    max_keepalive_connections : int, default 20
+        Maximum number of idle connections kept alive for reuse.
+    kwargs :
+        Additional keywords passed to ``httpx.AsyncClient``.
+
+    Returns
+    -------
+    client : httpx.AsyncClient
+    """
+    httpx = _import_httpx()
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+    )
+    # match requests, which follows redirects by default
+    kwargs.setdefault("follow_redirects", True)
+    return httpx.AsyncClient(limits=limits, **kwargs)
+
+
+async def aread_many(
+    readers, max_concurrency=100, client=None, return_exceptions=False
+):
+    """
+    Read several readers concurrently on one shared asynchronous client
+
+    Parameters
+    ----------
+    readers : iterable of readers
+        Reader instances, e.g. ``FredReader`` or ``OECDReader``.
+    max_concurrency : int, default 100
+        Maximum number of readers in flight at once.
+    client : httpx.AsyncClient, optional
+        Client shared by all readers. A temporary client sized to
+        ``max_concurrency`` is created and closed when not provided.
+    return_exceptions : bool, default False
+        Return exceptions in place of results instead of raising the first.
+
+    Returns
+    -------
+    results : list
+        Results in the same order as ``readers``.
+    """
+    readers = list(readers)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    owned = client is None
+    if owned:
+        client = new_async_client(max_connections=max_concurrency)
+
+    async def _run(reader):
+        async with semaphore:
+            return await reader.aread(client=client)
+
+    try:
+        return await asyncio.gather(
+            *(_run(reader) for reader in readers),
+            return_exceptions=return_exceptions,
+        )
+    finally:
+        if owned:
+            await client.aclose()
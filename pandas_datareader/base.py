@@ -1,5 +1,9 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import datetime
+import io
 from io import StringIO
+import json
 import time
 from urllib.parse import urlencode
 import warnings
@@ -8,15 +12,26 @@ import numpy as np
 from pandas import DataFrame, concat, read_csv
 import requests
 
+from pandas_datareader import hedge, ratelimit, singleflight
 from pandas_datareader._utils import (
+    OfflineError,
     RemoteDataError,
     SymbolWarning,
     _init_session,
+    _ReaderSession,
     _sanitize_dates,
+    _to_dtype_backend,
+    _validate_dtype_backend,
 )
+from pandas_datareader.aio import _import_httpx, new_async_client
+from pandas_datareader.cache import get_cache
+from pandas_datareader.hooks import _HookMixin
+from pandas_datareader.offline import is_offline
+from pandas_datareader.retry import Deadline, get_default_retry_policy
+from pandas_datareader.session import is_shared_session
 
 
-class _BaseReader:
+class _BaseReader(_HookMixin):
     """
     Parameters
     ----------
@@ -35,10 +50,33 @@ class _BaseReader:
         requests.sessions.Session instance to be used.
     freq : {str, None}
         Frequency to use in select readers
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        Dtypes of the result. 'pyarrow' returns Arrow-backed data with
+        nullable float values and dictionary-encoded string labels and
+        requires pyarrow; 'numpy_nullable' uses the pandas nullable dtypes.
+        None, the default, keeps NumPy dtypes.
+    deadline : float, optional
+        Total time budget in seconds, across retries and sub-requests.
+    offline : bool, optional
+        Answer only from the response cache and raise ``OfflineError`` on a
+        miss. None, the default, follows :func:`pandas_datareader.offline.is_offline`.
+
+    Attributes
+    ----------
+    cache : ResponseCache, bool or None
+        Response cache for this reader. None uses the cache enabled with
+        :func:`pandas_datareader.cache.install_cache`, False disables caching.
+    retry_policy : RetryPolicy or None
+        Policy deciding which failures are retried and how long to wait.
+        None uses :func:`pandas_datareader.retry.get_default_retry_policy`.
+    coalesce : bool
+        Share the response of an identical request already in flight in
+        another thread instead of sending a duplicate. Default True.
     """
 
     _chunk_size = 1024 * 1024
     _format = "string"
+    session = _ReaderSession()
 
     def __init__(
         self,
@@ -50,6 +88,9 @@ class _BaseReader:
         timeout=30,
         session=None,
         freq=None,
+        dtype_backend=None,
+        deadline=None,
+        offline=None,
     ):
         self.symbols = symbols
 
@@ -65,11 +106,36 @@ class _BaseReader:
         self.pause_multiplier = 1
         self.session = _init_session(session)
         self.freq = freq
+        self.dtype_backend = _validate_dtype_backend(dtype_backend)
+        if deadline is not None and not deadline > 0:
+            raise ValueError("'deadline' must be a positive number of seconds")
+        self.deadline = deadline
+        self._deadline = None
+        self.offline = offline
         self.headers = None
+        self.async_client = None
+        self.cache = None
+        self.retry_policy = None
+        self.coalesce = True
 
     def close(self):
-        """Close network session"""
-        self.session.close()
+        """Close network session
+
+        Shared sessions drawn from :mod:`pandas_datareader.session` are left
+        open so their pooled connections can be reused by later reads. The
+        ``deadline`` budget starts again with the next request.
+        """
+        self._deadline = None
+        if not is_shared_session(self.session):
+            self.session.close()
+
+    def _active_deadline(self):
+        """Deadline of the current read, started by its first request"""
+        if self.deadline is None:
+            return None
+        if self._deadline is None:
+            self._deadline = Deadline(self.deadline)
+        return self._deadline
 
     @property
     def default_start_date(self):
@@ -91,25 +157,157 @@ class _BaseReader:
     def read(self):
         """Read data from connector"""
         try:
-            return self._read_one_data(self.url, self.params)
+            return self._convert(self._read_one_data(self.url, self.params))
+        finally:
+            self.close()
+
+    async def aread(self, client=None):
+        """Read data from connector without blocking the event loop
+
+        Parameters
+        ----------
+        client : httpx.AsyncClient, optional
+            Client used to send requests. A temporary client is created and
+            closed when not provided.
+        """
+        owned = client is None
+        if owned:
+            client = new_async_client()
+        self.async_client = client
+        try:
+            return self._convert(await self._aread())
+        finally:
+            self.async_client = None
+            self._deadline = None
+            if owned:
+                await client.aclose()
+
+    async def _aread(self):
+        return await self._aread_one_data(self.url, self.params)
+
+    def _convert(self, data):
+        """Apply ``dtype_backend`` to the parsed result"""
+        return _to_dtype_backend(data, self.dtype_backend)
+
+    def iter_read(self, max_workers=None):
+        """Read data one symbol at a time
+
+        Yields ``(symbol, data)`` pairs as soon as each symbol has been
+        fetched and parsed, so a consumer can store and drop each frame
+        before the next one arrives. Symbols that cannot be read are skipped
+        with the warning or error ``read`` would give.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of symbols fetched concurrently. Pairs are then yielded in
+            completion order and at most ``max_workers`` parsed frames are
+            held at once. None or 1 reads the symbols in order.
+        """
+        try:
+            for symbol, data in _imap_unordered(
+                self._read_symbol, self._names(), max_workers
+            ):
+                if data is None:
+                    self._symbol_failed(symbol)
+                else:
+                    yield symbol, self._convert(data)
         finally:
             self.close()
 
+    def _names(self):
+        """Symbols read one at a time by ``iter_read``"""
+        return [self.symbols]
+
+    def _read_symbol(self, symbol):
+        """Fetch one symbol, returning None if it could not be read"""
+        return self._read_one_data(self.url, self.params)
+
+    def _symbol_failed(self, symbol):
+        """Called for each symbol ``_read_symbol`` could not read"""
+
     def _read_one_data(self, url, params):
         """read one data from specified URL"""
         if self._format == "string":
+            if self._can_stream():
+                with self._read_url_as_stream(url, params=params) as out:
+                    return self._parse(url, self._read_lines, out)
             out = self._read_url_as_StringIO(url, params=params)
         elif self._format == "json":
-            out = self._get_response(url, params=params).json()
+            response = self._get_response(url, params=params, stream=True)
+            with self._response_stream(response) as stream:
+                out = json.load(stream)
         else:
             raise NotImplementedError(self._format)
-        return self._read_lines(out)
+        return self._parse(url, self._read_lines, out)
+
+    async def _aread_one_data(self, url, params):
+        """read one data from specified URL without blocking"""
+        if self._format == "string":
+            out = await self._aread_url_as_StringIO(url, params=params)
+        elif self._format == "json":
+            out = (await self._aget_response(url, params=params)).json()
+        else:
+            raise NotImplementedError(self._format)
+        return self._parse(url, self._read_lines, out)
 
     def _read_url_as_StringIO(self, url, params=None):
         """
         Open url (and retry)
         """
         response = self._get_response(url, params=params)
+        return self._response_as_StringIO(response)
+
+    def _read_url_as_stream(self, url, params=None):
+        """
+        Open url (and retry) as a binary file-like object
+
+        The body is pulled from the connection in ``_chunk_size`` pieces as
+        the caller reads, so parsers consume it without a full copy in memory.
+        """
+        response = self._get_response(url, params=params, stream=True)
+        stream = self._response_stream(response)
+        if len(stream.peek(1)) == 0:
+            stream.close()
+            service = self.__class__.__name__
+            raise OSError(
+                f"{service} request returned no data; check URL for invalid inputs: "
+                f"{url}"
+            )
+        return stream
+
+    def _response_stream(self, response):
+        """Wrap ``response`` in a buffered binary stream over its body"""
+        return io.BufferedReader(
+            _ResponseStream(response, self._chunk_size), self._chunk_size
+        )
+
+    def _can_stream(self):
+        """Return True if the response body can be parsed while downloading"""
+        # a custom _sanitize_response needs the whole payload at once
+        return type(self)._sanitize_response is _BaseReader._sanitize_response
+
+    async def _aread_url_as_stream(self, url, params=None):
+        """
+        Open url (and retry) without blocking as a binary file-like object
+        """
+        response = await self._aget_response(url, params=params)
+        if len(response.content) == 0:
+            service = self.__class__.__name__
+            raise OSError(
+                f"{service} request returned no data; check URL for invalid inputs: "
+                f"{url}"
+            )
+        return io.BytesIO(response.content)
+
+    async def _aread_url_as_StringIO(self, url, params=None):
+        """
+        Open url (and retry) without blocking
+        """
+        response = await self._aget_response(url, params=params)
+        return self._response_as_StringIO(response)
+
+    def _response_as_StringIO(self, response):
         text = self._sanitize_response(response)
         out = StringIO()
         if len(text) == 0:
@@ -133,7 +331,7 @@ class _BaseReader:
         """
         return response.content
 
-    def _get_response(self, url, params=None, headers=None):
+    def _get_response(self, url, params=None, headers=None, stream=False):
         """send raw HTTP request to get requests.Response from the specified url
         Parameters
         ----------
@@ -141,30 +339,98 @@ class _BaseReader:
             target URL
         params : dict or None
             parameters passed to the URL
+        stream : bool, default False
+            Defer downloading the body of a successful response until it is
+            read, e.g. with ``iter_content``.
         """
         headers = headers or self.headers
-        pause = self.pause
+        if not self.coalesce:
+            return self._fetch_response(url, params, headers, stream)
+        return singleflight.coalesce(
+            self.session,
+            url,
+            params,
+            headers,
+            lambda: self._fetch_response(url, params, headers, stream),
+            timeout=self._attempt_timeout(self._active_deadline(), url),
+        )
+
+    def _fetch_response(self, url, params, headers, stream):
+        cache, entry, headers = self._cache_lookup(url, params, headers)
+        offline = self._is_offline()
+        if entry is not None and (entry.fresh or offline):
+            response = entry.to_response()
+            self._emit("on_response", url=url, params=params, response=response)
+            return response
+        if offline:
+            raise self._offline_error(url, params)
+        if cache is not None:
+            # the cache stores complete bodies
+            stream = False
+        policy = self._retry_policy()
+        deadline = self._active_deadline()
+        base = delay = self.pause
+        response = None
         last_response_text = ""
         last_exception = None
-        for _ in range(self.retry_count + 1):
+        for attempt in range(self.retry_count + 1):
+            if attempt > 0:
+                delay = policy.next_delay(delay, base, response)
+                if deadline is not None:
+                    delay = deadline.delay(delay, url)
+                self._emit_retry(url, params, attempt, delay, response, last_exception)
+                time.sleep(delay)
+                # Increase time between subsequent requests, per subclass.
+                base *= self.pause_multiplier
+            policy.check(url)
+            ratelimit.acquire(url)
+            timeout = self._attempt_timeout(deadline, url)
+            self._emit("on_request", url=url, params=params, attempt=attempt)
+            started = time.perf_counter()
             try:
-                response = self.session.get(
-                    url, params=params, headers=headers, timeout=self.timeout
+                response = hedge.send(
+                    url,
+                    lambda timeout=timeout: self.session.get(
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=timeout,
+                        stream=stream,
+                    ),
                 )
             except requests.exceptions.RequestException as exc:
+                policy.record_failure(url)
                 last_exception = exc
-                time.sleep(pause)
-                pause *= self.pause_multiplier
+                response = None
+                self._emit(
+                    "on_response",
+                    url=url,
+                    params=params,
+                    attempt=attempt,
+                    elapsed=time.perf_counter() - started,
+                    error=exc,
+                )
+                if deadline is not None and deadline.expired():
+                    raise deadline.error(url) from exc
                 continue
-            if response.status_code == requests.codes.ok:
-                return response
+            self._emit(
+                "on_response",
+                url=url,
+                params=params,
+                attempt=attempt,
+                elapsed=time.perf_counter() - started,
+                response=response,
+            )
+            accepted = self._accept_response(
+                url, params, response, cache, entry, policy
+            )
+            if accepted is not None:
+                return accepted
 
             if response.encoding:
                 last_response_text = response.text.encode(response.encoding)
-            time.sleep(pause)
-
-            # Increase time between subsequent requests, per subclass.
-            pause *= self.pause_multiplier
+            if stream:
+                response.close()
             # Get a new breadcrumb if necessary, in case ours is invalidated
             if isinstance(params, list) and "crumb" in params:
                 params["crumb"] = self._get_crumb(self.retry_count)
@@ -172,7 +438,183 @@ class _BaseReader:
             # If our output error function returns True, exit the loop.
             if self._output_error(response):
                 break
+            if not self._retry_failed_response(url, response, policy):
+                break
+
+        raise self._remote_error(
+            url, params, last_response_text, last_exception, response
+        )
+
+    async def _aget_response(self, url, params=None, headers=None):
+        """send HTTP request without blocking to get a response from the url
+
+        Mirrors :meth:`_get_response`, sleeping between retries with
+        ``asyncio.sleep`` so other requests proceed in the meantime.
+
+        Parameters
+        ----------
+        url : str
+            target URL
+        params : dict or None
+            parameters passed to the URL
+        """
+        httpx = _import_httpx()
+        client = getattr(self, "async_client", None)
+        if client is None:
+            raise RuntimeError("asynchronous requests must be made within aread()")
+        headers = headers or self.headers
+        cache, entry, headers = self._cache_lookup(url, params, headers)
+        offline = self._is_offline()
+        if entry is not None and (entry.fresh or offline):
+            response = entry.to_response()
+            self._emit("on_response", url=url, params=params, response=response)
+            return response
+        if offline:
+            raise self._offline_error(url, params)
+        policy = self._retry_policy()
+        deadline = self._active_deadline()
+        base = delay = self.pause
+        response = None
+        last_response_text = ""
+        last_exception = None
+        for attempt in range(self.retry_count + 1):
+            if attempt > 0:
+                delay = policy.next_delay(delay, base, response)
+                if deadline is not None:
+                    delay = deadline.delay(delay, url)
+                self._emit_retry(url, params, attempt, delay, response, last_exception)
+                await asyncio.sleep(delay)
+                base *= self.pause_multiplier
+            policy.check(url)
+            await ratelimit.aacquire(url)
+            timeout = self._attempt_timeout(deadline, url)
+            self._emit("on_request", url=url, params=params, attempt=attempt)
+            started = time.perf_counter()
+            try:
+                response = await hedge.asend(
+                    url,
+                    lambda timeout=timeout: client.get(
+                        url, params=params, headers=headers, timeout=timeout
+                    ),
+                )
+            except httpx.RequestError as exc:
+                policy.record_failure(url)
+                last_exception = exc
+                response = None
+                self._emit(
+                    "on_response",
+                    url=url,
+                    params=params,
+                    attempt=attempt,
+                    elapsed=time.perf_counter() - started,
+                    error=exc,
+                )
+                if deadline is not None and deadline.expired():
+                    raise deadline.error(url) from exc
+                continue
+            self._emit(
+                "on_response",
+                url=url,
+                params=params,
+                attempt=attempt,
+                elapsed=time.perf_counter() - started,
+                response=response,
+            )
+            accepted = self._accept_response(
+                url, params, response, cache, entry, policy
+            )
+            if accepted is not None:
+                return accepted
+
+            if response.encoding:
+                last_response_text = response.text.encode(response.encoding)
+            if self._output_error(response):
+                break
+            if not self._retry_failed_response(url, response, policy):
+                break
 
+        raise self._remote_error(
+            url, params, last_response_text, last_exception, response
+        )
+
+    def _is_offline(self):
+        """Return True if requests must be answered from the cache"""
+        return is_offline(self.offline)
+
+    @staticmethod
+    def _offline_error(url, params=None):
+        if params:
+            url = url + "?" + urlencode(params)
+        return OfflineError(f"Offline mode: {url} is not in the response cache")
+
+    def _attempt_timeout(self, deadline, url):
+        """Timeout of one attempt, cut to what is left of the deadline"""
+        if deadline is None:
+            return self.timeout
+        return deadline.timeout(self.timeout, url)
+
+    def _emit_retry(self, url, params, attempt, delay, response, error):
+        self._emit(
+            "on_retry",
+            url=url,
+            params=params,
+            attempt=attempt,
+            delay=delay,
+            status=None if response is None else response.status_code,
+            error=None if response is not None else error,
+        )
+
+    def _cache_lookup(self, url, params, headers):
+        """Find the cached entry for a request
+
+        Returns the cache, the entry (or None) and the request headers, with
+        conditional validators added when an entry exists.
+        """
+        cache = self._response_cache()
+        entry = None
+        if cache is not None:
+            entry = cache.lookup(url, params)
+            if entry is not None and not entry.fresh:
+                headers = {**(headers or {}), **entry.validators()}
+        return cache, entry, headers
+
+    @staticmethod
+    def _accept_response(url, params, response, cache, entry, policy):
+        """Return the response to hand back, or None if the attempt failed"""
+        if response.status_code == 304 and entry is not None:
+            policy.record_success(url)
+            return cache.revalidated(entry, response)
+        if response.status_code == requests.codes.ok:
+            policy.record_success(url)
+            if cache is not None:
+                cache.store(url, params, response)
+            return response
+        return None
+
+    @staticmethod
+    def _retry_failed_response(url, response, policy):
+        """Record a failed response and return True if it is worth retrying"""
+        if not policy.is_retryable(response.status_code):
+            # the host answered; the request itself cannot succeed
+            policy.record_success(url)
+            return False
+        policy.record_failure(url)
+        return True
+
+    def _retry_policy(self):
+        """Retry policy used by this reader"""
+        if self.retry_policy is None:
+            return get_default_retry_policy()
+        return self.retry_policy
+
+    def _response_cache(self):
+        """Response cache used by this reader, or None when disabled"""
+        if self.cache is None:
+            return get_cache()
+        return self.cache or None
+
+    @staticmethod
+    def _remote_error(url, params, last_response_text, last_exception, response=None):
         if params is not None and len(params) > 0:
             url = url + "?" + urlencode(params)
         msg = f"Unable to read URL: {url}"
@@ -181,7 +623,10 @@ class _BaseReader:
         if last_exception is not None:
             msg += f"\nException:\n{last_exception}"
 
-        raise RemoteDataError(msg)
+        error = RemoteDataError(msg)
+        if response is not None:
+            error.status_code = response.status_code
+        return error
 
     def _get_crumb(self, *args):
         """To be implemented by subclass"""
@@ -224,7 +669,16 @@ class _BaseReader:
 
 
 class _DailyBaseReader(_BaseReader):
-    """Base class for Google / Yahoo daily reader"""
+    """Base class for Google / Yahoo daily reader
+
+    Parameters
+    ----------
+    chunksize : int, default 25
+        Number of symbols fetched per chunk when reading multiple symbols.
+    max_workers : int, default None
+        Number of threads used to fetch the symbols of a chunk concurrently.
+        None or 1 fetches symbols one at a time.
+    """
 
     def __init__(
         self,
@@ -235,6 +689,10 @@ class _DailyBaseReader(_BaseReader):
         pause=0.1,
         session=None,
         chunksize=25,
+        max_workers=None,
+        dtype_backend=None,
+        deadline=None,
+        offline=None,
     ):
         super().__init__(
             symbols=symbols,
@@ -243,49 +701,101 @@ class _DailyBaseReader(_BaseReader):
             retry_count=retry_count,
             pause=pause,
             session=session,
+            dtype_backend=dtype_backend,
+            deadline=deadline,
+            offline=offline,
         )
+        if max_workers is not None and (
+            not isinstance(max_workers, int) or max_workers < 1
+        ):
+            raise ValueError("'max_workers' must be a positive integer or None")
         self.chunksize = chunksize
+        self.max_workers = max_workers
 
     def _get_params(self, *args, **kwargs):
         raise NotImplementedError
 
+    def iter_read(self, max_workers=None):
+        """Read data one symbol at a time, see :meth:`_BaseReader.iter_read`
+
+        ``max_workers`` defaults to the ``max_workers`` of the reader.
+        """
+        if max_workers is None:
+            max_workers = self.max_workers
+        return super().iter_read(max_workers=max_workers)
+
+    def _names(self):
+        if isinstance(self.symbols, (str, int)):
+            return [self.symbols]
+        if isinstance(self.symbols, DataFrame):
+            return list(self.symbols.index)
+        return list(self.symbols)
+
     def read(self):
         """Read data"""
-        # If a single symbol, (e.g., 'GOOG')
-        if isinstance(self.symbols, (str, int)):
-            df = self._read_one_data(self.url, params=self._get_params(self.symbols))
-        # Or multiple symbols, (e.g., ['GOOG', 'AAPL', 'MSFT'])
-        elif isinstance(self.symbols, DataFrame):
-            df = self._dl_mult_symbols(self.symbols.index)
-        else:
-            df = self._dl_mult_symbols(self.symbols)
-        return df
+        try:
+            # If a single symbol, (e.g., 'GOOG')
+            if isinstance(self.symbols, (str, int)):
+                df = self._read_one_data(
+                    self.url, params=self._get_params(self.symbols)
+                )
+            # Or multiple symbols, (e.g., ['GOOG', 'AAPL', 'MSFT'])
+            elif isinstance(self.symbols, DataFrame):
+                df = self._dl_mult_symbols(self.symbols.index)
+            else:
+                df = self._dl_mult_symbols(self.symbols)
+        finally:
+            # the next read gets a fresh deadline budget
+            self._deadline = None
+        return self._convert(df)
+
+    def _read_symbol(self, sym):
+        """Fetch one symbol, returning None if it could not be read"""
+        try:
+            return self._read_one_data(self.url, self._get_params(sym))
+        except (OSError, KeyError):
+            return None
+
+    def _symbol_failed(self, symbol):
+        msg = "Failed to read symbol: {0!r}, replacing with NaN."
+        warnings.warn(msg.format(symbol), SymbolWarning, stacklevel=3)
 
     def _dl_mult_symbols(self, symbols):
         stocks = {}
         failed = []
         passed = []
-        for sym_group in _in_chunks(symbols, self.chunksize):
-            for sym in sym_group:
-                try:
-                    stocks[sym] = self._read_one_data(self.url, self._get_params(sym))
-                    passed.append(sym)
-                except (OSError, KeyError):
-                    msg = "Failed to read symbol: {0!r}, replacing with NaN."
-                    warnings.warn(msg.format(sym), SymbolWarning, stacklevel=2)
-                    failed.append(sym)
+        executor = None
+        if self.max_workers is not None and self.max_workers > 1:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for sym_group in _in_chunks(symbols, self.chunksize):
+                if executor is None:
+                    frames = map(self._read_symbol, sym_group)
+                else:
+                    # map preserves input order regardless of completion order
+                    frames = executor.map(self._read_symbol, sym_group)
+                for sym, frame in zip(sym_group, frames, strict=True):
+                    if frame is None:
+                        self._symbol_failed(sym)
+                        failed.append(sym)
+                    else:
+                        stocks[sym] = frame
+                        passed.append(sym)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         if len(passed) == 0:
             msg = "No data fetched using {0!r}"
             raise RemoteDataError(msg.format(self.__class__.__name__))
         try:
-            if len(stocks) > 0 and len(failed) > 0 and len(passed) > 0:
+            if len(failed) > 0:
                 df_na = stocks[passed[0]].copy()
                 df_na[:] = np.nan
-                for sym in failed:
-                    stocks[sym] = df_na
-                result = concat(stocks, sort=True).unstack(level=0)
-                result.columns.names = ["Attributes", "Symbols"]
+                # keep the requested symbol order in the result
+                stocks = {sym: stocks.get(sym, df_na) for sym in symbols}
+            result = concat(stocks, sort=True).unstack(level=0)
+            result.columns.names = ["Attributes", "Symbols"]
             return result
         except AttributeError as exc:
             # cannot construct a panel with just 1D nans indicating no data
@@ -293,6 +803,70 @@ class _DailyBaseReader(_BaseReader):
             raise RemoteDataError(msg.format(self.__class__.__name__)) from exc
 
 
+class _ResponseStream(io.RawIOBase):
+    """Read-only raw stream over a response body, pulled in chunks"""
+
+    def __init__(self, response, chunk_size):
+        self._response = response
+        self._chunks = response.iter_content(chunk_size)
+        self._pending = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._response.close()
+        super().close()
+
+
+def _imap_unordered(func, items, max_workers=None):
+    """
+    Yield ``(item, func(item))`` pairs as the calls complete
+
+    Calls run on up to ``max_workers`` threads. A new call is only started
+    when a result is taken, so at most ``max_workers`` results wait to be
+    consumed. None or 1 calls ``func`` on the items in order.
+    """
+    if max_workers is None or max_workers <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+
+    items = iter(items)
+    pending = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in items:
+                pending[executor.submit(func, item)] = item
+                if len(pending) == max_workers:
+                    break
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    result = future.result()
+                    # keep the workers busy while the caller handles result
+                    for following in items:
+                        pending[executor.submit(func, following)] = following
+                        break
+                    yield item, result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 def _in_chunks(seq, size):
     """
     Return sequence in 'chunks' of size defined by size
@@ -0,0 +1,316 @@
+"""
+On-disk HTTP response cache with conditional revalidation.
+
+Responses are stored under a key derived from the normalized URL and query
+parameters. Fresh entries are served without a request; stale entries are
+revalidated with ``If-None-Match`` / ``If-Modified-Since`` so an unchanged
+payload costs one round trip and no body bytes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+__all__ = [
+    "ResponseCache",
+    "get_cache",
+    "install_cache",
+    "normalize_url",
+    "uninstall_cache",
+]
+
+_STORED_HEADERS = (
+    "Content-Type",
+    "ETag",
+    "Last-Modified",
+)
+
+# query parameters that carry credentials, kept out of the stored metadata
+_CREDENTIAL_PARAMS = frozenset(
+    {"api_key", "apikey", "access_key", "token", "access_token"}
+)
+
+# eviction frees space down to this share of max_bytes, so a full cache is
+# not rescanned on every store
+_LOW_WATER = 0.9
+
+
+def _default_path():
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(root, "pandas_datareader")
+
+
+def normalize_url(url, params=None):
+    """
+    Return ``url`` with ``params`` merged into a sorted query string
+
+    Parameters
+    ----------
+    url : str
+        Request URL, possibly with a query string.
+    params : dict, list of tuples or None
+        Parameters passed to the URL.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        items = params.items() if hasattr(params, "items") else params
+        query.extend((str(k), str(v)) for k, v in items if v is not None)
+    query = urlencode(sorted(query))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, "")
+    )
+
+
+def _redact_url(url):
+    """Return ``url`` without credentials in its user info or query string"""
+    parts = urlsplit(url)
+    query = [
+        (k, "REDACTED" if k.lower() in _CREDENTIAL_PARAMS else v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    netloc = parts.netloc.rpartition("@")[2]
+    return urlunsplit((parts.scheme, netloc, parts.path, urlencode(query), ""))
+
+
+class CacheEntry:
+    """A cached response and its metadata"""
+
+    def __init__(self, cache, key, meta):
+        self.cache = cache
+        self.key = key
+        self.meta = meta
+
+    @property
+    def fresh(self):
+        """True if the entry is within the cache time-to-live"""
+        ttl = self.cache.ttl
+        return ttl is not None and time.time() - self.meta["stored_at"] < ttl
+
+    def validators(self):
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.meta["headers"].get("ETag"):
+            headers["If-None-Match"] = self.meta["headers"]["ETag"]
+        if self.meta["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = self.meta["headers"]["Last-Modified"]
+        return headers
+
+    def to_response(self):
+        """Rebuild a ``requests.Response`` from the stored body"""
+        response = requests.Response()
+        response.status_code = requests.codes.ok
+        response.url = self.meta["url"]
+        response.headers = CaseInsensitiveDict(self.meta["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.cache._read_body(self.key)
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """
+    On-disk cache of successful GET responses
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory holding the cache. Defaults to
+        ``$XDG_CACHE_HOME/pandas_datareader`` or ``~/.cache/pandas_datareader``.
+    ttl : float, default 3600
+        Seconds during which a stored response is served without contacting
+        the provider. Older entries are revalidated. None always revalidates.
+    max_bytes : int, default 512 MiB
+        Byte budget for stored bodies. Once it is exceeded, least recently
+        used entries are evicted until 90% of it is used.
+
+    Notes
+    -----
+    A hit marks its entry as used by touching the body file, and the stored
+    URL has credentials such as ``api_key`` or ``token`` redacted.
+    """
+
+    def __init__(self, path=None, ttl=3600, max_bytes=512 * 1024**2):
+        self.path = path or _default_path()
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # bytes stored, counted from disk on the first store
+        self._size = None
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def key(url, params=None):
+        """Cache key of the normalized URL and parameters"""
+        normalized = normalize_url(url, params)
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _file(self, key, suffix):
+        return os.path.join(self.path, key + suffix)
+
+    def _write(self, filename, data):
+        tmp = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, filename)
+
+    def _read_body(self, key):
+        with open(self._file(key, ".body"), "rb") as fh:
+            return fh.read()
+
+    def _write_meta(self, key, meta):
+        self._write(self._file(key, ".json"), json.dumps(meta).encode("utf-8"))
+
+    def lookup(self, url, params=None):
+        """
+        Return the :class:`CacheEntry` for a request, or None on a miss
+        """
+        key = self.key(url, params)
+        try:
+            with open(self._file(key, ".json"), "rb") as fh:
+                meta = json.loads(fh.read())
+        except (OSError, ValueError):
+            return None
+        try:
+            # the body's mtime records the last use for eviction
+            os.utime(self._file(key, ".body"))
+        except OSError:
+            return None
+        return CacheEntry(self, key, meta)
+
+    def store(self, url, params, response):
+        """
+        Store a successful response
+
+        Responses marked ``Cache-Control: no-store`` are not stored.
+        """
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        key = self.key(url, params)
+        body = response.content
+        meta = {
+            "url": _redact_url(normalize_url(url, params)),
+            "headers": {
+                name: response.headers[name]
+                for name in _STORED_HEADERS
+                if name in response.headers
+            },
+            "size": len(body),
+            "stored_at": time.time(),
+        }
+        with self._lock:
+            if self._size is None:
+                self._size = self.size
+            self._size -= self._stored_size(key)
+            self._write(self._file(key, ".body"), body)
+            self._write_meta(key, meta)
+            self._size += len(body)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def revalidated(self, entry, response=None):
+        """
+        Mark ``entry`` as confirmed unchanged by a 304 response
+
+        Returns the cached response.
+        """
+        entry.meta["stored_at"] = time.time()
+        if response is not None:
+            for name in ("ETag", "Last-Modified"):
+                if name in response.headers:
+                    entry.meta["headers"][name] = response.headers[name]
+        with self._lock:
+            self._write_meta(entry.key, entry.meta)
+        return entry.to_response()
+
+    def _entries(self):
+        for name in os.listdir(self.path):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.path, name), "rb") as fh:
+                    yield name[:-5], json.loads(fh.read())
+            except (OSError, ValueError):
+                continue
+
+    def _stored_size(self, key):
+        try:
+            return os.path.getsize(self._file(key, ".body"))
+        except OSError:
+            return 0
+
+    def _remove(self, key):
+        for suffix in (".body", ".json"):
+            try:
+                os.remove(self._file(key, suffix))
+            except OSError:
+                pass
+
+    def _evict(self):
+        entries = []
+        for key, meta in self._entries():
+            try:
+                used = os.path.getmtime(self._file(key, ".body"))
+            except OSError:
+                self._remove(key)
+                continue
+            entries.append((used, key, meta["size"]))
+        entries.sort()
+        # recount, as other processes may share the directory
+        total = sum(size for _, _, size in entries)
+        for _, key, size in entries:
+            if total <= self.max_bytes * _LOW_WATER:
+                break
+            self._remove(key)
+            total -= size
+        self._size = total
+
+    @property
+    def size(self):
+        """Total bytes of stored bodies"""
+        return sum(meta["size"] for _, meta in self._entries())
+
+    def clear(self):
+        """Remove every stored response"""
+        with self._lock:
+            for key, _ in list(self._entries()):
+                self._remove(key)
+            self._size = 0
+
+
+_cache = None
+
+
+def install_cache(path=None, ttl=3600, max_bytes=512 * 1024**2):
+    """
+    Enable the response cache for every reader
+
+    Parameters are passed to :class:`ResponseCache`.
+
+    Returns
+    -------
+    cache : ResponseCache
+    """
+    global _cache
+    _cache = ResponseCache(path=path, ttl=ttl, max_bytes=max_bytes)
+    return _cache
+
+
+def uninstall_cache():
+    """Disable the process-wide response cache"""
+    global _cache
+    _cache = None
+
+
+def get_cache():
+    """Return the installed :class:`ResponseCache`, or None"""
+    return _cache
@@ -4,10 +4,6 @@ import sys
 from urllib.error import HTTPError
 import warnings
 
-from pandas.api.types import is_list_like, is_number
-from pandas.io import common as com
-from pandas.testing import assert_frame_equal
-
 __all__ = [
     "HTTPError",
     "StringIO",
@@ -90,6 +86,8 @@ def deprecate_kwarg(old_arg_name, new_arg_name, mapping=None, stacklevel=2):
 
 
 def get_filepath_or_buffer(filepath_or_buffer, encoding=None, compression=None):
+    from pandas.io import common as com
+
     # Dictionaries are no longer considered valid inputs
     # for "get_filepath_or_buffer" starting in pandas >= 0.20.0
     if isinstance(filepath_or_buffer, dict):
@@ -107,3 +105,17 @@ def get_filepath_or_buffer(filepath_or_buffer, encoding=None, compression=None):
 
 
 PYTHON_LT_3_10 = sys.version_info <= (3, 10)
+
+
+def __getattr__(name):
+    # importing pandas is the bulk of the package import time, so the pandas
+    # helpers are only imported when first used
+    if name in ("is_list_like", "is_number"):
+        from pandas.api import types
+
+        return getattr(types, name)
+    if name == "assert_frame_equal":
+        from pandas.testing import assert_frame_equal
+
+        return assert_frame_equal
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
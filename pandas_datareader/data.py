@@ -4,35 +4,55 @@ Module contains tools for collecting data from various remote sources
 
 # flake8: noqa
 
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any
 import warnings
 
-from pandas_datareader.bankofcanada import BankOfCanadaReader
 from pandas_datareader.compat import deprecate_kwarg
-from pandas_datareader.econdb import EcondbReader
-from pandas_datareader.eurostat import EurostatReader
 from pandas_datareader.exceptions import DEP_ERROR_MSG, ImmediateDeprecationError
-from pandas_datareader.famafrench import FamaFrenchReader
-from pandas_datareader.fred import FredReader
-from pandas_datareader.oecd import OECDReader
+from pandas_datareader.registry import get_reader
 
 __all__ = [
     "get_data_econdb",
     "get_data_famafrench",
     "get_data_fred",
     "DataReader",
+    "BatchResult",
+    "read_batch",
+    "update",
 ]
 
+# reader classes formerly imported here, now loaded on first access
+_READER_MODULES = {
+    "BankOfCanadaReader": "pandas_datareader.bankofcanada",
+    "EcondbReader": "pandas_datareader.econdb",
+    "EurostatReader": "pandas_datareader.eurostat",
+    "FamaFrenchReader": "pandas_datareader.famafrench",
+    "FredReader": "pandas_datareader.fred",
+    "OECDReader": "pandas_datareader.oecd",
+    "WorldBankReader": "pandas_datareader.wb",
+}
+
+
+def __getattr__(name):
+    if name in _READER_MODULES:
+        return getattr(import_module(_READER_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_data_fred(*args, **kwargs):
-    return FredReader(*args, **kwargs).read()
+    return get_reader("fred")(*args, **kwargs).read()
 
 
 def get_data_famafrench(*args, **kwargs):
-    return FamaFrenchReader(*args, **kwargs).read()
+    return get_reader("famafrench")(*args, **kwargs).read()
 
 
 def get_data_econdb(*args, **kwargs):
-    return EcondbReader(*args, **kwargs).read()
+    return get_reader("econdb")(*args, **kwargs).read()
 
 
 @deprecate_kwarg("access_key", "api_key")
@@ -45,6 +65,11 @@ def DataReader(
     pause=0.1,
     session=None,
     api_key=None,
+    store=None,
+    dtype_backend=None,
+    output=None,
+    deadline=None,
+    offline=None,
 ):
     """
     Imports data from a number of online sources.
@@ -58,7 +83,8 @@ def DataReader(
         the name of the dataset. Some data sources (fred) will
         accept a list of names.
     data_source: {str, None}
-        the data source ("fred", "famafrench", "oecd", "eurostat", "econdb")
+        the data source ("bankofcanada", "fred", "famafrench", "oecd",
+        "eurostat", "econdb", "wb")
     start : string, int, date, datetime, Timestamp
         left boundary for range (defaults to 1/1/2010)
     end : string, int, date, datetime, Timestamp
@@ -72,6 +98,24 @@ def DataReader(
         requests.sessions.Session instance to be used
     api_key : (str, None)
         Optional parameter to specify an API key for certain data sources.
+    store : Store, optional
+        :class:`pandas_datareader.store.Store` to serve the data from. Only
+        the part of the range missing from the store is downloaded.
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        Dtypes of the result. 'pyarrow' returns Arrow-backed data with
+        nullable float values and dictionary-encoded string labels.
+    output : {None, 'wide', 'long'}
+        Layout of multi-series results of the fred and wb sources. 'long'
+        returns one row per observation with ``series_id`` and ``value``
+        columns instead of a column per series. Not supported with ``store``.
+    deadline : float, optional
+        Total time budget in seconds, across retries and sub-requests. Raises
+        :class:`~pandas_datareader.retry.DeadlineExceededError` when spent.
+    offline : bool, optional
+        Answer only from the response cache, or from ``store``, and raise
+        :class:`~pandas_datareader.offline.OfflineError` on a miss. None
+        follows the ``PANDAS_DATAREADER_OFFLINE`` environment variable and
+        :func:`~pandas_datareader.offline.set_offline`.
 
     Examples
     ----------
@@ -84,80 +128,257 @@ def DataReader(
     ff = DataReader("6_Portfolios_2x3", "famafrench")
     ff = DataReader("F-F_ST_Reversal_Factor", "famafrench")
     """
-    expected_source = [
-        "bankofcanada",
-        "fred",
-        "famafrench",
-        "oecd",
-        "eurostat",
-        "econdb",
-    ]
-
-    if data_source not in expected_source:
-        msg = "data_source=%r is not implemented" % data_source
-        raise NotImplementedError(msg)
-
-    if data_source == "bankofcanada":
-        return BankOfCanadaReader(
-            symbols=name,
+    if store is not None:
+        if output not in (None, "wide"):
+            raise ValueError("store only holds wide output")
+        return store.get(
+            name,
+            data_source,
             start=start,
             end=end,
             retry_count=retry_count,
             pause=pause,
             session=session,
-        ).read()
+            api_key=api_key,
+            dtype_backend=dtype_backend,
+            deadline=deadline,
+            offline=offline,
+        )
+    return _make_reader(
+        name,
+        data_source,
+        start=start,
+        end=end,
+        retry_count=retry_count,
+        pause=pause,
+        session=session,
+        api_key=api_key,
+        dtype_backend=dtype_backend,
+        output=output,
+        deadline=deadline,
+        offline=offline,
+    ).read()
 
-    if data_source == "fred":
-        return FredReader(
-            symbols=name,
-            start=start,
-            end=end,
-            retry_count=retry_count,
-            pause=pause,
-            session=session,
-        ).read()
 
-    if data_source == "famafrench":
-        return FamaFrenchReader(
-            symbols=name,
-            start=start,
-            end=end,
-            retry_count=retry_count,
-            pause=pause,
-            session=session,
-        ).read()
+# reader options only passed when set, so registered readers need not accept them
+_OPTIONAL_KWARGS = ("dtype_backend", "output", "deadline", "offline")
 
-    if data_source == "oecd":
-        return OECDReader(
-            symbols=name,
-            start=start,
-            end=end,
-            retry_count=retry_count,
-            pause=pause,
-            session=session,
-        ).read()
-    if data_source == "eurostat":
-        return EurostatReader(
-            symbols=name,
-            start=start,
-            end=end,
-            retry_count=retry_count,
-            pause=pause,
-            session=session,
-        ).read()
+
+def _make_reader(name, data_source, api_key=None, **kwargs):
+    reader = get_reader(data_source)
     if data_source == "econdb":
-        return EcondbReader(
-            symbols=name,
-            start=start,
-            end=end,
-            retry_count=retry_count,
-            pause=pause,
-            session=session,
-            api_key=api_key,
-        ).read()
+        kwargs["api_key"] = api_key
+    for option in _OPTIONAL_KWARGS:
+        if kwargs.get(option, False) is None:
+            del kwargs[option]
+    return reader(symbols=name, **kwargs)
+
+
+DEFAULT_SOURCE_CONCURRENCY = 4
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of :func:`read_batch`
+
+    Attributes
+    ----------
+    results : dict
+        Data read for each successful request, in request order.
+    errors : dict
+        Exception raised by each failed request, in request order.
+    sources : dict
+        Data source of every request.
+    """
+
+    results: dict[Any, Any] = field(default_factory=dict)
+    errors: dict[Any, BaseException] = field(default_factory=dict)
+    sources: dict[Any, str] = field(default_factory=dict)
+
+    @property
+    def ok(self):
+        """True if every request succeeded"""
+        return not self.errors
+
+    def error_report(self):
+        """DataFrame with the source, error type and message of failed requests"""
+        from pandas import DataFrame
+
+        rows = [
+            (key, self.sources.get(key), type(exc).__name__, str(exc))
+            for key, exc in self.errors.items()
+        ]
+        return DataFrame(rows, columns=["key", "data_source", "error", "message"])
+
+
+def _batch_spec(spec):
+    if isinstance(spec, dict):
+        options = dict(spec)
+        name = options.pop("name")
+        data_source = options.pop("data_source")
+        key = options.pop("key", None)
+    else:
+        name, data_source, *rest = spec
+        options = dict(rest[0]) if rest else {}
+        key = None
+    if key is None:
+        key = (data_source, tuple(name) if isinstance(name, list) else name)
+    return key, name, data_source, options
+
+
+def _read_one(name, data_source, kwargs):
+    reader = _make_reader(name, data_source, **kwargs)
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+
+
+def read_batch(requests, max_workers=None, source_concurrency=None, **kwargs):
+    """
+    Read many datasets from several sources concurrently.
+
+    Requests are run on a single thread pool. Each source has its own limit
+    on the number of requests in flight, so a slow or strict provider does
+    not hold up the others. A failed request does not stop the batch; its
+    exception is collected in the result instead.
+
+    Parameters
+    ----------
+    requests : list
+        Request specs. Each is either a ``(name, data_source)`` tuple, a
+        ``(name, data_source, options)`` tuple, or a dict with ``name``,
+        ``data_source``, an optional ``key`` and further options. Options are
+        passed to the reader and override ``kwargs``.
+    max_workers : int, optional
+        Size of the shared thread pool. Defaults to the
+        :class:`~concurrent.futures.ThreadPoolExecutor` default.
+    source_concurrency : dict, optional
+        Maximum number of requests in flight per data source, e.g.
+        ``{"fred": 8, "oecd": 1}``. Sources not listed use
+        ``DEFAULT_SOURCE_CONCURRENCY``.
+    kwargs
+        Options passed to every reader, e.g. ``start``, ``end``,
+        ``retry_count``, ``pause``, ``session`` or ``api_key``.
+
+    Returns
+    -------
+    BatchResult
+        Results and errors keyed by the request ``key``, which defaults to
+        ``(data_source, name)``.
+
+    Examples
+    --------
+    >>> batch = read_batch(
+    ...     [("GDP", "fred"), ("UNRATE", "fred"), ("NY.GDP.PCAP.CD", "wb")],
+    ...     start="2010-01-01",
+    ...     source_concurrency={"fred": 8},
+    ... )  # doctest: +SKIP
+    >>> batch.results[("fred", "GDP")]  # doctest: +SKIP
+    """
+    specs = [_batch_spec(spec) for spec in requests]
+    keys = [key for key, *_ in specs]
+    duplicated = [key for key, count in Counter(keys).items() if count > 1]
+    if duplicated:
+        raise ValueError(f"Duplicate batch request keys: {duplicated}")
+    limits = dict(source_concurrency or {})
+    if any(limit < 1 for limit in limits.values()):
+        raise ValueError("'source_concurrency' limits must be at least 1")
+
+    batch = BatchResult(sources={key: source for key, _, source, _ in specs})
+    pending = {}
+    for spec in specs:
+        pending.setdefault(spec[2], deque()).append(spec)
+    running = {}
+    active = Counter()
+
+    def submit_ready(executor):
+        for data_source, queue in pending.items():
+            limit = limits.get(data_source, DEFAULT_SOURCE_CONCURRENCY)
+            while queue and active[data_source] < limit:
+                key, name, _, options = queue.popleft()
+                future = executor.submit(
+                    _read_one, name, data_source, {**kwargs, **options}
+                )
+                running[future] = key, data_source
+                active[data_source] += 1
+
+    results, errors = {}, {}
+    with ThreadPoolExecutor(max_workers) as executor:
+        submit_ready(executor)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, data_source = running.pop(future)
+                active[data_source] -= 1
+                try:
+                    results[key] = future.result()
+                except Exception as exc:
+                    errors[key] = exc
+            submit_ready(executor)
+
+    batch.results = {key: results[key] for key in keys if key in results}
+    batch.errors = {key: errors[key] for key in keys if key in errors}
+    return batch
+
+
+def update(existing, name, data_source, start=None, end=None, **kwargs):
+    """
+    Extend a stored DataFrame with the observations published since.
+
+    Only the period from the last observation held in ``existing`` onwards is
+    requested from the provider, so refresh traffic is proportional to the
+    new data rather than to the stored history.
+
+    Parameters
+    ----------
+    existing : DataFrame
+        Data previously read with ``DataReader(name, data_source)``.
+    name : str or list of strs
+        The name of the dataset, as passed to ``DataReader``.
+    data_source : str
+        The data source, as passed to ``DataReader``.
+    start : string, int, date, datetime, Timestamp, optional
+        Start used when ``existing`` is empty or has a column without any
+        observation, in which case the full range is read.
+    end : string, int, date, datetime, Timestamp, optional
+        Right boundary of the update, defaults to today.
+    kwargs
+        Other arguments of the reader, e.g. ``retry_count`` or ``api_key``.
+
+    Returns
+    -------
+    DataFrame
+        ``existing`` with new and revised observations merged in.
+
+    Notes
+    -----
+    The request starts at the earliest of the last observations of the
+    columns, so every column is brought up to date. The last stored
+    observations are read again, which picks up revisions. Series that are
+    not yet columns of ``existing`` are only read from that date on.
+
+    Examples
+    --------
+    >>> gdp = DataReader("GDP", "fred", start="1990-01-01")  # doctest: +SKIP
+    >>> gdp = DataReader.update(gdp, "GDP", "fred")  # doctest: +SKIP
+    """
+    from pandas_datareader._utils import _last_observation, _merge_tail
+
+    since = _last_observation(existing)
+    reader = _make_reader(
+        name, data_source, start=start if since is None else since, end=end, **kwargs
+    )
+    try:
+        new = reader.read()
+    finally:
+        reader.close()
+    return _merge_tail(existing, new)
+
 
-    msg = "data_source=%r is not implemented" % data_source
-    raise NotImplementedError(msg)
+DataReader.batch = read_batch
+DataReader.update = update
 
 
 def Options(symbol, data_source=None, session=None):
@@ -1,7 +1,9 @@
 import os
+from urllib.parse import parse_qs
 
 import pandas as pd
 
+from pandas_datareader._utils import _outer_join
 from pandas_datareader.base import _BaseReader
 
 
@@ -36,6 +38,8 @@ class EcondbReader(_BaseReader):
         single value given for symbol, represents the pause between retries.
     session : Session, default None
         requests.sessions.Session instance to be used
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        Dtypes of the result, see :class:`~pandas_datareader.base._BaseReader`.
     """
 
     _URL = "https://www.econdb.com/api/series/"
@@ -52,6 +56,9 @@ class EcondbReader(_BaseReader):
         session=None,
         freq=None,
         api_key=None,
+        dtype_backend=None,
+        deadline=None,
+        offline=None,
     ):
         super().__init__(
             symbols=symbols,
@@ -61,6 +68,9 @@ class EcondbReader(_BaseReader):
             pause=pause,
             session=session,
             freq=freq,
+            dtype_backend=dtype_backend,
+            deadline=deadline,
+            offline=offline,
         )
         params = dict(s.split("=") for s in self.symbols.split("&"))
         self.api_key = params.get("token") or api_key or os.getenv("ECONDB_API_KEY")
@@ -84,18 +94,43 @@ class EcondbReader(_BaseReader):
                     "variable, or a token=... query parameter."
                 )
             query = f"{query}&token={self.api_key}"
+        # push the date range to the provider instead of truncating afterwards
+        given = parse_qs(query)
+        if "from" not in given:
+            query = f"{query}&from={self.start:%Y-%m-%d}"
+        if "to" not in given:
+            query = f"{query}&to={self.end:%Y-%m-%d}"
 
         return f"{self._URL}?{query}&format=json&page_size=500&expand=both"
 
     def read(self):
         """read one data from specified URL"""
-        payload = self.session.get(self.url).json()
+        try:
+            payload = self._get_response(self.url).json()
+        finally:
+            self._deadline = None
+        return self._convert(self._parse(self.url, self._parse_payload, payload))
+
+    def _output_error(self, out):
+        """Raise the ``detail`` message of an Econdb error and skip retries"""
+        try:
+            payload = out.json()
+        except ValueError:
+            payload = None
+        if isinstance(payload, dict) and "detail" in payload:
+            raise ValueError(str(payload["detail"]))
+        return True
+
+    async def _aread(self):
+        payload = (await self._aget_response(self.url)).json()
+        return self._parse(self.url, self._parse_payload, payload)
+
+    def _parse_payload(self, payload):
         if "results" not in payload:
             if "detail" in payload:
                 raise ValueError(str(payload["detail"]))
             raise ValueError("Unexpected Econdb response format.")
         results = payload["results"]
-        df = pd.DataFrame({"dates": []}).set_index("dates")
 
         if self._show == "labels":
 
@@ -108,6 +143,7 @@ class EcondbReader(_BaseReader):
                 return x[: x.find(":")]
 
         unique_keys = {k for s in results for k in s["additional_metadata"]}
+        frames = []
         for entry in results:
             series = pd.DataFrame(entry["data"])[["dates", "values"]].set_index("dates")
             head = entry["additional_metadata"]
@@ -121,11 +157,12 @@ class EcondbReader(_BaseReader):
                 )
             else:
                 series.rename(columns={"values": entry["ticker"]}, inplace=True)
+            frames.append(series)
 
-            if not df.empty:
-                df = df.merge(series, how="outer", left_index=True, right_index=True)
-            else:
-                df = series
+        if frames:
+            df = _outer_join(frames)
+        else:
+            df = pd.DataFrame({"dates": []}).set_index("dates")
         if df.shape[0] > 0:
             df.index = pd.to_datetime(df.index, errors="ignore")
         df.index.name = "TIME_PERIOD"
@@ -1,11 +1,13 @@
+import asyncio
 import math
 import re
 
 import pandas as pd
 import requests
 
+from pandas_datareader._utils import RemoteDataError
 from pandas_datareader.base import _BaseReader
-from pandas_datareader.io.sdmx import _read_sdmx_dsd, read_sdmx
+from pandas_datareader.io.sdmx import _aread_sdmx, _read_sdmx_dsd, read_sdmx
 
 
 class EurostatReader(_BaseReader):
@@ -57,16 +59,86 @@ class EurostatReader(_BaseReader):
             data = self._read_statistics_payload(payload)
             return self._format_columns(data)
 
-        resp_dsd = self._get_response(self.dsd_url)
-        dsd = _read_sdmx_dsd(resp_dsd.content)
+        resp_dsd = self._get_response(self.dsd_url, stream=True)
+        with self._response_stream(resp_dsd) as stream:
+            dsd = _read_sdmx_dsd(stream)
 
         try:
-            resp = self._get_response(url)
-            data = read_sdmx(resp.content, dsd=dsd)
+            resp = self._get_response(url, stream=True)
+            with self._response_stream(resp) as stream:
+                data = self._parse(
+                    url,
+                    read_sdmx,
+                    stream,
+                    dsd=dsd,
+                    dtype_backend=self.dtype_backend,
+                    deadline=self._active_deadline(),
+                    offline=self._is_offline(),
+                    fetch=self._read_zipped,
+                )
         except requests.exceptions.RequestException:
             payload = self._get_response(self.statistics_url).json()
             data = self._read_statistics_payload(payload)
 
+        return self._finalize(data)
+
+    async def _aread_one_data(self, url, params):
+        if self.symbols in self._STATISTICS_PREFERRED:
+            payload = await self._aread_statistics_response()
+            data = self._read_statistics_payload(payload)
+            return self._format_columns(data)
+
+        # the DSD and the data do not depend on each other
+        resp_dsd, resp = await asyncio.gather(
+            self._aget_response(self.dsd_url),
+            self._aget_response(url),
+            return_exceptions=True,
+        )
+        if isinstance(resp_dsd, BaseException):
+            raise resp_dsd
+        dsd = _read_sdmx_dsd(resp_dsd.content)
+
+        try:
+            if isinstance(resp, BaseException):
+                raise resp
+            data = await self._aparse(
+                url,
+                _aread_sdmx,
+                resp.content,
+                self._aread_zipped,
+                dsd=dsd,
+                dtype_backend=self.dtype_backend,
+                deadline=self._active_deadline(),
+                offline=self._is_offline(),
+            )
+        except RemoteDataError as exc:
+            # no response arrived; the blocking path sees a RequestException
+            if exc.status_code is not None:
+                raise
+            payload = (await self._aget_response(self.statistics_url)).json()
+            data = self._read_statistics_payload(payload)
+
+        return self._finalize(data)
+
+    def _read_zipped(self, url):
+        """Zip file of a large request, or None while Eurostat prepares it"""
+        try:
+            return self._get_response(url).content
+        except RemoteDataError as exc:
+            if exc.status_code is None:
+                raise
+            return None
+
+    async def _aread_zipped(self, url):
+        """Asynchronous :meth:`_read_zipped`"""
+        try:
+            return (await self._aget_response(url)).content
+        except RemoteDataError as exc:
+            if exc.status_code is None:
+                raise
+            return None
+
+    def _finalize(self, data):
         if self._should_parse_datetime_index(data.index):
             data.index = pd.to_datetime(data.index)
             data = data.sort_index()
@@ -88,6 +160,17 @@ class EurostatReader(_BaseReader):
                 continue
         raise last_error
 
+    async def _aread_statistics_response(self):
+        last_error = None
+        for _ in range(self.retry_count + 1):
+            try:
+                return (await self._aget_response(self.statistics_url)).json()
+            except ValueError as exc:
+                # malformed JSON body
+                last_error = exc
+                continue
+        raise last_error
+
     @staticmethod
     def _format_columns(data):
         if not isinstance(data.columns, pd.MultiIndex):
@@ -1,5 +1,6 @@
 import datetime as dt
 import re
+import shutil
 import tempfile
 from zipfile import ZipFile
 
@@ -52,10 +53,17 @@ class FamaFrenchReader(_BaseReader):
         return "".join([_URL, _URL_PREFIX, self.symbols, _URL_SUFFIX])
 
     def _read_zipfile(self, url):
-        raw = self._get_response(url).content
+        response = self._get_response(url, stream=True)
+        with self._response_stream(response) as stream:
+            return self._unzip(stream)
 
+    @staticmethod
+    def _unzip(raw):
         with tempfile.TemporaryFile() as tmpf:
-            tmpf.write(raw)
+            if isinstance(raw, bytes):
+                tmpf.write(raw)
+            else:
+                shutil.copyfileobj(raw, tmpf)
             with ZipFile(tmpf, "r") as zf:
                 try:
                     data = zf.open(zf.namelist()[0]).read().decode("utf-8", "ignore")
@@ -76,6 +84,13 @@ class FamaFrenchReader(_BaseReader):
         return super().read()
 
     def _read_one_data(self, url, params):
+        return self._parse(url, self._parse_datasets, self._read_zipfile(url))
+
+    async def _aread_one_data(self, url, params):
+        response = await self._aget_response(url)
+        return self._parse(url, self._parse_datasets, self._unzip(response.content))
+
+    def _parse_datasets(self, data):
         params = {
             "index_col": 0,
         }
@@ -100,7 +115,6 @@ class FamaFrenchReader(_BaseReader):
                 params["skiprows"] = 3
 
         doc_chunks, tables = [], []
-        data = self._read_zipfile(url)
         data = re.sub(r"\r(?!\n)", "\r\n", data)  # turn lone CR into CRLF
 
         for chunk in data.split(2 * "\r\n"):
@@ -161,7 +175,10 @@ class FamaFrenchReader(_BaseReader):
                 "get_datasets_famafrench function"
             ) from exc
 
-        response = self.session.get(_URL + "data_library.html")
+        url = _URL + "data_library.html"
+        if self._is_offline():
+            raise self._offline_error(url)
+        response = self.session.get(url)
         root = document_fromstring(response.content)
 
         datasets = [
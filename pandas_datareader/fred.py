@@ -1,14 +1,160 @@
-from pandas import concat, read_csv
+import asyncio
+from urllib.parse import urlencode
 
+from pandas import read_csv
+
+from pandas_datareader._utils import (
+    RemoteDataError,
+    _outer_join,
+    _to_long,
+    _validate_output,
+)
 from pandas_datareader.base import _BaseReader
 from pandas_datareader.compat import is_list_like
 
+_WEEKDAYS = {
+    "MON": "Monday",
+    "TUE": "Tuesday",
+    "WED": "Wednesday",
+    "THU": "Thursday",
+    "FRI": "Friday",
+    "SAT": "Saturday",
+    "SUN": "Sunday",
+}
+
+# pandas frequency aliases and their fredgraph ``fq`` names
+FREQUENCIES = {
+    "D": "Daily",
+    "W": "Weekly, Ending Sunday",
+    **{f"W-{day}": f"Weekly, Ending {name}" for day, name in _WEEKDAYS.items()},
+    "M": "Monthly",
+    "MS": "Monthly",
+    "ME": "Monthly",
+    "Q": "Quarterly",
+    "QS": "Quarterly",
+    "QE": "Quarterly",
+    "6MS": "Semiannual",
+    "A": "Annual",
+    "AS": "Annual",
+    "Y": "Annual",
+    "YS": "Annual",
+    "YE": "Annual",
+}
+
+AGGREGATIONS = ("avg", "sum", "eop")
+
+
+def _fred_frequency(freq):
+    """fredgraph name of a pandas frequency alias or fredgraph frequency name"""
+    if freq is None:
+        return None
+    key = str(freq).upper()
+    if key in FREQUENCIES:
+        return FREQUENCIES[key]
+    names = {name.lower(): name for name in FREQUENCIES.values()}
+    try:
+        return names[str(freq).lower()]
+    except KeyError:
+        raise ValueError(
+            f"freq {freq!r} is not supported by FRED, use one of "
+            f"{sorted(FREQUENCIES)} or a fredgraph frequency name"
+        ) from None
+
+
+def _bad_id(exc):
+    """Return True if a batch failed because one of its ids is not a series
+
+    FRED answers an unknown id with a 4xx status or a payload lacking its
+    column. Server errors, deadlines, open circuits and offline mode would
+    fail the same way for each id, so they are not retried one by one.
+    """
+    if isinstance(exc, RemoteDataError):
+        return exc.status_code is not None and 400 <= exc.status_code < 500
+    return True
+
 
 class FredReader(_BaseReader):
     """
     Get data for the given name from the St. Louis FED (FRED).
+
+    Parameters
+    ----------
+    output : {'wide', 'long'}, default 'wide'
+        'wide' outer-joins the series into one column each. 'long' returns
+        ``DATE``, ``series_id`` and ``value`` columns with a row per
+        observation, which avoids the mostly missing cells of a wide frame
+        of series with different frequencies or ranges.
+    batch_size : int, default 50
+        Number of series requested together in one fredgraph request. A batch
+        that fails, e.g. because it holds an invalid id, is read again one
+        series at a time. 1 requests every series separately.
+    freq : str, optional
+        Frequency the series are aggregated to by FRED before download, as a
+        pandas alias such as ``"MS"``, ``"QS"`` or ``"W-FRI"`` or a fredgraph
+        name such as ``"Monthly"``. Only lower frequencies than a series' own
+        are supported. None returns the series at their native frequency.
+    aggregation : {'avg', 'sum', 'eop'}, default 'avg'
+        How observations are aggregated to ``freq``: the average, the sum or
+        the end of period value.
+    engine : {'c', 'pyarrow'}, default 'c'
+        ``read_csv`` engine parsing the CSV payloads. 'pyarrow' parses with
+        multiple threads and requires pyarrow.
+
+    See :class:`~pandas_datareader.base._BaseReader` for the other parameters.
     """
 
+    def __init__(
+        self,
+        symbols,
+        start=None,
+        end=None,
+        retry_count=3,
+        pause=0.1,
+        timeout=30,
+        session=None,
+        freq=None,
+        dtype_backend=None,
+        output="wide",
+        deadline=None,
+        offline=None,
+        batch_size=50,
+        aggregation="avg",
+        engine="c",
+    ):
+        super().__init__(
+            symbols,
+            start=start,
+            end=end,
+            retry_count=retry_count,
+            pause=pause,
+            timeout=timeout,
+            session=session,
+            freq=freq,
+            dtype_backend=dtype_backend,
+            deadline=deadline,
+            offline=offline,
+        )
+        self.output = _validate_output(output)
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("'batch_size' must be a positive integer")
+        self.batch_size = batch_size
+        self._frequency = _fred_frequency(freq)
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(
+                f"aggregation must be one of {AGGREGATIONS}, got {aggregation!r}"
+            )
+        self.aggregation = aggregation
+        if engine not in ("c", "pyarrow"):
+            raise ValueError(f"engine must be 'c' or 'pyarrow', got {engine!r}")
+        if engine == "pyarrow":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as exc:
+                raise ImportError(
+                    "Please install pyarrow if you want to use engine='pyarrow'"
+                ) from exc
+        self.engine = engine
+
     @property
     def url(self):
         """API URL"""
@@ -21,51 +167,115 @@ class FredReader(_BaseReader):
         -------
         data : DataFrame
             If multiple names are passed for "series" then the index of the
-            DataFrame is the outer join of the indices of each series.
+            DataFrame is the outer join of the indices of each series. With
+            ``output="long"`` one row per observation instead.
         """
         try:
-            return self._read()
+            return self._convert(self._read())
         finally:
             self.close()
 
-    def _read(self):
+    def _names(self):
         if not is_list_like(self.symbols):
-            names = [self.symbols]
-        else:
-            names = self.symbols
-
-        urls = [f"{self.url}?id={n}" for n in names]
-
-        def fetch_data(url, name):
-            """Utility to fetch data"""
-            resp = self._read_url_as_StringIO(url)
-            data = read_csv(
-                resp,
-                index_col=0,
-                parse_dates=True,
-                header=None,
-                skiprows=1,
-                names=["DATE", name],
-                na_values=".",
-            )
-            try:
-                return data.truncate(self.start, self.end)
-            except KeyError as exc:  # pragma: no cover
-                if data.iloc[3].name[7:12] == "Error":
-                    raise OSError(
-                        "Failed to get the data. Check that "
-                        "{!r} is a valid FRED series.".format(name)
-                    ) from exc
-                raise
+            return [self.symbols]
+        return self.symbols
+
+    def _batches(self):
+        names = self._names()
+        return [
+            names[i : i + self.batch_size]
+            for i in range(0, len(names), self.batch_size)
+        ]
+
+    def _batch_url(self, names):
+        # fredgraph takes one observation window per id; only the requested
+        # rows are sent, the truncate in _parse_series is a safety net
+        start = ",".join([self.start.strftime("%Y-%m-%d")] * len(names))
+        end = ",".join([self.end.strftime("%Y-%m-%d")] * len(names))
+        url = f"{self.url}?id={','.join(names)}&cosd={start}&coed={end}"
+        if self._frequency is not None:
+            # FRED aggregates to fq with method fam before sending the rows;
+            # like the window, both are given once per id
+            params = {
+                "fq": ",".join([self._frequency] * len(names)),
+                "fam": ",".join([self.aggregation] * len(names)),
+            }
+            url = f"{url}&{urlencode(params)}"
+        return url
+
+    def _read(self):
+        return self._combine([self._read_batch(b) for b in self._batches()])
 
+    def _read_symbol(self, name):
+        return self._combine([self._read_series(name)])
+
+    def _read_batch(self, names):
+        """Read several series with one request, or one by one if it fails"""
+        if len(names) == 1:
+            return self._read_series(names[0])
         try:
-            data = [fetch_data(url, n) for url, n in zip(urls, names, strict=True)]
-        except TypeError:
-            # Python 3.9 only
-            data = [fetch_data(url, n) for url, n in zip(urls, names)]  # noqa: B905
-        df = concat(
-            data,
-            axis=1,
-            join="outer",
+            return self._read_series(names)
+        except (RemoteDataError, ValueError) as exc:
+            if not _bad_id(exc):
+                raise
+            return _outer_join([self._read_series(n) for n in names])
+
+    def _read_series(self, names):
+        url = self._batch_url(names if is_list_like(names) else [names])
+        with self._read_url_as_stream(url) as resp:
+            return self._parse(url, self._parse_series, resp, names)
+
+    async def _aread(self):
+        data = await asyncio.gather(*(self._aread_batch(b) for b in self._batches()))
+        return self._combine(list(data))
+
+    async def _aread_batch(self, names):
+        if len(names) > 1:
+            try:
+                return await self._aread_series(names)
+            except (RemoteDataError, ValueError) as exc:
+                if not _bad_id(exc):
+                    raise
+        series = await asyncio.gather(*(self._aread_series(n) for n in names))
+        return _outer_join(list(series))
+
+    async def _aread_series(self, names):
+        url = self._batch_url(names if is_list_like(names) else [names])
+        resp = await self._aread_url_as_stream(url)
+        return self._parse(url, self._parse_series, resp, names)
+
+    def _parse_series(self, resp, names):
+        """Parse a fredgraph CSV payload of one or more series
+
+        The header is replaced by ``names``, so a payload missing a requested
+        series fails to parse instead of mislabelling the columns.
+        """
+        names = list(names) if is_list_like(names) else [names]
+        data = read_csv(
+            resp,
+            header=0,
+            names=["DATE", *names],
+            index_col=0,
+            parse_dates=[0],
+            date_format="%Y-%m-%d",
+            dtype=dict.fromkeys(names, "float64"),
+            na_values=["."],
+            engine=self.engine,
         )
-        return df
+        try:
+            return data.truncate(self.start, self.end)
+        except KeyError as exc:  # pragma: no cover
+            if data.iloc[3].name[7:12] == "Error":
+                raise OSError(
+                    "Failed to get the data. Check that "
+                    "{!r} is a valid FRED series.".format(names)
+                ) from exc
+            raise
+
+    def _combine(self, data):
+        if self.output == "long":
+            # batches hold several series, _to_long takes one per frame
+            return _to_long(
+                [frame.iloc[:, [i]] for frame in data for i in range(frame.shape[1])]
+            )
+        return _outer_join(data)
@@ -0,0 +1,322 @@
+"""
+Hedged requests for hosts with a slow tail.
+
+When a :class:`HedgePolicy` is set for a host, a request to it that has not
+been answered within a percentile of the host's recent latencies is sent a
+second time and whichever response arrives first is used. Hedges are capped
+per host, both in number in flight and as a share of all requests, so a slow
+provider does not receive twice the load. Hedge counts and the share of
+hedges that won are available from :func:`hedge_stats`.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+import math
+import threading
+import time
+
+from pandas_datareader import ratelimit
+
+__all__ = [
+    "HedgePolicy",
+    "HedgeStats",
+    "asend",
+    "clear_hedge_policies",
+    "get_hedge_policy",
+    "hedge_stats",
+    "send",
+    "set_hedge_policy",
+]
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0
+    wins: int = 0
+
+    @property
+    def win_rate(self):
+        """Share of hedges whose response arrived first, NaN before any hedge"""
+        return self.wins / self.hedged if self.hedged else math.nan
+
+
+class HedgePolicy:
+    """
+    When to send a duplicate of a slow request
+
+    Parameters
+    ----------
+    percentile : float, default 95
+        A request is hedged once it has been in flight for longer than this
+        percentile of the latencies of the last ``window`` successful requests.
+    window : int, default 200
+        Number of recent latencies the percentile is computed from.
+    min_samples : int, default 20
+        Latencies needed before the percentile is trusted. Until then
+        ``initial_delay`` is used.
+    initial_delay : float, optional
+        Hedge delay in seconds while fewer than ``min_samples`` latencies are
+        known. None, the default, does not hedge until then.
+    min_delay : float, default 0.05
+        Lower bound of the hedge delay in seconds.
+    max_in_flight : int, default 1
+        Maximum number of hedges in flight at once.
+    max_ratio : float, default 0.1
+        Maximum number of hedges as a share of the requests sent so far.
+    """
+
+    def __init__(
+        self,
+        percentile=95,
+        window=200,
+        min_samples=20,
+        initial_delay=None,
+        min_delay=0.05,
+        max_in_flight=1,
+        max_ratio=0.1,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("'percentile' must be between 0 and 100")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("'window' must be at least 'min_samples' and positive")
+        if max_in_flight < 1:
+            raise ValueError("'max_in_flight' must be at least 1")
+        if not 0 < max_ratio <= 1:
+            raise ValueError("'max_ratio' must be in (0, 1]")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_in_flight = max_in_flight
+        self.max_ratio = max_ratio
+        self._latencies = deque(maxlen=window)
+        self._in_flight = 0
+        self._stats = HedgeStats()
+        self._lock = threading.Lock()
+
+    def threshold(self):
+        """Seconds after which a request is hedged, or None to not hedge"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            rank = math.ceil(self.percentile / 100 * len(latencies))
+            delay = latencies[rank - 1]
+        if delay is None:
+            return None
+        return max(delay, self.min_delay)
+
+    def record(self, elapsed):
+        """Add the latency of a successful request"""
+        with self._lock:
+            self._latencies.append(elapsed)
+
+    def stats(self):
+        """Copy of the request, hedge and win counts"""
+        with self._lock:
+            return HedgeStats(**vars(self._stats))
+
+    def _start(self):
+        with self._lock:
+            self._stats.requests += 1
+
+    def _acquire(self):
+        """Reserve a hedge, returning False when a cap is reached"""
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                return False
+            if self._stats.hedged + 1 > self.max_ratio * self._stats.requests:
+                return False
+            self._in_flight += 1
+            self._stats.hedged += 1
+            return True
+
+    def _release(self, _future=None):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _won(self):
+        with self._lock:
+            self._stats.wins += 1
+
+    def send(self, url, func):
+        """Call ``func()``, hedging it with a second call when it is slow"""
+        self._start()
+        delay = self.threshold()
+        started = time.perf_counter()
+        if delay is None:
+            response = func()
+            self.record(time.perf_counter() - started)
+            return response
+
+        def record(future):
+            if future.exception() is None:
+                self.record(time.perf_counter() - started)
+
+        # set once the primary succeeds, so a hedge still waiting on the rate
+        # limit does not send a request nobody will read
+        answered = threading.Event()
+
+        def settle(future):
+            if future.exception() is None:
+                answered.set()
+
+        primary = _spawn(func)
+        primary.add_done_callback(record)
+        primary.add_done_callback(settle)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._acquire():
+            return primary.result()
+
+        def hedged():
+            ratelimit.acquire(url)
+            if answered.is_set():
+                return None
+            return func()
+
+        hedge = _spawn(hedged)
+        hedge.add_done_callback(self._release)
+        done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        # prefer the primary when both finished, and a success over a failure
+        winner = primary if primary in done else hedge
+        if winner.exception() is not None:
+            winner = hedge if winner is primary else primary
+        loser = hedge if winner is primary else primary
+        result = winner.result()
+        if winner is hedge:
+            self._won()
+        loser.add_done_callback(_discard)
+        return result
+
+    async def asend(self, url, func):
+        """Await ``func()``, hedging it with a second call when it is slow"""
+        self._start()
+        delay = self.threshold()
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(func())
+
+        def record(task):
+            # a cancelled primary was slower than the hedge that beat it
+            if task.cancelled() or task.exception() is None:
+                self.record(time.perf_counter() - started)
+
+        primary.add_done_callback(record)
+        if delay is None:
+            return await primary
+        done, _ = await asyncio.wait([primary], timeout=delay)
+        if done or not self._acquire():
+            return await primary
+
+        async def hedged():
+            await ratelimit.aacquire(url)
+            return await func()
+
+        hedge = asyncio.ensure_future(hedged())
+        hedge.add_done_callback(self._release)
+        done, _ = await asyncio.wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner = primary if primary in done else hedge
+        if winner.exception() is not None:
+            winner = hedge if winner is primary else primary
+        loser = hedge if winner is primary else primary
+        try:
+            result = await winner
+        finally:
+            loser.cancel()
+        if winner is hedge:
+            self._won()
+        return result
+
+
+def _spawn(func):
+    """Run ``func`` in a daemon thread and return a Future of its result"""
+    future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            result = func()
+        except Exception as exc:  # noqa: BLE001 - handed to the waiting caller
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name="pdr-hedge", daemon=True).start()
+    return future
+
+
+def _discard(future):
+    """Close the response of a request that lost the race"""
+    if future.exception() is None and future.result() is not None:
+        future.result().close()
+
+
+_lock = threading.Lock()
+_policies = {}
+
+
+def set_hedge_policy(host, policy):
+    """
+    Hedge slow requests to ``host``
+
+    Parameters
+    ----------
+    host : str
+        Host name, e.g. ``"ec.europa.eu"``, or a URL on that host.
+    policy : HedgePolicy or None
+        Policy for this host alone, as it keeps the host's latencies and
+        counts. None stops hedging requests to the host.
+    """
+    if "://" in host:
+        host = ratelimit._host(host)
+    host = host.lower()
+    with _lock:
+        if policy is None:
+            _policies.pop(host, None)
+        else:
+            _policies[host] = policy
+
+
+def get_hedge_policy(host):
+    """Return the :class:`HedgePolicy` for ``host``, or None"""
+    if "://" in host:
+        host = ratelimit._host(host)
+    return _policies.get(host.lower())
+
+
+def clear_hedge_policies():
+    """Stop hedging requests to every host"""
+    with _lock:
+        _policies.clear()
+
+
+def hedge_stats():
+    """Request, hedge and win counts of every hedged host
+
+    Returns
+    -------
+    dict
+        Maps host names to :class:`HedgeStats`.
+    """
+    with _lock:
+        policies = dict(_policies)
+    return {host: policy.stats() for host, policy in policies.items()}
+
+
+def send(url, func):
+    """Call ``func()`` to request ``url``, hedged if its host has a policy"""
+    policy = _policies.get(ratelimit._host(url))
+    if policy is None:
+        return func()
+    return policy.send(url, func)
+
+
+async def asend(url, func):
+    """Await ``func()`` to request ``url``, hedged if its host has a policy"""
+    policy = _policies.get(ratelimit._host(url))
+    if policy is None:
+        return await func()
+    return await policy.asend(url, func)
@@ -0,0 +1,174 @@
+"""
+Request-lifecycle instrumentation hooks.
+
+Hooks are callables receiving a :class:`HookEvent`. They can be registered
+for every reader and macro client with :func:`register_hook`, or for a single
+instance with its ``register_hook`` method. When no hook is registered for
+an event, emitting it costs a dictionary lookup.
+
+Events
+------
+on_request
+    Before each HTTP attempt. Carries ``url``, ``params`` and ``attempt``.
+on_response
+    After each HTTP attempt. Carries ``status``, ``bytes``, ``ttfb`` (time to
+    the response headers, including connection set-up), ``elapsed`` (total
+    request time) and ``error`` for transport failures. Responses served from
+    the response cache have ``from_cache=True``.
+on_retry
+    Before sleeping ahead of a retry. Carries ``attempt``, ``delay``,
+    ``status`` and ``error`` of the failed attempt.
+on_parse_start
+    Before a payload is parsed into a DataFrame.
+on_parse_end
+    After parsing. Carries ``elapsed`` and the ``shape`` of the result. For
+    streamed responses the parse time includes reading the body.
+"""
+
+from dataclasses import dataclass
+import time
+from typing import Any
+
+__all__ = [
+    "EVENTS",
+    "HookEvent",
+    "clear_hooks",
+    "register_hook",
+    "unregister_hook",
+]
+
+EVENTS = ("on_request", "on_response", "on_retry", "on_parse_start", "on_parse_end")
+
+_hooks = {event: [] for event in EVENTS}
+
+
+@dataclass
+class HookEvent:
+    event: str
+    source: str
+    url: str | None = None
+    params: Any = None
+    attempt: int = 0
+    status: int | None = None
+    bytes: int | None = None
+    ttfb: float | None = None
+    elapsed: float | None = None
+    delay: float | None = None
+    error: BaseException | None = None
+    from_cache: bool = False
+    shape: tuple | None = None
+
+
+def _check_event(event):
+    if event not in EVENTS:
+        raise ValueError(f"Unknown hook event {event!r}, expected one of {EVENTS}")
+
+
+def register_hook(event, func):
+    """
+    Call ``func`` with a :class:`HookEvent` whenever ``event`` occurs
+
+    Parameters
+    ----------
+    event : str
+        One of ``EVENTS``.
+    func : callable
+        Receives a single :class:`HookEvent`.
+    """
+    _check_event(event)
+    _hooks[event].append(func)
+
+
+def unregister_hook(event, func):
+    """Remove a hook added with :func:`register_hook`"""
+    _check_event(event)
+    _hooks[event].remove(func)
+
+
+def clear_hooks():
+    """Remove every globally registered hook"""
+    for funcs in _hooks.values():
+        funcs.clear()
+
+
+def _response_size(response):
+    content = getattr(response, "_content", None)
+    if isinstance(content, bytes):
+        return len(content)
+    length = getattr(response, "headers", {}).get("Content-Length")
+    return int(length) if length else None
+
+
+def _response_ttfb(response):
+    elapsed = getattr(response, "elapsed", None)
+    try:
+        return elapsed.total_seconds()
+    except (AttributeError, RuntimeError):
+        # httpx raises RuntimeError until the response is closed
+        return None
+
+
+class _HookMixin:
+    """Per-instance hook registration shared by readers and macro clients"""
+
+    def register_hook(self, event, func):
+        """
+        Call ``func`` with a :class:`HookEvent` whenever ``event`` occurs
+        for this instance only
+        """
+        _check_event(event)
+        if getattr(self, "_instance_hooks", None) is None:
+            self._instance_hooks = {}
+        self._instance_hooks.setdefault(event, []).append(func)
+
+    def unregister_hook(self, event, func):
+        """Remove a hook added with ``register_hook``"""
+        _check_event(event)
+        self._instance_hooks[event].remove(func)
+
+    def _emit(self, event, response=None, result=None, **fields):
+        funcs = _hooks[event]
+        local = getattr(self, "_instance_hooks", None)
+        local = local.get(event) if local else None
+        if not funcs and not local:
+            return
+        if response is not None:
+            fields.setdefault("status", response.status_code)
+            fields.setdefault("bytes", _response_size(response))
+            fields.setdefault("ttfb", _response_ttfb(response))
+            fields.setdefault("from_cache", getattr(response, "from_cache", False))
+        if result is not None:
+            # MacroResult wraps its frame in ``data``
+            frame = getattr(result, "data", result)
+            fields["shape"] = getattr(frame, "shape", None)
+        payload = HookEvent(event=event, source=type(self).__name__, **fields)
+        for func in funcs:
+            func(payload)
+        for func in local or ():
+            func(payload)
+
+    def _parse(self, url, parser, *args, **kwargs):
+        """Run ``parser`` between the on_parse_start and on_parse_end events"""
+        self._emit("on_parse_start", url=url)
+        started = time.perf_counter()
+        result = parser(*args, **kwargs)
+        self._emit(
+            "on_parse_end",
+            url=url,
+            elapsed=time.perf_counter() - started,
+            result=result,
+        )
+        return result
+
+    async def _aparse(self, url, parser, *args, **kwargs):
+        """Await the coroutine function ``parser`` like :meth:`_parse`"""
+        self._emit("on_parse_start", url=url)
+        started = time.perf_counter()
+        result = await parser(*args, **kwargs)
+        self._emit(
+            "on_parse_end",
+            url=url,
+            elapsed=time.perf_counter() - started,
+            result=result,
+        )
+        return result
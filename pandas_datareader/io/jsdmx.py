@@ -9,10 +9,11 @@ import sys
 import numpy as np
 import pandas as pd
 
+from pandas_datareader._utils import _to_dtype_backend
 from pandas_datareader.io.util import _read_content
 
 
-def read_jsdmx(path_or_buf):
+def read_jsdmx(path_or_buf, dtype_backend=None):
     """
     Convert a SDMX-JSON string to pandas object
 
@@ -20,6 +21,9 @@ def read_jsdmx(path_or_buf):
     ----------
     path_or_buf : a valid SDMX-JSON string or file-like
         https://github.com/sdmx-twg/sdmx-json
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        With 'pyarrow' observations are collected into Arrow arrays and
+        labels are dictionary-encoded
 
     Returns
     -------
@@ -49,7 +53,9 @@ def read_jsdmx(path_or_buf):
         if len(dataset) != 1:
             raise ValueError("length of 'dataSets' must be 1")
         dataset = dataset[0]
-        values = _parse_values(dataset, index=index, columns=columns)
+        values = _parse_values(
+            dataset, index=index, columns=columns, dtype_backend=dtype_backend
+        )
     elif "data" in data and "structures" in data["data"]:
         structure = data["data"]["structures"][0]
         observation_dims = _normalize_v2_dimensions(
@@ -63,12 +69,18 @@ def read_jsdmx(path_or_buf):
         if len(dataset) != 1:
             raise ValueError("length of 'dataSets' must be 1")
         dataset = dataset[0]
-        values = _parse_values(dataset, index=index, columns=columns)
+        values = _parse_values(
+            dataset, index=index, columns=columns, dtype_backend=dtype_backend
+        )
     else:
         raise ValueError("Unsupported SDMX-JSON payload structure")
 
-    df = pd.DataFrame(values, columns=columns, index=index)
-    return df
+    if dtype_backend == "pyarrow":
+        df = pd.DataFrame(dict(enumerate(values)), index=index)
+        df.columns = columns
+    else:
+        df = pd.DataFrame(values, columns=columns, index=index)
+    return _to_dtype_backend(df, dtype_backend)
 
 
 def _normalize_v2_dimensions(dimensions):
@@ -102,7 +114,17 @@ def _fix_quarter_values(value):
     return value
 
 
-def _parse_values(dataset, index, columns):
+def _arrow_column(observed):
+    import pyarrow as pa
+
+    # observations are JSON numbers or null, and NaN where absent
+    array = pa.array(observed, from_pandas=True)
+    if pa.types.is_integer(array.type) or pa.types.is_null(array.type):
+        array = array.cast(pa.float64())
+    return pd.arrays.ArrowExtensionArray(array)
+
+
+def _parse_values(dataset, index, columns, dtype_backend=None):
     size = len(index)
     series = dataset["series"]
 
@@ -122,6 +144,9 @@ def _parse_values(dataset, index, columns):
 
         values.append(observed)
 
+    if dtype_backend == "pyarrow":
+        # one Arrow array per column instead of a 2-D object array
+        return [_arrow_column(observed) for observed in values]
     return np.transpose(np.array(values))
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import collections
 from io import BytesIO
 import time
@@ -6,8 +7,11 @@ import zipfile
 import numpy as np
 import pandas as pd
 
+from pandas_datareader._utils import OfflineError, _to_dtype_backend
 from pandas_datareader.compat import HTTPError
 from pandas_datareader.io.util import _read_content
+from pandas_datareader.offline import is_offline
+from pandas_datareader.retry import Deadline
 
 _STRUCTURE = "{http://www.sdmx.org/resources/sdmxml/schemas/v2_1/structure}"
 _MESSAGE = "{http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message}"
@@ -25,8 +29,19 @@ _OBSVALUE = _GENERIC + "ObsValue"
 _CODE = _STRUCTURE + "Code"
 _TIMEDIMENSION = _STRUCTURE + "TimeDimension"
 
+# seconds waited, one per attempt, for zipped data to be prepared
+_ZIPPED_ATTEMPTS = 60
 
-def read_sdmx(path_or_buf, dtype="float64", dsd=None):
+
+def read_sdmx(
+    path_or_buf,
+    dtype="float64",
+    dsd=None,
+    dtype_backend=None,
+    deadline=None,
+    offline=None,
+    fetch=None,
+):
     """
     Convert a SDMX-XML string to pandas object
 
@@ -38,41 +53,115 @@ def read_sdmx(path_or_buf, dtype="float64", dsd=None):
         dtype to coerce values
     dsd : dict
         parsed DSD dict corresponding to the SDMX-XML data
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        With 'pyarrow' observation values are parsed straight into Arrow
+        arrays and labels are dictionary-encoded
+    deadline : float or Deadline, optional
+        Budget, in seconds, for waiting on zipped data to be prepared. The
+        wait otherwise gives up after 60 seconds.
+    offline : bool, optional
+        Raise ``OfflineError`` instead of downloading zipped data. None
+        follows :func:`pandas_datareader.offline.is_offline`.
+    fetch : callable, optional
+        Called with the URL of zipped data to download it, e.g. through a
+        reader's session. Returns the zip file as bytes, or None while the
+        data is still being prepared. By default the URL is opened directly
+        and only the wait between attempts counts against ``deadline``.
 
     Returns
     -------
     results : Series, DataFrame, or dictionaly of Series or DataFrame.
     """
 
-    xdata = _read_content(path_or_buf)
-
-    from xml.etree import ElementTree as ET
-
-    root = ET.fromstring(xdata)
+    root = _parse_xml(path_or_buf)
+    url = _zipped_url(root, offline)
+    if url is None:
+        return _read_sdmx_root(root, dtype, dsd, dtype_backend)
+
+    deadline = _zipped_deadline(deadline)
+    for _ in range(_ZIPPED_ATTEMPTS):
+        # wait zipped data is prepared
+        try:
+            if fetch is None:
+                data = _read_zipped_sdmx(url)
+            else:
+                content = fetch(url)
+                data = None if content is None else _read_zipped_sdmx(content)
+        except HTTPError:
+            data = None
+        if data is not None:
+            return read_sdmx(data, dtype=dtype, dsd=dsd, dtype_backend=dtype_backend)
+        time.sleep(_zipped_delay(deadline, url))
+    raise _zipped_timeout(url)
+
+
+async def _aread_sdmx(
+    path_or_buf,
+    fetch,
+    dtype="float64",
+    dsd=None,
+    dtype_backend=None,
+    deadline=None,
+    offline=None,
+):
+    """
+    :func:`read_sdmx` waiting on zipped data without blocking
 
+    ``fetch`` is a coroutine function taking the URL of the zip file and
+    returning its bytes, or None while the data is still being prepared.
+    """
+    root = _parse_xml(path_or_buf)
+    url = _zipped_url(root, offline)
+    if url is None:
+        return _read_sdmx_root(root, dtype, dsd, dtype_backend)
+
+    deadline = _zipped_deadline(deadline)
+    for _ in range(_ZIPPED_ATTEMPTS):
+        content = await fetch(url)
+        if content is not None:
+            data = _read_zipped_sdmx(content)
+            return read_sdmx(data, dtype=dtype, dsd=dsd, dtype_backend=dtype_backend)
+        await asyncio.sleep(_zipped_delay(deadline, url))
+    raise _zipped_timeout(url)
+
+
+def _zipped_url(root, offline):
+    """URL of the zip file announced instead of the data, or None"""
     try:
-        structure = _get_child(root, _MESSAGE + "Structure")
+        _get_child(root, _MESSAGE + "Structure")
     except ValueError as exc:
         # get zipped path
         result = list(root.iter(_COMMON + "Text"))[1].text
         if not result.startswith("http"):
             raise ValueError(result) from exc
+        if is_offline(offline):
+            raise OfflineError(
+                f"Offline mode: zipped data at {result} not read"
+            ) from exc
+        return result
+    return None
+
+
+def _zipped_deadline(deadline):
+    if deadline is not None and not isinstance(deadline, Deadline):
+        deadline = Deadline(deadline)
+    return deadline
+
+
+def _zipped_delay(deadline, url):
+    return 1 if deadline is None else deadline.delay(1, url)
+
+
+def _zipped_timeout(url):
+    msg = (
+        "Unable to download zipped data within 60 secs, "
+        "please download it manually from: {0}"
+    )
+    return ValueError(msg.format(url))
 
-        for _ in range(60):
-            # wait zipped data is prepared
-            try:
-                data = _read_zipped_sdmx(result)
-                return read_sdmx(data, dtype=dtype, dsd=dsd)
-            except HTTPError:
-                time.sleep(1)
-                continue
-
-        msg = (
-            "Unable to download zipped data within 60 secs, "
-            "please download it manually from: {0}"
-        )
-        raise ValueError(msg.format(result)) from exc
 
+def _read_sdmx_root(root, dtype, dsd, dtype_backend):
+    structure = _get_child(root, _MESSAGE + "Structure")
     idx_name = structure.get("dimensionAtObservation")
     dataset = _get_child(root, _DATASET)
 
@@ -86,16 +175,43 @@ def read_sdmx(path_or_buf, dtype="float64", dsd=None):
         obss.append(obs)
 
     mcols = _construct_index(keys, dsd=dsd)
-    mseries = _construct_series(obss, name=idx_name, dsd=dsd)
-
-    df = pd.DataFrame(mseries, dtype=dtype)
-    df = df.T
+    if dtype_backend == "pyarrow":
+        mseries = _construct_series(obss, name=idx_name, dsd=dsd, dtype=dtype)
+        # concat aligns the series like the DataFrame constructor below,
+        # without transposing the Arrow arrays through object
+        df = pd.concat(mseries, axis=1, keys=range(len(mseries)))
+    else:
+        mseries = _construct_series(obss, name=idx_name, dsd=dsd)
+        df = pd.DataFrame(mseries, dtype=dtype)
+        df = df.T
     df.columns = mcols
 
-    return df
+    return _to_dtype_backend(df, dtype_backend)
+
+
+def _parse_xml(path_or_buf):
+    """Parse SDMX-XML, reading file-like objects incrementally"""
+    from xml.etree import ElementTree as ET
+
+    if hasattr(path_or_buf, "read"):
+        return ET.parse(path_or_buf).getroot()
+    return ET.fromstring(_read_content(path_or_buf))
+
 
+def _arrow_values(values, dtype):
+    import pyarrow as pa
+    import pyarrow.compute as pc
 
-def _construct_series(values, name, dsd=None):
+    # values are strings, or NaN for missing observations
+    array = pa.array(values, type=pa.string(), from_pandas=True)
+    array = array.cast(pa.from_numpy_dtype(np.dtype(dtype)))
+    if pa.types.is_floating(array.type):
+        # providers spell missing values "NaN"
+        array = pc.if_else(pc.is_nan(array), None, array)
+    return pd.arrays.ArrowExtensionArray(array)
+
+
+def _construct_series(values, name, dsd=None, dtype=None):
     # ts defines attributes to be handled as times
     times = dsd.ts if dsd is not None else []
 
@@ -113,7 +229,10 @@ def _construct_series(values, name, dsd=None):
         else:
             idx = pd.Index([v[0] for v in value], name=name)
 
-        results.append(pd.Series([v[1] for v in value], index=idx))
+        data = [v[1] for v in value]
+        if dtype is not None:
+            data = _arrow_values(data, dtype)
+        results.append(pd.Series(data, index=idx))
     return results
 
 
@@ -197,11 +316,7 @@ def _read_sdmx_dsd(path_or_buf):
     results : namedtuple (SDMXCode)
     """
 
-    xdata = _read_content(path_or_buf)
-
-    from xml.etree import ElementTree as ET
-
-    root = ET.fromstring(xdata)
+    root = _parse_xml(path_or_buf)
 
     structure = _get_child(root, _MESSAGE + "Structures")
     codes = _get_child(structure, _STRUCTURE + "Codelists")
@@ -237,7 +352,10 @@ def _read_sdmx_dsd(path_or_buf):
 
 def _read_zipped_sdmx(path_or_buf):
     """Unzipp data contains SDMX-XML"""
-    data = _read_content(path_or_buf)
+    if isinstance(path_or_buf, bytes):
+        data = path_or_buf
+    else:
+        data = _read_content(path_or_buf)
 
     if not isinstance(data, bytes):
         data = data.encode("ascii")
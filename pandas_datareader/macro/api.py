@@ -2,16 +2,20 @@ from pandas_datareader.macro.eurostat import EurostatClient
 from pandas_datareader.macro.oecd import OECDClient
 
 
-def _get_client(provider):
+def _get_client(provider, **options):
     if provider == "oecd":
-        return OECDClient()
+        return OECDClient(**options)
     if provider == "eurostat":
-        return EurostatClient()
+        return EurostatClient(**options)
     raise ValueError(f"Unknown provider: {provider}")
 
 
-def read_macro(provider, dataset, **kwargs):
-    return _get_client(provider).read(dataset, **kwargs)
+def read_macro(
+    provider, dataset, dtype_backend=None, deadline=None, offline=None, **kwargs
+):
+    options = {"dtype_backend": dtype_backend, "deadline": deadline, "offline": offline}
+    options = {key: value for key, value in options.items() if value is not None}
+    return _get_client(provider, **options).read(dataset, **kwargs)
 
 
 def search_macro_datasets(provider, query=None, **kwargs):
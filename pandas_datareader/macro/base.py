@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+import functools
+import threading
+import time
+
 import pandas as pd
+import requests
 
-from pandas_datareader._utils import _init_session
+from pandas_datareader import hedge, ratelimit, singleflight
+from pandas_datareader._utils import (
+    OfflineError,
+    _init_session,
+    _ReaderSession,
+    _validate_dtype_backend,
+)
+from pandas_datareader.cache import get_cache
+from pandas_datareader.hooks import _HookMixin
+from pandas_datareader.offline import is_offline
+from pandas_datareader.retry import Deadline
 
 
 class MacroDataError(Exception):
@@ -21,11 +36,45 @@ class MacroNotFoundError(MacroDataError):
     pass
 
 
-class MacroClientBase:
+def with_deadline(method):
+    """Run ``method`` within the client's ``deadline`` budget
+
+    Nested calls, e.g. ``read`` describing the dataset, share the budget of
+    the outermost call.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.deadline is None or self._active_deadline() is not None:
+            return method(self, *args, **kwargs)
+        self._local.deadline = Deadline(self.deadline)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._local.deadline = None
+
+    return wrapper
+
+
+class MacroClientBase(_HookMixin):
     provider = ""
+    timeout = 30
+    session = _ReaderSession()
 
-    def __init__(self, session=None):
+    def __init__(self, session=None, dtype_backend=None, deadline=None, offline=None):
         self.session = _init_session(session)
+        self.dtype_backend = _validate_dtype_backend(dtype_backend)
+        if deadline is not None and not deadline > 0:
+            raise ValueError("'deadline' must be a positive number of seconds")
+        self.deadline = deadline
+        self.offline = offline
+        self._local = threading.local()
+        self.coalesce = True
+        self.cache = None
+
+    def _active_deadline(self):
+        """Deadline of the public call running in this thread, if any"""
+        return getattr(self._local, "deadline", None)
 
     @staticmethod
     def _normalize_date(value):
@@ -34,13 +83,79 @@ class MacroClientBase:
         return pd.to_datetime(value).strftime("%Y-%m-%d")
 
     def _get(self, url, **kwargs):
-        response = self.session.get(url, timeout=30, **kwargs)
+        if not self.coalesce or set(kwargs) - {"params", "headers"}:
+            return self._send(url, **kwargs)
+        deadline = self._active_deadline()
+        timeout = self.timeout
+        if deadline is not None:
+            timeout = deadline.timeout(timeout, url)
+        return singleflight.coalesce(
+            self.session,
+            url,
+            kwargs.get("params"),
+            kwargs.get("headers"),
+            lambda: self._send(url, **kwargs),
+            timeout=timeout,
+        )
+
+    def _response_cache(self):
+        """Response cache used by this client, or None when disabled"""
+        if self.cache is None:
+            return get_cache()
+        return self.cache or None
+
+    def _send(self, url, **kwargs):
+        params = kwargs.get("params")
+        cache = self._response_cache()
+        entry = None if cache is None else cache.lookup(url, params)
+        offline = is_offline(self.offline)
+        if entry is not None and (entry.fresh or offline):
+            response = entry.to_response()
+            self._emit("on_response", url=url, params=params, response=response)
+            return response
+        if offline:
+            raise OfflineError(f"Offline mode: {url} is not in the response cache")
+        if entry is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.validators()}
+        ratelimit.acquire(url)
+        deadline = self._active_deadline()
+        timeout = self.timeout
+        if deadline is not None:
+            timeout = deadline.timeout(timeout, url)
+        self._emit("on_request", url=url, params=params)
+        started = time.perf_counter()
+        try:
+            response = hedge.send(
+                url, lambda: self.session.get(url, timeout=timeout, **kwargs)
+            )
+        except requests.exceptions.RequestException as exc:
+            self._emit(
+                "on_response",
+                url=url,
+                params=params,
+                elapsed=time.perf_counter() - started,
+                error=exc,
+            )
+            if deadline is not None and deadline.expired():
+                raise deadline.error(url) from exc
+            raise
+        self._emit(
+            "on_response",
+            url=url,
+            params=params,
+            elapsed=time.perf_counter() - started,
+            response=response,
+        )
+        if response.status_code == 304 and entry is not None:
+            return cache.revalidated(entry, response)
         if response.status_code == 404:
             raise MacroNotFoundError(f"Resource not found: {url}")
         if response.status_code >= 400:
             raise MacroProviderError(
                 f"Provider request failed: {url} ({response.status_code})"
             )
+        if cache is not None:
+            cache.store(url, params, response)
         return response
 
     def search_datasets(self, query=None, **kwargs):
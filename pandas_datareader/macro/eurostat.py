@@ -5,7 +5,11 @@ from xml.etree import ElementTree as ET
 import pandas as pd
 
 from pandas_datareader.io.sdmx import _read_sdmx_dsd, read_sdmx
-from pandas_datareader.macro.base import MacroClientBase
+from pandas_datareader.macro.base import (
+    MacroClientBase,
+    MacroDataError,
+    with_deadline,
+)
 from pandas_datareader.macro.result import MacroResult
 
 _MESSAGE = "{http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message}"
@@ -79,6 +83,13 @@ class EurostatClient(MacroClientBase):
             labels[dim_id] = values
         return {"dimensions": dimensions, "labels": labels, "codelists": codelists}
 
+    def _read_zipped(self, url):
+        """Zip file of a large request, or None while Eurostat prepares it"""
+        try:
+            return self._get(url).content
+        except MacroDataError:
+            return None
+
     @staticmethod
     def _format_columns(data):
         if not isinstance(data.columns, pd.MultiIndex):
@@ -107,7 +118,14 @@ class EurostatClient(MacroClientBase):
     def _build_result_from_payload(self, dataset_id, data_xml, dsd_xml, query=None):
         dsd = _read_sdmx_dsd(dsd_xml)
         metadata = self._parse_dsd_metadata(dsd_xml)
-        data = read_sdmx(data_xml, dsd=dsd)
+        data = read_sdmx(
+            data_xml,
+            dsd=dsd,
+            dtype_backend=self.dtype_backend,
+            deadline=self._active_deadline(),
+            offline=self.offline,
+            fetch=self._read_zipped,
+        )
         data = self._format_columns(data)
 
         root = ET.fromstring(data_xml)
@@ -150,6 +168,7 @@ class EurostatClient(MacroClientBase):
             url = f"{url}?{'&'.join(params)}"
         return url
 
+    @with_deadline
     def search_datasets(self, query=None, **kwargs):
         response = self._get(self._dataflow_url())
         result = self._parse_dataflows_xml(response.content)
@@ -163,6 +182,7 @@ class EurostatClient(MacroClientBase):
             result = result.loc[mask].reset_index(drop=True)
         return result
 
+    @with_deadline
     def describe_dataset(self, dataset, **kwargs):
         dsd_xml = self._get(self._dsd_url(dataset)).content
         dataflow_xml = self._get(self._dataflow_url(dataset)).content
@@ -182,14 +202,18 @@ class EurostatClient(MacroClientBase):
             "raw": {"dataflow": dataflow},
         }
 
+    @with_deadline
     def read(self, dataset, start=None, end=None, filters=None, **kwargs):
         if filters is not None:
             raise NotImplementedError(
                 "Eurostat dict/string filters are not implemented in the new macro API yet."
             )
-        data_xml = self._get(self._data_url(dataset, start=start, end=end)).content
+        url = self._data_url(dataset, start=start, end=end)
+        data_xml = self._get(url).content
         dsd_xml = self._get(self._dsd_url(dataset)).content
-        result = self._build_result_from_payload(
+        result = self._parse(
+            url,
+            self._build_result_from_payload,
             dataset,
             data_xml,
             dsd_xml,
@@ -9,6 +9,7 @@ from pandas_datareader.macro.base import (
     MacroClientBase,
     MacroNotFoundError,
     MacroSchemaError,
+    with_deadline,
 )
 from pandas_datareader.macro.result import MacroResult
 
@@ -79,7 +80,7 @@ class OECDClient(MacroClientBase):
         return dimensions, labels
 
     def _build_result_from_payload(self, dataset_id, payload, query=None):
-        data = read_jsdmx(payload)
+        data = read_jsdmx(payload, dtype_backend=self.dtype_backend)
         dimensions, labels = self._extract_dimensions(payload)
         structure = payload["data"]["structures"][0]
         metadata = {
@@ -124,6 +125,7 @@ class OECDClient(MacroClientBase):
             url = f"{url}&{'&'.join(params)}"
         return url
 
+    @with_deadline
     def search_datasets(self, query=None, **kwargs):
         response = self._get(self.dataflow_url)
         result = self._parse_dataflows_xml(response.content)
@@ -137,6 +139,7 @@ class OECDClient(MacroClientBase):
             result = result.loc[mask].reset_index(drop=True)
         return result
 
+    @with_deadline
     def describe_dataset(self, dataset, **kwargs):
         dataset_id = self._resolve_dataset(dataset)
         payload = self._get(
@@ -161,6 +164,7 @@ class OECDClient(MacroClientBase):
             "raw": result.metadata["raw"],
         }
 
+    @with_deadline
     def read(self, dataset, start=None, end=None, filters=None, **kwargs):
         dataset_id = self._resolve_dataset(dataset)
         key = "all" if filters is None else filters
@@ -168,10 +172,11 @@ class OECDClient(MacroClientBase):
             raise MacroSchemaError(
                 "OECD filters must be a provider-specific key string."
             )
-        payload = self._get(
-            self._dataset_url(dataset_id, key=key, start=start, end=end)
-        ).json()
-        return self._build_result_from_payload(
+        url = self._dataset_url(dataset_id, key=key, start=start, end=end)
+        payload = self._get(url).json()
+        return self._parse(
+            url,
+            self._build_result_from_payload,
             dataset_id,
             payload,
             query={"start": start, "end": end, "filters": filters},
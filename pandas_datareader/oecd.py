@@ -22,7 +22,7 @@ class OECDReader(_BaseReader):
 
     def _read_lines(self, out):
         """read one data from specified URL"""
-        df = read_jsdmx(out)
+        df = read_jsdmx(out, dtype_backend=self.dtype_backend)
         df = df.dropna(how="all", axis=1)
         try:
             idx_name = df.index.name  # hack for pandas 0.16.2
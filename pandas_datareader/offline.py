@@ -0,0 +1,66 @@
+"""
+Offline mode.
+
+In offline mode readers and macro clients answer only from the response
+cache, and ``DataReader`` with a ``store`` only from the store. A request
+that cannot be answered locally raises :class:`OfflineError` at once, without
+retries and without opening a connection.
+
+Offline mode is on when enabled with :func:`set_offline` or when the
+``PANDAS_DATAREADER_OFFLINE`` environment variable is set to ``1``, ``true``,
+``yes`` or ``on``. A reader or client created with ``offline=True`` or
+``offline=False`` ignores both.
+"""
+
+from contextlib import contextmanager
+import os
+
+from pandas_datareader._utils import OfflineError
+
+__all__ = ["ENV_VAR", "OfflineError", "is_offline", "offline_mode", "set_offline"]
+
+ENV_VAR = "PANDAS_DATAREADER_OFFLINE"
+
+_TRUE = ("1", "true", "yes", "on")
+
+_offline = None
+
+
+def set_offline(offline=True):
+    """
+    Turn offline mode on or off for every reader and macro client
+
+    Parameters
+    ----------
+    offline : bool or None, default True
+        None defers to the ``PANDAS_DATAREADER_OFFLINE`` environment variable.
+    """
+    global _offline
+    _offline = None if offline is None else bool(offline)
+
+
+def is_offline(offline=None):
+    """
+    Return True if requests must be answered locally
+
+    Parameters
+    ----------
+    offline : bool, optional
+        Setting of a reader or client, which takes precedence when not None.
+    """
+    if offline is not None:
+        return bool(offline)
+    if _offline is not None:
+        return _offline
+    return os.environ.get(ENV_VAR, "").strip().lower() in _TRUE
+
+
+@contextmanager
+def offline_mode(offline=True):
+    """Turn offline mode on, or off, within a ``with`` block"""
+    previous = _offline
+    set_offline(offline)
+    try:
+        yield
+    finally:
+        set_offline(previous)
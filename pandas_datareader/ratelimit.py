@@ -0,0 +1,137 @@
+"""
+Process-wide per-host rate limiting.
+
+Every request sent by a reader or macro client first acquires a token from
+the bucket registered for its host, so concurrent threads together stay
+within the provider's limit instead of backing off after being throttled.
+"""
+
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+__all__ = [
+    "TokenBucket",
+    "aacquire",
+    "acquire",
+    "clear_rate_limits",
+    "get_rate_limit",
+    "set_rate_limit",
+]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second, i.e. the sustained requests per second.
+    burst : int, optional
+        Bucket capacity, i.e. the number of requests that may be sent at
+        once after an idle period. Defaults to ``max(1, rate)``.
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("'rate' must be positive")
+        if burst is None:
+            burst = max(1, rate)
+        if burst < 1:
+            raise ValueError("'burst' must be at least 1")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take ``tokens`` from the bucket
+
+        Returns the number of seconds the caller must wait before sending.
+        The tokens are reserved immediately, so callers are served in the
+        order they reserve.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens=1):
+        """Block until ``tokens`` are available"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens=1):
+        """Wait without blocking the event loop until ``tokens`` are available"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_lock = threading.Lock()
+_buckets = {}
+
+
+def _host(url):
+    return urlsplit(url).hostname or ""
+
+
+def set_rate_limit(host, rate, burst=None):
+    """
+    Limit the request rate to ``host``
+
+    Parameters
+    ----------
+    host : str
+        Host name, e.g. ``"fred.stlouisfed.org"``, or a URL on that host.
+    rate : float or None
+        Sustained requests per second. None removes the limit.
+    burst : int, optional
+        Number of requests that may be sent back to back after an idle
+        period. Defaults to ``max(1, rate)``.
+    """
+    if "://" in host:
+        host = _host(host)
+    host = host.lower()
+    with _lock:
+        if rate is None:
+            _buckets.pop(host, None)
+        else:
+            _buckets[host] = TokenBucket(rate, burst)
+
+
+def get_rate_limit(host):
+    """Return the :class:`TokenBucket` for ``host``, or None"""
+    if "://" in host:
+        host = _host(host)
+    return _buckets.get(host.lower())
+
+
+def clear_rate_limits():
+    """Remove every configured rate limit"""
+    with _lock:
+        _buckets.clear()
+
+
+def acquire(url):
+    """Block until a request to ``url`` is allowed by its host's limit"""
+    bucket = _buckets.get(_host(url))
+    if bucket is not None:
+        bucket.acquire()
+
+
+async def aacquire(url):
+    """Wait without blocking until a request to ``url`` is allowed"""
+    bucket = _buckets.get(_host(url))
+    if bucket is not None:
+        await bucket.aacquire()
@@ -0,0 +1,118 @@
+"""
+Registry mapping ``data_source`` names to reader classes.
+
+Reader modules are imported on first use, so importing pandas_datareader
+does not pay for readers that are never called. Third-party packages can add
+sources through the ``pandas_datareader.sources`` entry point group, e.g. in
+``pyproject.toml``::
+
+    [project.entry-points."pandas_datareader.sources"]
+    mysource = "mypackage.reader:MySourceReader"
+"""
+
+from importlib import import_module
+import threading
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "available_sources",
+    "get_reader",
+    "register_source",
+    "unregister_source",
+]
+
+ENTRY_POINT_GROUP = "pandas_datareader.sources"
+
+_BUILTIN_SOURCES = {
+    "bankofcanada": "pandas_datareader.bankofcanada:BankOfCanadaReader",
+    "fred": "pandas_datareader.fred:FredReader",
+    "famafrench": "pandas_datareader.famafrench:FamaFrenchReader",
+    "oecd": "pandas_datareader.oecd:OECDReader",
+    "eurostat": "pandas_datareader.eurostat:EurostatReader",
+    "econdb": "pandas_datareader.econdb:EcondbReader",
+    "wb": "pandas_datareader.wb:WorldBankReader",
+}
+
+_lock = threading.Lock()
+_sources = dict(_BUILTIN_SOURCES)
+_entry_points_loaded = False
+
+
+def register_source(name, reader):
+    """
+    Make ``reader`` available as ``DataReader(..., data_source=name)``
+
+    Parameters
+    ----------
+    name : str
+        Data source name.
+    reader : type or str
+        Reader class, or its ``"module:ClassName"`` path to import it only
+        when the source is first used. The reader is created with
+        ``symbols``, ``start``, ``end``, ``retry_count``, ``pause`` and
+        ``session`` and must provide ``read()`` and ``close()``.
+    """
+    with _lock:
+        _sources[name] = reader
+
+
+def unregister_source(name):
+    """Remove a data source; built-in sources are restored to their default"""
+    with _lock:
+        if name in _BUILTIN_SOURCES:
+            _sources[name] = _BUILTIN_SOURCES[name]
+        else:
+            _sources.pop(name, None)
+
+
+def _load_entry_points():
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    # scanning installed distributions is slow, so only do it once and only
+    # when a source is not known already
+    from importlib.metadata import entry_points
+
+    with _lock:
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            _sources.setdefault(entry_point.name, entry_point.value)
+        _entry_points_loaded = True
+
+
+def _resolve(path):
+    module, _, attr = path.partition(":")
+    reader = import_module(module)
+    for part in attr.split("."):
+        reader = getattr(reader, part)
+    return reader
+
+
+def get_reader(name):
+    """
+    Return the reader class registered for ``name``
+
+    Raises
+    ------
+    NotImplementedError
+        If no source is registered under ``name``.
+    """
+    reader = _sources.get(name)
+    if reader is None:
+        _load_entry_points()
+        reader = _sources.get(name)
+        if reader is None:
+            msg = f"data_source={name!r} is not implemented"
+            raise NotImplementedError(msg)
+    if isinstance(reader, str):
+        resolved = _resolve(reader)
+        with _lock:
+            if _sources.get(name) == reader:
+                _sources[name] = resolved
+        reader = resolved
+    return reader
+
+
+def available_sources():
+    """Sorted names of every registered data source, including entry points"""
+    _load_entry_points()
+    return sorted(_sources)
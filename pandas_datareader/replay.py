@@ -0,0 +1,269 @@
+"""
+Record and replay HTTP traffic for offline, reproducible runs.
+
+:class:`RecordingAdapter` sends requests over the network and captures the
+responses, with their headers and timings, into an :class:`Archive`.
+:class:`ReplayAdapter` serves the archived responses back without network
+access, optionally simulating the recorded latency and a given bandwidth.
+Both are requests transport adapters and can be mounted on any session, or on
+the shared reader sessions with :func:`record` and :func:`replay`.
+"""
+
+from contextlib import contextmanager
+import hashlib
+import io
+import json
+import threading
+import time
+import zipfile
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from pandas_datareader import session as _session
+from pandas_datareader.cache import _redact_url, normalize_url
+
+__all__ = [
+    "Archive",
+    "RecordingAdapter",
+    "RecordingNotFound",
+    "ReplayAdapter",
+    "record",
+    "replay",
+]
+
+# headers describing the wire encoding of a body, which is stored decoded
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class RecordingNotFound(requests.exceptions.ConnectionError):
+    """Raised when replaying a request that was not recorded"""
+
+
+def _key(method, url):
+    # credentials are left out, so a recording replays under any API key
+    return f"{method.upper()} {normalize_url(_redact_url(url))}"
+
+
+class Archive:
+    """
+    Recorded responses stored in a single zip file
+
+    Bodies are deflated and stored once per distinct content. API keys and
+    tokens are redacted from the stored URLs.
+
+    Parameters
+    ----------
+    path : str
+        Archive file. It is read if it exists.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._bodies = {}
+        try:
+            self._load()
+        except FileNotFoundError:
+            pass
+
+    def _load(self):
+        with zipfile.ZipFile(self.path) as archive:
+            index = json.loads(archive.read("index.json"))
+            for entry in index:
+                self._entries.setdefault(entry["key"], []).append(entry)
+                digest = entry["body"]
+                if digest not in self._bodies:
+                    self._bodies[digest] = archive.read(f"bodies/{digest}")
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    def add(self, method, url, status, headers, body, elapsed):
+        """Add a response to the archive"""
+        digest = hashlib.sha256(body).hexdigest()
+        entry = {
+            "key": _key(method, url),
+            "url": _redact_url(url),
+            "status": status,
+            "headers": {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            },
+            "elapsed": elapsed,
+            "body": digest,
+        }
+        with self._lock:
+            self._entries.setdefault(entry["key"], []).append(entry)
+            self._bodies[digest] = body
+
+    def responses(self, method, url):
+        """Recorded entries for a request, in recording order"""
+        return self._entries.get(_key(method, url), [])
+
+    def body(self, entry):
+        return self._bodies[entry["body"]]
+
+    def save(self):
+        """Write the archive to ``path``"""
+        with self._lock:
+            index = [entry for entries in self._entries.values() for entry in entries]
+            with zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr("index.json", json.dumps(index))
+                for digest, body in self._bodies.items():
+                    archive.writestr(f"bodies/{digest}", body)
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    HTTP adapter capturing every response into an :class:`Archive`
+
+    Bodies are downloaded completely before they are handed to the caller.
+    """
+
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        body = response.content
+        self.archive.add(
+            request.method,
+            request.url,
+            response.status_code,
+            response.headers,
+            body,
+            response.elapsed.total_seconds(),
+        )
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    HTTP adapter serving responses from an :class:`Archive`
+
+    A request recorded several times is answered with the recordings in
+    order; the last one is repeated once they are exhausted.
+
+    Parameters
+    ----------
+    archive : Archive
+    latency : float, optional
+        Seconds to wait before each response. Defaults to the recorded time
+        to the response headers. Use 0 to answer immediately.
+    bandwidth : float, optional
+        Simulated transfer rate of the body in bytes per second. Unlimited
+        by default.
+    """
+
+    def __init__(self, archive, latency=None, bandwidth=None):
+        super().__init__()
+        self.archive = archive
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self._lock = threading.Lock()
+        self._served = {}
+
+    def _next_entry(self, request):
+        entries = self.archive.responses(request.method, request.url)
+        if not entries:
+            raise RecordingNotFound(
+                f"No recorded response for {request.method} {request.url}",
+                request=request,
+            )
+        key = entries[0]["key"]
+        with self._lock:
+            position = self._served.get(key, 0)
+            self._served[key] = position + 1
+        return entries[min(position, len(entries) - 1)]
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        entry = self._next_entry(request)
+        body = self.archive.body(entry)
+        latency = entry["elapsed"] if self.latency is None else self.latency
+        if self.bandwidth:
+            latency += len(body) / self.bandwidth
+        if latency > 0:
+            time.sleep(latency)
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=entry["headers"],
+            status=entry["status"],
+            preload_content=False,
+            decode_content=False,
+            request_url=request.url,
+        )
+        response = self.build_response(request, raw)
+        if not stream:
+            _ = response.content
+        return response
+
+    def close(self):
+        pass
+
+
+@contextmanager
+def _mounted(adapter, session):
+    if session is None:
+        _session.set_transport(adapter)
+        try:
+            yield adapter
+        finally:
+            _session.set_transport(None)
+        return
+    # per-host adapters mounted on the session would be matched first
+    previous = {
+        prefix: old
+        for prefix, old in session.adapters.items()
+        if prefix.startswith(("https://", "http://"))
+    }
+    for prefix in ("https://", "http://", *previous):
+        session.mount(prefix, adapter)
+    try:
+        yield adapter
+    finally:
+        for prefix, old in previous.items():
+            session.mount(prefix, old)
+
+
+@contextmanager
+def record(path, session=None):
+    """
+    Record the responses received inside the block into ``path``
+
+    Parameters
+    ----------
+    path : str
+        Archive file. Existing recordings are kept and new ones appended.
+    session : requests.Session, optional
+        Session to record. Defaults to the shared sessions used by readers
+        and macro clients created without a ``session``.
+
+    Examples
+    --------
+    >>> with replay.record("fred.zip"):  # doctest: +SKIP
+    ...     web.DataReader("GDP", "fred")
+    """
+    archive = Archive(path)
+    try:
+        with _mounted(RecordingAdapter(archive), session) as adapter:
+            yield adapter
+    finally:
+        archive.save()
+
+
+@contextmanager
+def replay(path, session=None, latency=None, bandwidth=None):
+    """
+    Serve the responses recorded in ``path`` inside the block
+
+    Requests that were not recorded raise :class:`RecordingNotFound`. See
+    :class:`ReplayAdapter` for ``latency`` and ``bandwidth``.
+    """
+    adapter = ReplayAdapter(Archive(path), latency=latency, bandwidth=bandwidth)
+    with _mounted(adapter, session):
+        yield adapter
@@ -0,0 +1,268 @@
+"""
+Retry policies, per-host circuit breakers and deadlines for reader requests.
+"""
+
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+from pandas_datareader._utils import CircuitOpenError, DeadlineExceededError
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "Deadline",
+    "DeadlineExceededError",
+    "RetryPolicy",
+    "get_default_retry_policy",
+    "set_default_retry_policy",
+]
+
+RETRYABLE_STATUSES = frozenset([408, 425, 429, 500, 502, 503, 504])
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker
+
+    After ``failure_threshold`` consecutive failed attempts against a host
+    the circuit opens and requests to that host fail immediately. Once
+    ``reset_timeout`` seconds have passed a single trial request is let
+    through; its success closes the circuit, its failure re-opens it.
+
+    Parameters
+    ----------
+    failure_threshold : int, default 5
+        Consecutive failures that open the circuit.
+    reset_timeout : float, default 30
+        Seconds to wait before letting a trial request through.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        if failure_threshold < 1:
+            raise ValueError("'failure_threshold' must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = {}
+        self._opened_at = {}
+
+    def allow(self, host):
+        """Return True if a request to ``host`` may be sent"""
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return True
+            if time.monotonic() - opened_at >= self.reset_timeout:
+                # half-open: let one trial through and hold the others back
+                self._opened_at[host] = time.monotonic()
+                return True
+            return False
+
+    def state(self, host):
+        """Return "closed" or "open" for ``host``"""
+        return "open" if host in self._opened_at else "closed"
+
+    def record_success(self, host):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+
+    def record_failure(self, host):
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.failure_threshold:
+                self._opened_at[host] = time.monotonic()
+
+    def reset(self):
+        """Close every circuit"""
+        with self._lock:
+            self._failures.clear()
+            self._opened_at.clear()
+
+
+class RetryPolicy:
+    """
+    Decide which failed requests are retried and how long to wait
+
+    Parameters
+    ----------
+    retry_statuses : iterable of int, optional
+        HTTP statuses worth retrying. Any other non-200 status fails
+        immediately. Defaults to 408, 425, 429, 500, 502, 503 and 504.
+    max_delay : float, default 30
+        Upper bound, in seconds, of a single backoff.
+    respect_retry_after : bool, default True
+        Wait for the duration given by a ``Retry-After`` header instead of
+        the computed backoff.
+    max_retry_after : float, default 120
+        Upper bound, in seconds, applied to ``Retry-After``.
+    circuit_breaker : CircuitBreaker, optional
+        Breaker shared by every reader using this policy.
+
+    Notes
+    -----
+    Backoff uses decorrelated jitter: each delay is drawn uniformly between
+    the reader's ``pause`` and three times the previous delay, capped at
+    ``max_delay``. Concurrent workers therefore do not retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        retry_statuses=None,
+        max_delay=30.0,
+        respect_retry_after=True,
+        max_retry_after=120.0,
+        circuit_breaker=None,
+    ):
+        if retry_statuses is None:
+            retry_statuses = RETRYABLE_STATUSES
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_delay = max_delay
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.circuit_breaker = circuit_breaker
+
+    def is_retryable(self, status_code):
+        """Return True if a response with ``status_code`` should be retried"""
+        return status_code in self.retry_statuses
+
+    @staticmethod
+    def _host(url):
+        return urlsplit(url).hostname or ""
+
+    def check(self, url):
+        """Raise CircuitOpenError if the circuit for ``url``'s host is open"""
+        if self.circuit_breaker is None:
+            return
+        host = self._host(url)
+        if not self.circuit_breaker.allow(host):
+            raise CircuitOpenError(f"Circuit open for host {host}: {url}")
+
+    def record_success(self, url):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success(self._host(url))
+
+    def record_failure(self, url):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure(self._host(url))
+
+    @staticmethod
+    def retry_after(response):
+        """
+        Seconds requested by the ``Retry-After`` header of ``response``
+
+        Returns None when the header is missing or malformed.
+        """
+        if response is None:
+            return None
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, when.timestamp() - time.time())
+
+    def next_delay(self, previous, base, response=None):
+        """
+        Seconds to wait before the next attempt
+
+        Parameters
+        ----------
+        previous : float
+            Previous delay, or ``base`` before the first retry.
+        base : float
+            Minimum delay, usually the reader's ``pause``.
+        response : Response, optional
+            Failed response, used to honour ``Retry-After``.
+        """
+        if self.respect_retry_after:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        upper = max(base, previous * 3)
+        return min(self.max_delay, random.uniform(base, upper))
+
+
+class Deadline:
+    """
+    Total time budget shared by the requests, retries and waits of a read
+
+    Parameters
+    ----------
+    seconds : float
+        Budget, counted from the creation of the deadline.
+    """
+
+    def __init__(self, seconds):
+        if seconds is None or seconds <= 0:
+            raise ValueError("deadline must be a positive number of seconds")
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self):
+        """Seconds left, negative once the deadline has passed"""
+        return self.expires - time.monotonic()
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def error(self, url=None):
+        """DeadlineExceededError to raise for a request to ``url``"""
+        msg = f"Deadline of {self.seconds}s exceeded"
+        if url is not None:
+            msg += f": {url}"
+        return DeadlineExceededError(msg)
+
+    def check(self, url=None):
+        """Raise DeadlineExceededError if the deadline has passed"""
+        if self.expired():
+            raise self.error(url)
+
+    def timeout(self, timeout, url=None):
+        """``timeout`` of the next attempt, cut to the remaining budget"""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.error(url)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def delay(self, delay, url=None):
+        """
+        ``delay`` before the next attempt
+
+        Raises DeadlineExceededError at once instead of sleeping when the
+        next attempt would start after the deadline.
+        """
+        if delay >= self.remaining():
+            raise self.error(url)
+        return delay
+
+
+_default_policy = RetryPolicy()
+
+
+def get_default_retry_policy():
+    """Return the policy used by readers without their own ``retry_policy``"""
+    return _default_policy
+
+
+def set_default_retry_policy(policy):
+    """
+    Set the policy used by readers without their own ``retry_policy``
+
+    Parameters
+    ----------
+    policy : RetryPolicy or None
+        None restores the built-in default.
+    """
+    global _default_policy
+    _default_policy = RetryPolicy() if policy is None else policy
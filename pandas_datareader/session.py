@@ -0,0 +1,184 @@
+"""
+Process-wide registry of pooled HTTP sessions shared by the data readers.
+
+Readers created without an explicit ``session`` draw a shared
+:class:`requests.Session` from this registry, so keep-alive connections
+survive across ``read()`` calls instead of being torn down after each one.
+"""
+
+import atexit
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+__all__ = [
+    "close_sessions",
+    "configure_session_pool",
+    "get_session",
+    "is_shared_session",
+    "reset_session_pool",
+    "set_transport",
+]
+
+_DEFAULT_CONFIG = {
+    "pool_connections": 10,
+    "pool_maxsize": 10,
+    "pool_block": False,
+    "keep_alive": True,
+    "host_pool_sizes": {},
+}
+
+_lock = threading.RLock()
+_config = dict(_DEFAULT_CONFIG)
+_sessions = {}
+_transport = None
+
+
+def configure_session_pool(
+    pool_connections=None,
+    pool_maxsize=None,
+    pool_block=None,
+    keep_alive=None,
+    host_pool_sizes=None,
+):
+    """
+    Configure the connection pool used by shared reader sessions.
+
+    Existing shared sessions are closed so that the new settings apply to
+    every session handed out afterwards.
+
+    Parameters
+    ----------
+    pool_connections : int, optional
+        Number of per-host connection pools to keep. Default 10.
+    pool_maxsize : int, optional
+        Maximum number of connections kept alive per host. Default 10.
+    pool_block : bool, optional
+        Block when a host pool is exhausted instead of opening a
+        temporary extra connection. Default False.
+    keep_alive : bool, optional
+        Reuse connections between requests. Default True.
+    host_pool_sizes : dict, optional
+        Mapping of host name (e.g. ``"fred.stlouisfed.org"``) or URL prefix
+        to the maximum number of connections kept alive for that host.
+    """
+    with _lock:
+        if pool_connections is not None:
+            _config["pool_connections"] = int(pool_connections)
+        if pool_maxsize is not None:
+            _config["pool_maxsize"] = int(pool_maxsize)
+        if pool_block is not None:
+            _config["pool_block"] = bool(pool_block)
+        if keep_alive is not None:
+            _config["keep_alive"] = bool(keep_alive)
+        if host_pool_sizes is not None:
+            _config["host_pool_sizes"] = dict(host_pool_sizes)
+        close_sessions()
+
+
+def reset_session_pool():
+    """Restore the default pool configuration and close shared sessions"""
+    with _lock:
+        _config.clear()
+        _config.update(_DEFAULT_CONFIG)
+        _config["host_pool_sizes"] = {}
+        close_sessions()
+
+
+def set_transport(adapter):
+    """
+    Send every request of the shared sessions through ``adapter``
+
+    Existing shared sessions are closed so that sessions handed out
+    afterwards use the new transport.
+
+    Parameters
+    ----------
+    adapter : requests.adapters.BaseAdapter or None
+        Transport adapter mounted for ``http://`` and ``https://``, e.g. a
+        :class:`pandas_datareader.replay.ReplayAdapter`. None restores the
+        pooled HTTP adapters.
+    """
+    global _transport
+    with _lock:
+        _transport = adapter
+        close_sessions()
+
+
+def _host_prefixes(host):
+    if "://" in host:
+        return [host]
+    return [f"https://{host}", f"http://{host}"]
+
+
+def _build_session():
+    session = requests.Session()
+    # do not set requests max_retries here to support arbitrary pause
+    adapter = HTTPAdapter(
+        pool_connections=_config["pool_connections"],
+        pool_maxsize=_config["pool_maxsize"],
+        pool_block=_config["pool_block"],
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if _transport is not None:
+        # the transport replaces the pools, per-host ones included, as a
+        # longer mounted prefix would take precedence over it
+        session.mount("https://", _transport)
+        session.mount("http://", _transport)
+    else:
+        for host, size in _config["host_pool_sizes"].items():
+            host_adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=int(size),
+                pool_block=_config["pool_block"],
+            )
+            for prefix in _host_prefixes(host):
+                session.mount(prefix, host_adapter)
+    if not _config["keep_alive"]:
+        session.headers["Connection"] = "close"
+    session._pdr_shared = True
+    return session
+
+
+def get_session(name="default"):
+    """
+    Return the shared session registered under ``name``
+
+    Sessions are created on first use and are private to the current
+    process, so a forked worker never reuses its parent's sockets.
+
+    Parameters
+    ----------
+    name : str, default "default"
+        Registry key. Use distinct names to isolate groups of readers.
+
+    Returns
+    -------
+    session : requests.Session
+    """
+    key = (os.getpid(), name)
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = _build_session()
+        return session
+
+
+def close_sessions():
+    """Close every shared session and release its pooled connections"""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+def is_shared_session(session):
+    """Return True if ``session`` is owned by the shared registry"""
+    return getattr(session, "_pdr_shared", False)
+
+
+atexit.register(close_sessions)
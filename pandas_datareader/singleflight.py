@@ -0,0 +1,153 @@
+"""
+Coalescing of identical in-flight requests.
+
+When several threads request the same URL at the same moment, only the first
+one sends it. The others wait for its response and receive a copy sharing the
+downloaded body, so a fan-out costs one download instead of one per thread.
+"""
+
+import copy
+import threading
+
+from pandas_datareader._utils import RemoteDataError
+from pandas_datareader.cache import normalize_url
+
+__all__ = ["SingleFlight", "coalesce", "request_key"]
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time
+
+    Callers of :meth:`do` arriving while a call with the same key is running
+    wait for it and share its outcome instead of running their own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func, share=None, timeout=None):
+        """
+        Run ``func()`` unless a call for ``key`` is already in flight
+
+        Parameters
+        ----------
+        key : hashable
+            Identity of the call.
+        func : callable
+            Called without arguments by the first caller.
+        share : callable, optional
+            Applied by the first caller to the result when other callers
+            joined, e.g. to load a streamed body so it can be shared. Each
+            follower receives a shallow copy of the shared result.
+        timeout : float, optional
+            Seconds a follower waits for the call in flight before calling
+            ``func()`` itself. None waits until the call finishes.
+
+        Returns
+        -------
+        result, shared : object, bool
+            ``shared`` is True when the result came from, or was given to,
+            another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                # the leader outlasted this caller's budget
+                with self._lock:
+                    call.followers -= 1
+                return func(), False
+            if call.error is not None:
+                raise _own_error(call.error) from call.error
+            return copy.copy(call.result), True
+
+        try:
+            result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        else:
+            with self._lock:
+                # later callers start a new flight from here on
+                del self._calls[key]
+                followers = call.followers
+            if followers and share is not None:
+                try:
+                    result = share(result)
+                except BaseException as exc:
+                    call.error = exc
+                    raise
+            call.result = result
+            return result, followers > 0
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        """Number of calls currently running"""
+        return len(self._calls)
+
+
+def _own_error(error):
+    """Copy of the leader's error for one follower
+
+    Raising the shared instance from several threads would append their
+    frames to one traceback.
+    """
+    try:
+        # the copy is rebuilt from args and __dict__, without the traceback
+        return copy.copy(error)
+    except Exception:  # noqa: BLE001 - not every exception can be rebuilt
+        return RemoteDataError(f"Coalesced request failed: {error}")
+
+
+def request_key(session, url, params=None, headers=None):
+    """
+    Key identifying a GET request for coalescing
+
+    Requests sent through different sessions are never coalesced since the
+    sessions may carry different credentials or cookies.
+    """
+    headers = tuple(sorted((headers or {}).items()))
+    return id(session), normalize_url(url, params), headers
+
+
+def _load_body(response):
+    # reading ``content`` consumes a streamed body once so every caller can
+    # iterate over the shared bytes
+    _ = response.content
+    return response
+
+
+_group = SingleFlight()
+
+
+def coalesce(session, url, params, headers, func, timeout=None):
+    """
+    Send the request through ``func()`` unless an identical one is in flight
+
+    Returns the response of ``func()`` or a copy of the response of the
+    identical in-flight request. A caller waits at most ``timeout`` seconds
+    for that request before sending its own.
+    """
+    key = request_key(session, url, params, headers)
+    response, _ = _group.do(key, func, share=_load_body, timeout=timeout)
+    return response
@@ -0,0 +1,464 @@
+"""
+Local append-only store of reader results backed by Parquet.
+
+Data is laid out as ``<root>/<source>/<dataset>/year=<YYYY>/part-<n>.parquet``
+with a JSON manifest at ``<root>/manifest.json`` recording the date ranges
+already fetched and the files of each partition. :meth:`Store.get` serves
+requests from disk and only reads the ranges missing from the store from the
+provider. Writes only ever add files; on read, rows written later take
+precedence over earlier rows with the same index. Several processes can share
+a store: writes hold a lock file and update the manifest as found on disk.
+"""
+
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from pandas_datareader._utils import (
+    OfflineError,
+    _period_starts,
+    _sanitize_dates,
+    _to_dtype_backend,
+    _validate_dtype_backend,
+)
+from pandas_datareader.offline import is_offline
+
+__all__ = ["Store"]
+
+_FRAME = ""
+
+# a lock file older than this is left over from a crashed writer
+_STALE_LOCK = 60.0
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "Please install pyarrow if you want to use pandas_datareader.store"
+        ) from exc
+
+
+@contextmanager
+def _file_lock(path):
+    """Hold the lock file ``path``, excluding other processes and threads"""
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            pass
+        try:
+            if time.time() - os.path.getmtime(path) > _STALE_LOCK:
+                os.remove(path)
+                continue
+        except FileNotFoundError:
+            continue
+        time.sleep(0.01)
+    os.close(fd)
+    try:
+        yield
+    finally:
+        os.remove(path)
+
+
+def _dataset_name(name):
+    if isinstance(name, (list, tuple)):
+        return ",".join(str(n) for n in name)
+    return str(name)
+
+
+def _slug(name):
+    slug = re.sub(r"[^A-Za-z0-9._=-]+", "_", name).strip("._")[:64]
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}-{digest}" if slug != name else name
+
+
+def _label(value):
+    # JSON turns tuples into lists
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + pd.Timedelta(days=1):
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _missing_ranges(covered, start, end):
+    missing = []
+    cursor = start
+    for lo, hi in _merge_ranges(covered):
+        if hi < cursor:
+            continue
+        if lo > end:
+            break
+        if lo > cursor:
+            missing.append((cursor, lo - pd.Timedelta(days=1)))
+        cursor = max(cursor, hi + pd.Timedelta(days=1))
+        if cursor > end:
+            return missing
+    if cursor <= end:
+        missing.append((cursor, end))
+    return missing
+
+
+class Store:
+    """
+    Partitioned Parquet store of reader results
+
+    Parameters
+    ----------
+    path : str
+        Root directory of the store. Created if needed.
+
+    Examples
+    --------
+    >>> store = Store("~/pdr-store")  # doctest: +SKIP
+    >>> gdp = store.get("GDP", "fred", start="1990-01-01")  # doctest: +SKIP
+
+    The first call downloads and stores the series; later calls for the same
+    or a narrower range are served from disk, and wider ranges only download
+    the missing part.
+
+    Notes
+    -----
+    Requires the optional ``pyarrow`` package.
+    """
+
+    def __init__(self, path):
+        _import_pyarrow()
+        self.path = os.path.expanduser(path)
+        self._lock = threading.RLock()
+        os.makedirs(self.path, exist_ok=True)
+        self._manifest = self._load_manifest()
+
+    # manifest
+
+    @property
+    def _manifest_file(self):
+        return os.path.join(self.path, "manifest.json")
+
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_file, encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {"datasets": {}}
+
+    def _refresh(self):
+        # pick up datasets written by other Store instances or processes
+        with self._lock:
+            self._manifest = self._load_manifest()
+
+    def _save_manifest(self):
+        tmp = f"{self._manifest_file}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self._manifest, fh)
+        os.replace(tmp, self._manifest_file)
+
+    def _entry(self, source, dataset, create=False):
+        key = f"{source}/{dataset}"
+        datasets = self._manifest["datasets"]
+        if key not in datasets and create:
+            datasets[key] = {
+                "source": source,
+                "dataset": dataset,
+                "directory": os.path.join(source, _slug(dataset)),
+                "kind": "frame",
+                "ranges": [],
+                "tables": [],
+                "extra": {},
+            }
+        return datasets.get(key)
+
+    def datasets(self):
+        """DataFrame listing the stored datasets and their covered ranges"""
+        self._refresh()
+        rows = [
+            (
+                entry["source"],
+                entry["dataset"],
+                pd.Timestamp(entry["ranges"][0][0]) if entry["ranges"] else pd.NaT,
+                pd.Timestamp(entry["ranges"][-1][1]) if entry["ranges"] else pd.NaT,
+            )
+            for entry in self._manifest["datasets"].values()
+        ]
+        return pd.DataFrame(rows, columns=["source", "dataset", "start", "end"])
+
+    def covered(self, source, name):
+        """List of ``(start, end)`` ranges of ``name`` held in the store"""
+        self._refresh()
+        entry = self._entry(source, _dataset_name(name))
+        if entry is None:
+            return []
+        return [(pd.Timestamp(lo), pd.Timestamp(hi)) for lo, hi in entry["ranges"]]
+
+    # writing
+
+    @staticmethod
+    def _table(entry, key):
+        for table in entry["tables"]:
+            if table["key"] == key:
+                return table
+        table = {
+            "key": key,
+            "index": [],
+            "columns": [],
+            "column_names": [],
+            "parts": {},
+        }
+        entry["tables"].append(table)
+        return table
+
+    def _write_table(self, entry, table, df):
+        labels = [_label(label) for label in table["columns"]]
+        for label in df.columns:
+            if label not in labels:
+                labels.append(label)
+                table["columns"].append(label)
+        stored = {label: f"c{labels.index(label)}" for label in df.columns}
+        table["column_names"] = list(df.columns.names)
+        index_names = [f"i{n}" for n in range(df.index.nlevels)]
+        table["index"] = list(df.index.names)
+
+        frame = df.copy(deep=False)
+        frame.columns = [stored[label] for label in df.columns]
+        frame.index = frame.index.set_names(index_names)
+        frame = frame.reset_index()
+        years = _period_starts(df.index).year
+        directory = os.path.join(self.path, entry["directory"])
+        for year in sorted(years.dropna().unique()):
+            year = int(year)
+            partition = f"year={year}"
+            part = os.path.join(partition, f"part-{uuid.uuid4().hex}.parquet")
+            os.makedirs(os.path.join(directory, partition), exist_ok=True)
+            rows = frame[np.asarray(years == year)]
+            rows.to_parquet(os.path.join(directory, part), index=False)
+            table["parts"].setdefault(str(year), []).append(part)
+
+    def write(self, data, source, name, start=None, end=None):
+        """
+        Append reader output to the store
+
+        Parameters
+        ----------
+        data : DataFrame or dict
+            Result of a reader. Dicts, as returned by the Fama/French reader,
+            have their DataFrame values stored as separate tables and their
+            other values kept in the manifest.
+        source : str
+            Data source name.
+        name : str or list of str
+            Dataset name passed to the reader.
+        start, end : optional
+            Range the data was requested for. Defaults to the range of the
+            index of ``data``.
+        """
+        dataset = _dataset_name(name)
+        with self._lock, _file_lock(f"{self._manifest_file}.lock"):
+            # start from the manifest on disk to keep other writers' changes
+            self._refresh()
+            entry = self._entry(source, dataset, create=True)
+            if isinstance(data, dict):
+                entry["kind"] = "dict"
+                tables = {k: v for k, v in data.items() if isinstance(v, pd.DataFrame)}
+                entry["extra"].update(
+                    {str(k): v for k, v in data.items() if k not in tables}
+                )
+            else:
+                tables = {_FRAME: data}
+            stamps = []
+            for key, df in tables.items():
+                self._write_table(entry, self._table(entry, key), df)
+                if len(df):
+                    periods = _period_starts(df.index)
+                    stamps.extend([periods.min(), periods.max()])
+            if start is None and stamps:
+                start = min(stamps)
+            if end is None and stamps:
+                end = max(stamps)
+            if start is not None and end is not None:
+                ranges = [
+                    [pd.Timestamp(lo), pd.Timestamp(hi)] for lo, hi in entry["ranges"]
+                ]
+                ranges.append([pd.Timestamp(start), pd.Timestamp(end)])
+                entry["ranges"] = [
+                    [lo.isoformat(), hi.isoformat()] for lo, hi in _merge_ranges(ranges)
+                ]
+            self._save_manifest()
+
+    # reading
+
+    def _read_table(self, entry, table, start, end, columns):
+        labels = [_label(label) for label in table["columns"]]
+        index_cols = [f"i{n}" for n in range(len(table["index"]))]
+        wanted = labels if columns is None else [c for c in labels if c in columns]
+        stored = [f"c{labels.index(label)}" for label in wanted]
+
+        years = sorted(int(year) for year in table["parts"])
+        if start is not None:
+            years = [year for year in years if year >= start.year]
+        if end is not None:
+            years = [year for year in years if year <= end.year]
+        directory = os.path.join(self.path, entry["directory"])
+        frames = []
+        for year in years:
+            for part in table["parts"][str(year)]:
+                filename = os.path.join(directory, part)
+                frames.append(self._read_part(filename, index_cols, stored, start, end))
+
+        if frames:
+            frame = pd.concat(frames, ignore_index=True)
+        else:
+            frame = pd.DataFrame(columns=index_cols + stored)
+        for col in stored:
+            if col not in frame:
+                frame[col] = float("nan")
+        # parts are read in write order, so later writes win
+        frame = frame.set_index(index_cols)[stored]
+        frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+        frame.index = frame.index.set_names(table["index"])
+        if any(isinstance(label, tuple) for label in wanted):
+            frame.columns = pd.MultiIndex.from_tuples(
+                wanted, names=table["column_names"]
+            )
+        else:
+            frame.columns = pd.Index(wanted, name=table["column_names"][0])
+        if len(frame) and (start is not None or end is not None):
+            periods = _period_starts(frame.index)
+            keep = np.ones(len(frame), dtype=bool)
+            if start is not None:
+                keep &= periods >= start
+            if end is not None:
+                keep &= periods <= end
+            frame = frame[keep]
+        return frame
+
+    @staticmethod
+    def _read_part(filename, index_cols, stored, start, end):
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(filename)
+        names = set(schema.names)
+        filters = None
+        first = schema.field(index_cols[0]).type
+        # prune row groups on the date column where the type allows it
+        if str(first).startswith("timestamp") and not (start is None and end is None):
+            filters = []
+            if start is not None:
+                filters.append((index_cols[0], ">=", start))
+            if end is not None:
+                filters.append((index_cols[0], "<=", end))
+        return pd.read_parquet(
+            filename,
+            columns=index_cols + [col for col in stored if col in names],
+            filters=filters,
+        )
+
+    def read(self, source, name, start=None, end=None, columns=None):
+        """
+        Read a dataset from the store without touching the network
+
+        Parameters
+        ----------
+        source : str
+            Data source name.
+        name : str or list of str
+            Dataset name passed to the reader.
+        start, end : optional
+            Row range. Only the year partitions and row groups overlapping
+            it are read.
+        columns : list, optional
+            Columns to read. Other columns are not loaded from disk.
+
+        Returns
+        -------
+        DataFrame or dict
+            A dict for datasets written from a dict.
+        """
+        self._refresh()
+        entry = self._entry(source, _dataset_name(name))
+        if entry is None:
+            raise KeyError(f"{source}/{_dataset_name(name)} is not in the store")
+        start = None if start is None else pd.Timestamp(start)
+        end = None if end is None else pd.Timestamp(end)
+        tables = {
+            table["key"]: self._read_table(entry, table, start, end, columns)
+            for table in entry["tables"]
+        }
+        if entry["kind"] == "dict":
+            return {**tables, **entry["extra"]}
+        return tables[_FRAME]
+
+    def get(
+        self,
+        name,
+        data_source,
+        start=None,
+        end=None,
+        columns=None,
+        dtype_backend=None,
+        offline=None,
+        **kwargs,
+    ):
+        """
+        Read a dataset, downloading only the ranges missing from the store
+
+        Parameters
+        ----------
+        name : str or list of str
+            Dataset name, as passed to ``DataReader``.
+        data_source : str
+            Data source, as passed to ``DataReader``.
+        start, end : optional
+            Requested range, with the ``DataReader`` defaults.
+        columns : list, optional
+            Columns to return.
+        dtype_backend : {None, 'numpy_nullable', 'pyarrow'}, optional
+            Dtypes of the returned data. The store itself always holds the
+            data as read with the default dtypes.
+        offline : bool, optional
+            Return only the stored rows of the range, without downloading
+            the rest, and raise ``OfflineError`` if the dataset is not in the
+            store. None follows :func:`pandas_datareader.offline.is_offline`.
+        kwargs
+            Passed to the reader for missing ranges, e.g. ``retry_count``,
+            ``session`` or ``api_key``.
+        """
+        from pandas_datareader.data import _make_reader
+
+        _validate_dtype_backend(dtype_backend)
+        start, end = _sanitize_dates(start, end)
+        missing = _missing_ranges(self.covered(data_source, name), start, end)
+        if is_offline(offline):
+            if self._entry(data_source, _dataset_name(name)) is None:
+                raise OfflineError(
+                    f"Offline mode: {data_source}/{_dataset_name(name)} "
+                    "is not in the store"
+                )
+            missing = []
+        for lo, hi in missing:
+            reader = _make_reader(
+                name, data_source, start=lo, end=hi, offline=offline, **kwargs
+            )
+            try:
+                data = reader.read()
+            finally:
+                reader.close()
+            self.write(data, data_source, name, start=lo, end=hi)
+        data = self.read(data_source, name, start=start, end=end, columns=columns)
+        return _to_dtype_backend(data, dtype_backend)
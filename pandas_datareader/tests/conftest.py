@@ -0,0 +1,65 @@
+import json
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from pandas_datareader import base
+
+
+class DummyResponse:
+    """Stand-in for the ``requests.Response`` of a faked ``session.get``"""
+
+    encoding = "utf-8"
+
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        # hooks count bytes from _content, which streamed bodies leave unset
+        self._content = content
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.closed = False
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding)
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        self.closed = True
+
+
+def fake_get(monkeypatch, session, responses, calls=None, default=None):
+    """
+    Answer ``session.get`` with ``responses`` in turn
+
+    Items are DummyResponse objects, status codes, or exceptions to raise.
+    ``default`` answers once they run out. ``calls`` collects the url and
+    keyword arguments of every request.
+    """
+
+    def get(url, **kwargs):
+        if calls is not None:
+            calls.append((url, kwargs))
+        answer = responses.pop(0) if responses else default
+        if isinstance(answer, Exception):
+            raise answer
+        if isinstance(answer, int):
+            return DummyResponse(answer)
+        return answer
+
+    monkeypatch.setattr(session, "get", get)
+    return session
+
+
+def make_reader(
+    monkeypatch, responses, cls=base._BaseReader, calls=None, default=None, **kwargs
+):
+    """Reader without pauses whose requests are answered by :func:`fake_get`"""
+    kwargs.setdefault("pause", 0)
+    reader = cls([], **kwargs)
+    reader.session = fake_get(
+        monkeypatch, requests.Session(), responses, calls, default
+    )
+    return reader
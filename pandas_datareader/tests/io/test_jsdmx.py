@@ -72,6 +72,24 @@ def test_tourism(dirpath):
     tm.assert_frame_equal(jp[visitors], expected)
 
 
+def test_tourism_pyarrow(dirpath):
+    pytest.importorskip("pyarrow")
+    path = os.path.join(dirpath, "jsdmx", "tourism.json")
+    expected = read_jsdmx(path)
+    result = read_jsdmx(path, dtype_backend="pyarrow")
+
+    # missing observations make the NumPy result object, Arrow keeps floats
+    assert (expected.dtypes == object).all()
+    assert (result.dtypes == "double[pyarrow]").all()
+    assert str(result.columns.levels[0].dtype).startswith("dictionary<")
+    tm.assert_index_equal(result.index, expected.index)
+    tm.assert_frame_equal(
+        result.astype(object).where(result.notna(), None),
+        expected.where(expected.notna(), None),
+        check_column_type=False,
+    )
+
+
 def test_land_use(dirpath):
     # OECD -> Environment -> Resources Land Use
     result = read_jsdmx(os.path.join(dirpath, "jsdmx", "land_use.json"))
@@ -1,13 +1,18 @@
 # pylint: disable-msg=E1101,W0613,W0603
 
+from io import BytesIO
 import os
+import zipfile
 
 import numpy as np
 import pandas as pd
 from pandas import testing as tm
 import pytest
 
+from pandas_datareader import retry
+from pandas_datareader.io import sdmx
 from pandas_datareader.io.sdmx import _read_sdmx_dsd, read_sdmx
+from pandas_datareader.offline import OfflineError
 
 pytestmark = pytest.mark.stable
 
@@ -38,3 +43,81 @@ def test_tourism(dirpath):
     values = np.array([[20.38, 25.1, 27.77, 38.1], [25.49, np.nan, 39.05, np.nan]])
     expected = pd.DataFrame(values, index=exp_idx, columns=exp_col)
     tm.assert_frame_equal(df, expected)
+
+
+def test_tourism_pyarrow(dirpath):
+    pytest.importorskip("pyarrow")
+    dsd = _read_sdmx_dsd(os.path.join(dirpath, "sdmx", "DSD_cdh_e_fos.xml"))
+    path = os.path.join(dirpath, "sdmx", "cdh_e_fos.xml")
+    expected = read_sdmx(path, dsd=dsd)
+    result = read_sdmx(path, dsd=dsd, dtype_backend="pyarrow")
+
+    assert (result.dtypes == "double[pyarrow]").all()
+    assert str(result.columns.levels[0].dtype).startswith("dictionary<")
+    tm.assert_index_equal(result.index, expected.index)
+    tm.assert_frame_equal(
+        result.astype("float64"),
+        expected,
+        check_column_type=False,
+        check_index_type=False,
+    )
+
+
+def test_read_sdmx_file_like(dirpath):
+    path = os.path.join(dirpath, "sdmx", "DSD_cdh_e_fos.xml")
+    with open(path, "rb") as fh:
+        dsd = _read_sdmx_dsd(fh)
+    expected = read_sdmx(os.path.join(dirpath, "sdmx", "cdh_e_fos.xml"), dsd=dsd)
+    with open(os.path.join(dirpath, "sdmx", "cdh_e_fos.xml"), "rb") as fh:
+        result = read_sdmx(fh, dsd=dsd)
+    tm.assert_frame_equal(result, expected)
+
+
+ZIPPED_NOTICE = (
+    '<message:Error xmlns:message="http://www.sdmx.org/resources/sdmxml/'
+    'schemas/v2_1/message" xmlns:common="http://www.sdmx.org/resources/'
+    'sdmxml/schemas/v2_1/common"><common:Text>413</common:Text>'
+    "<common:Text>https://example.com/data.zip</common:Text></message:Error>"
+)
+
+
+def test_zipped_poll_deadline(monkeypatch):
+    now = [0.0]
+    fetched = []
+
+    def not_ready(url):
+        fetched.append(url)
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(sdmx.time, "sleep", sleep)
+
+    with pytest.raises(retry.DeadlineExceededError, match="data.zip"):
+        read_sdmx(ZIPPED_NOTICE, deadline=3.5, fetch=not_ready)
+    assert fetched == ["https://example.com/data.zip"] * 4
+
+
+def test_zipped_fetch(dirpath, monkeypatch):
+    dsd = _read_sdmx_dsd(os.path.join(dirpath, "sdmx", "DSD_cdh_e_fos.xml"))
+    with open(os.path.join(dirpath, "sdmx", "cdh_e_fos.xml"), "rb") as fh:
+        xml = fh.read()
+    archive = BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("data.xml", xml)
+    responses = [None, archive.getvalue()]
+    monkeypatch.setattr(sdmx.time, "sleep", lambda seconds: None)
+
+    result = read_sdmx(ZIPPED_NOTICE, dsd=dsd, fetch=lambda url: responses.pop(0))
+    tm.assert_frame_equal(result, read_sdmx(xml, dsd=dsd))
+    assert responses == []
+
+
+def test_zipped_offline(monkeypatch):
+    def download(url):
+        raise AssertionError("no download in offline mode")
+
+    monkeypatch.setattr(sdmx, "_read_zipped_sdmx", download)
+    with pytest.raises(OfflineError, match="data.zip"):
+        read_sdmx(ZIPPED_NOTICE, offline=True)
@@ -0,0 +1,59 @@
+import pytest
+import requests
+
+from pandas_datareader import retry
+from pandas_datareader.macro.base import MacroClientBase, with_deadline
+from pandas_datareader.tests.conftest import DummyResponse
+
+
+class Client(MacroClientBase):
+    @with_deadline
+    def read(self, dataset, **kwargs):
+        return [self._get(f"https://example.com/{dataset}/{n}") for n in range(2)]
+
+    @with_deadline
+    def describe_dataset(self, dataset, **kwargs):
+        return self.read(dataset)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _client(monkeypatch, clock, seconds_per_request, deadline=5):
+    client = Client(session=requests.Session(), deadline=deadline)
+    timeouts = []
+
+    def get(url, timeout=None, **kwargs):
+        timeouts.append(timeout)
+        clock[0] += seconds_per_request
+        return DummyResponse()
+
+    monkeypatch.setattr(client.session, "get", get)
+    return client, timeouts
+
+
+def test_deadline_spans_requests(monkeypatch, clock):
+    client, timeouts = _client(monkeypatch, clock, 2)
+    client.read("a")
+    assert timeouts == [5, 3]
+
+    # each public call has its own budget, shared with nested calls
+    client.describe_dataset("a")
+    assert timeouts[2:] == [5, 3]
+
+
+def test_deadline_exceeded(monkeypatch, clock):
+    client, timeouts = _client(monkeypatch, clock, 6)
+    with pytest.raises(retry.DeadlineExceededError, match="example.com/a/1"):
+        client.read("a")
+    assert timeouts == [5]
+
+
+def test_no_deadline(monkeypatch, clock):
+    client, timeouts = _client(monkeypatch, clock, 60, deadline=None)
+    client.read("a")
+    assert timeouts == [30, 30]
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from pandas_datareader.macro import eurostat
 from pandas_datareader.macro.eurostat import EurostatClient
 
 
@@ -146,3 +147,18 @@ def test_build_result_from_payload():
     pd.testing.assert_frame_equal(result.data, expected)
     assert result.provider == "eurostat"
     assert result.metadata["updated_at"] == "2026-01-08T11:00:00+0100"
+
+
+def test_offline_flag_reaches_read_sdmx(monkeypatch):
+    seen = {}
+    read_sdmx = eurostat.read_sdmx
+
+    def record(*args, **kwargs):
+        seen.update(kwargs)
+        return read_sdmx(*args, **kwargs)
+
+    monkeypatch.setattr(eurostat, "read_sdmx", record)
+    EurostatClient(offline=False)._build_result_from_payload(
+        "ert_h_eur_a", EUROSTAT_DATA_XML, EUROSTAT_DSD_XML
+    )
+    assert seen["offline"] is False
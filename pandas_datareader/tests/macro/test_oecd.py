@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 from pandas_datareader.macro.oecd import OECDClient
 
@@ -133,3 +134,20 @@ def test_build_result_from_payload():
     assert result.provider == "oecd"
     assert result.metadata["title"] == "Trade union density"
     assert "dimensions" in result.metadata
+
+
+def test_build_result_from_payload_pyarrow():
+    pytest.importorskip("pyarrow")
+    client = OECDClient(dtype_backend="pyarrow")
+    result = client._build_result_from_payload(
+        "OECD.ELS.SAE,DSD_TUD_CBC@DF_CBC,1.0", OECD_PAYLOAD
+    )
+    expected = OECDClient()._build_result_from_payload(
+        "OECD.ELS.SAE,DSD_TUD_CBC@DF_CBC,1.0", OECD_PAYLOAD
+    )
+
+    assert (result.data.dtypes == "double[pyarrow]").all()
+    assert str(result.data.columns.levels[0].dtype).startswith("dictionary<")
+    pd.testing.assert_frame_equal(
+        result.data.astype("float64"), expected.data, check_column_type=False
+    )
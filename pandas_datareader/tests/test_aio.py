@@ -0,0 +1,130 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from pandas_datareader._utils import RemoteDataError
+from pandas_datareader.aio import aread_many
+from pandas_datareader.bankofcanada import BankOfCanadaReader
+from pandas_datareader.fred import FredReader
+from pandas_datareader.oecd import OECDReader
+from pandas_datareader.wb import WorldBankReader
+
+httpx = pytest.importorskip("httpx")
+
+pytestmark = pytest.mark.stable
+
+FRED_CSV = {
+    "GDP": "observation_date,GDP\n2020-01-01,1.0\n2020-04-01,2.0\n",
+    "CPI": "observation_date,CPI\n2020-01-01,3.0\n2020-02-01,.\n",
+}
+
+
+def fred_handler(request):
+    name = request.url.params["id"]
+    if name not in FRED_CSV:
+        return httpx.Response(404, text="not found")
+    return httpx.Response(200, text=FRED_CSV[name])
+
+
+def _client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _run(reader, handler):
+    async def main():
+        async with _client(handler) as client:
+            return await reader.aread(client=client)
+
+    return asyncio.run(main())
+
+
+class TestAsyncReaders:
+    def test_fred_aread_matches_parser(self):
+        reader = FredReader(["GDP", "CPI"], start="2019-01-01", end="2021-01-01")
+        result = _run(reader, fred_handler)
+        assert list(result.columns) == ["GDP", "CPI"]
+        assert result.loc["2020-04-01", "GDP"] == 2.0
+        assert pd.isnull(result.loc["2020-02-01", "CPI"])
+        assert reader.async_client is None
+
+    def test_aread_retries_without_blocking(self):
+        calls = {"count": 0}
+
+        def handler(request):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise httpx.ConnectError("temporary failure")
+            return fred_handler(request)
+
+        reader = FredReader("GDP", start="2019-01-01", end="2021-01-01", pause=0)
+        result = _run(reader, handler)
+        assert calls["count"] == 2
+        assert len(result) == 2
+
+    def test_aread_raises_remote_data_error(self):
+        reader = FredReader("BAD", retry_count=1, pause=0)
+        with pytest.raises(RemoteDataError, match="Unable to read URL"):
+            _run(reader, fred_handler)
+
+    def test_bankofcanada_sanitize_hook(self):
+        body = (
+            '"TERMS AND CONDITIONS"\n\nOBSERVATIONS\n"date","FXUSDCAD"\n'
+            '"2020-01-02","1.2965"\n"2020-01-03","1.2986"\n\nERRORS\n'
+        )
+
+        def handler(request):
+            assert request.url.params["start_date"] == "2020-01-01"
+            return httpx.Response(200, text=body)
+
+        reader = BankOfCanadaReader("FXUSDCAD", start="2020-01-01", end="2020-01-10")
+        result = _run(reader, handler)
+        assert result["FXUSDCAD"].tolist() == [1.2986, 1.2965]
+
+    def test_oecd_json_format(self, datapath):
+        with open(datapath("io", "data", "jsdmx", "tourism.json"), "rb") as fh:
+            body = fh.read()
+        reader = OECDReader("TOURISM_INBOUND", start="2008-01-01", end="2012-01-01")
+        result = _run(reader, lambda request: httpx.Response(200, content=body))
+        assert len(result) > 0
+
+    def test_wb_indicator_errors(self):
+        payload = [
+            {"page": 1, "total": 1},
+            [{"country": {"value": "Canada", "id": "CA"}, "date": "2010", "value": 1}],
+        ]
+        missing = [{"message": [{"key": "Invalid value", "value": "bad"}]}]
+
+        def handler(request):
+            if "BAD" in request.url.path:
+                return httpx.Response(200, json=missing)
+            return httpx.Response(200, json=payload)
+
+        reader = WorldBankReader(["GOOD", "BAD"], countries="CA", start=2010, end=2010)
+        with pytest.warns(UserWarning, match="Indicator: BAD"):
+            result = _run(reader, handler)
+        assert list(result.columns) == ["GOOD"]
+
+    def test_aread_many_preserves_order(self):
+        readers = [
+            FredReader(name, start="2019-01-01", end="2021-01-01")
+            for name in ["CPI", "GDP", "BAD"]
+        ]
+        for reader in readers:
+            reader.retry_count = 0
+
+        async def main():
+            async with _client(fred_handler) as client:
+                return await aread_many(
+                    readers, max_concurrency=2, client=client, return_exceptions=True
+                )
+
+        results = asyncio.run(main())
+        assert list(results[0].columns) == ["CPI"]
+        assert list(results[1].columns) == ["GDP"]
+        assert isinstance(results[2], RemoteDataError)
+
+    def test_aget_response_requires_client(self):
+        reader = FredReader("GDP")
+        with pytest.raises(RuntimeError):
+            asyncio.run(reader._aget_response(reader.url))
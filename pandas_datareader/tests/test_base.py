@@ -1,9 +1,13 @@
 import datetime as dt
+import io
+import threading
 
+import pandas as pd
 import pytest
 import requests
 
 from pandas_datareader import base as base
+from pandas_datareader._utils import RemoteDataError, SymbolWarning
 
 pytestmark = pytest.mark.stable
 
@@ -55,8 +59,184 @@ class TestBaseReader:
         assert calls["count"] == 2
 
 
+class ChunkedBody(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return super().read(size)
+
+
+def _streamed_response(body):
+    response = requests.Response()
+    response.status_code = requests.codes.ok
+    response.encoding = "utf-8"
+    response.raw = ChunkedBody(body)
+    return response
+
+
+class TestStreaming:
+    def _reader(self, monkeypatch, body, fmt="string"):
+        reader = base._BaseReader([], pause=0)
+        reader._format = fmt
+        reader._chunk_size = 16
+        reader.session = requests.Session()
+        response = _streamed_response(body)
+        streams = []
+
+        def get(url, **kwargs):
+            streams.append(kwargs["stream"])
+            return response
+
+        monkeypatch.setattr(reader.session, "get", get)
+        return reader, response, streams
+
+    def test_csv_streamed_in_chunks(self, monkeypatch):
+        body = b"Date,Close\n" + b"".join(
+            f"2020-01-{day:02d},{day}.5\n".encode() for day in range(1, 29)
+        )
+        reader, response, streams = self._reader(monkeypatch, body)
+        result = reader._read_one_data("https://example.com", None)
+        assert streams == [True]
+        assert response.raw.reads and max(response.raw.reads) == 16
+        assert len(result) == 28
+        assert result["Close"].iloc[0] == 28.5
+
+    def test_json_streamed(self, monkeypatch):
+        reader, _, streams = self._reader(monkeypatch, b'{"a": [1, 2, 3]}', fmt="json")
+        monkeypatch.setattr(reader, "_read_lines", lambda out: out)
+        assert reader._read_one_data("https://example.com", None) == {"a": [1, 2, 3]}
+        assert streams == [True]
+
+    def test_empty_stream(self, monkeypatch):
+        reader, _, _ = self._reader(monkeypatch, b"")
+        with pytest.raises(OSError, match="returned no data"):
+            reader._read_one_data("https://example.com", None)
+
+    def test_custom_sanitize_is_not_streamed(self, monkeypatch):
+        class Reader(base._BaseReader):
+            @staticmethod
+            def _sanitize_response(response):
+                return response.content.replace(b";", b",")
+
+        reader = Reader([], pause=0)
+        assert not reader._can_stream()
+        assert base._BaseReader([])._can_stream()
+
+
 class TestDailyBaseReader:
     def test_get_params(self):
         b = base._DailyBaseReader()
         with pytest.raises(NotImplementedError):
             b._get_params()
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError):
+            base._DailyBaseReader(max_workers=0)
+        with pytest.raises(ValueError):
+            base._DailyBaseReader(max_workers="many")
+
+    @staticmethod
+    def _reader(max_workers, barrier=None, bad=()):
+        class DummyReader(base._DailyBaseReader):
+            url = "https://example.com"
+
+            def _get_params(self, symbol):
+                return symbol
+
+            def _read_one_data(self, url, params):
+                if barrier is not None:
+                    barrier.wait()
+                if params in bad:
+                    raise OSError(params)
+                index = pd.to_datetime(["2020-01-01", "2020-01-02"])
+                return pd.DataFrame({"Close": [1.0, 2.0]}, index=index)
+
+        return DummyReader(chunksize=2, max_workers=max_workers, pause=0)
+
+    def test_dl_mult_symbols(self):
+        symbols = ["C", "A", "B"]
+        result = self._reader(None)._dl_mult_symbols(symbols)
+        assert result.columns.names == ["Attributes", "Symbols"]
+        assert list(result["Close"].columns) == symbols
+
+    def test_dl_mult_symbols_concurrent(self):
+        # both symbols of a chunk must be in flight together to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        symbols = ["C", "A", "B", "D"]
+        result = self._reader(2, barrier=barrier)._dl_mult_symbols(symbols)
+        expected = self._reader(None)._dl_mult_symbols(symbols)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_dl_mult_symbols_concurrent_failures(self):
+        reader = self._reader(4, bad=("B", "D"))
+        with pytest.warns(SymbolWarning) as record:
+            result = reader._dl_mult_symbols(["A", "B", "C", "D"])
+        messages = [str(w.message) for w in record]
+        assert "'B'" in messages[0] and "'D'" in messages[1]
+        assert list(result["Close"].columns) == ["A", "B", "C", "D"]
+        assert result["Close"]["B"].isna().all()
+        assert result["Close"]["A"].notna().all()
+
+        reader = self._reader(4, bad=("A", "B"))
+        with pytest.warns(SymbolWarning), pytest.raises(RemoteDataError):
+            reader._dl_mult_symbols(["A", "B"])
+
+    def test_iter_read(self):
+        reader = self._reader(None, bad=("B",))
+        reader.symbols = ["C", "B", "A"]
+        with pytest.warns(SymbolWarning, match="'B'"):
+            pairs = list(reader.iter_read())
+        assert [symbol for symbol, _ in pairs] == ["C", "A"]
+        single = self._reader(None)._read_symbol("C")
+        pd.testing.assert_frame_equal(pairs[0][1], single)
+
+    def test_iter_read_completion_order(self):
+        taken = threading.Event()
+
+        class Reader(base._DailyBaseReader):
+            url = "https://example.com"
+
+            def _get_params(self, symbol):
+                return symbol
+
+            def _read_one_data(self, url, params):
+                # A only finishes once B has been handed to the caller
+                if params == "A":
+                    assert taken.wait(5)
+                return pd.DataFrame({"Close": [1.0]})
+
+        pairs = Reader(["A", "B"], max_workers=2, pause=0).iter_read()
+        first, _ = next(pairs)
+        taken.set()
+        assert [first] + [symbol for symbol, _ in pairs] == ["B", "A"]
+
+
+class TestImapUnordered:
+    def test_in_order_without_workers(self):
+        result = list(base._imap_unordered(lambda x: x * 2, [3, 1, 2]))
+        assert result == [(3, 6), (1, 2), (2, 4)]
+
+    def test_bounded_results(self):
+        started = []
+
+        def func(item):
+            started.append(item)
+            return item
+
+        results = base._imap_unordered(func, range(20), max_workers=2)
+        first = next(results)
+        # two calls in flight plus one started when the first was taken
+        assert len(started) <= 3
+        assert sorted([first] + list(results)) == [(i, i) for i in range(20)]
+
+    def test_errors_propagate(self):
+        def func(item):
+            if item == 2:
+                raise OSError("boom")
+            return item
+
+        with pytest.raises(OSError, match="boom"):
+            list(base._imap_unordered(func, range(5), max_workers=2))
@@ -1,8 +1,15 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
 from pandas import DataFrame
 import pytest
 
 import pandas_datareader as pdr
-from pandas_datareader.data import DataReader
+from pandas_datareader import data, registry
+from pandas_datareader._utils import RemoteDataError
+from pandas_datareader.data import DataReader, read_batch
 
 pytestmark = pytest.mark.stable
 
@@ -41,3 +48,164 @@ class TestDataReader:
         assert not hasattr(pdr, "get_data_yahoo")
         assert not hasattr(pdr, "get_data_tiingo")
         assert not hasattr(pdr, "get_quote_yahoo")
+
+
+class DummyReader:
+    lock = threading.Lock()
+    # bookkeeping shared by every instance, set up by the dummy_sources fixture
+    active = peak = calls = None
+
+    def __init__(self, symbols, source="dummy", fail=False, **kwargs):
+        self.symbols = symbols
+        self.source = source
+        self.fail = fail
+        self.kwargs = kwargs
+
+    def read(self):
+        cls = type(self)
+        with cls.lock:
+            cls.calls.append((self.source, self.symbols, self.kwargs))
+            cls.active[self.source] = cls.active.get(self.source, 0) + 1
+            cls.peak[self.source] = max(
+                cls.peak.get(self.source, 0), cls.active[self.source]
+            )
+        time.sleep(0.01)
+        with cls.lock:
+            cls.active[self.source] -= 1
+        if self.fail:
+            raise RemoteDataError(f"Unable to read {self.symbols}")
+        return DataFrame({self.symbols: [1.0]})
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def dummy_sources(monkeypatch):
+    DummyReader.active, DummyReader.peak, DummyReader.calls = {}, {}, []
+
+    def factory(source):
+        return lambda **kwargs: DummyReader(source=source, **kwargs)
+
+    monkeypatch.setattr(
+        registry, "_sources", {"fred": factory("fred"), "oecd": factory("oecd")}
+    )
+    monkeypatch.setattr(registry, "_entry_points_loaded", True)
+    return DummyReader
+
+
+class TestReaderOptions:
+    def test_passed_to_reader_only_when_set(self, dummy_sources):
+        DataReader("GDP", "fred")
+        DataReader("GDP", "fred", dtype_backend="pyarrow")
+        first, second = (kwargs for _, _, kwargs in dummy_sources.calls)
+        assert "dtype_backend" not in first
+        assert second["dtype_backend"] == "pyarrow"
+
+    def test_output_passed_only_when_set(self, dummy_sources):
+        DataReader("GDP", "fred")
+        DataReader("GDP", "fred", output="long")
+        first, second = (kwargs for _, _, kwargs in dummy_sources.calls)
+        assert "output" not in first
+        assert second["output"] == "long"
+        with pytest.raises(ValueError, match="store"):
+            DataReader("GDP", "fred", output="long", store=object())
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="dtype_backend"):
+            DataReader("GDP", "fred", dtype_backend="arrow")
+
+
+class TestReadBatch:
+    def test_results_in_request_order(self, dummy_sources):
+        specs = [("B", "fred"), ("A", "oecd"), ("C", "fred")]
+        batch = read_batch(specs, start="2020-01-01")
+
+        assert batch.ok
+        assert list(batch.results) == [("fred", "B"), ("oecd", "A"), ("fred", "C")]
+        assert list(batch.results[("oecd", "A")].columns) == ["A"]
+        assert all(kw["start"] == "2020-01-01" for _, _, kw in dummy_sources.calls)
+
+    def test_errors_reported(self, dummy_sources):
+        specs = [
+            {"name": "GDP", "data_source": "fred", "key": "gdp"},
+            {"name": "BAD", "data_source": "fred", "fail": True},
+            ("X", "unknown"),
+        ]
+        batch = read_batch(specs)
+
+        assert list(batch.results) == ["gdp"]
+        assert not batch.ok
+        assert isinstance(batch.errors[("fred", "BAD")], RemoteDataError)
+        assert isinstance(batch.errors[("unknown", "X")], NotImplementedError)
+        report = batch.error_report()
+        assert report["data_source"].tolist() == ["fred", "unknown"]
+        assert report["error"].tolist() == ["RemoteDataError", "NotImplementedError"]
+
+    def test_source_concurrency(self, dummy_sources):
+        specs = [(f"F{i}", "fred") for i in range(12)]
+        specs += [(f"O{i}", "oecd") for i in range(6)]
+        read_batch(specs, max_workers=8, source_concurrency={"fred": 3, "oecd": 1})
+        assert dummy_sources.peak["fred"] <= 3
+        assert dummy_sources.peak["oecd"] == 1
+
+    def test_options_override(self, dummy_sources):
+        read_batch([("GDP", "fred", {"pause": 1})], pause=0)
+        assert dummy_sources.calls[0][2]["pause"] == 1
+
+    def test_duplicate_keys(self, dummy_sources):
+        with pytest.raises(ValueError, match="Duplicate"):
+            read_batch([("GDP", "fred"), ("GDP", "fred")])
+
+    def test_datareader_batch(self):
+        assert DataReader.batch is read_batch
+        assert pdr.read_batch is read_batch
+
+
+class TestUpdate:
+    @pytest.fixture
+    def source(self, monkeypatch):
+        calls = []
+
+        class Reader:
+            def __init__(self, symbols, start=None, end=None, **kwargs):
+                calls.append((symbols, start, end))
+                self.start = start
+
+            def read(self):
+                idx = pd.date_range("2020-01-01", periods=6, freq="MS")
+                df = DataFrame({"A": range(6), "B": range(10, 16)}, index=idx)
+                return df.loc[self.start :] if self.start is not None else df
+
+            def close(self):
+                pass
+
+        monkeypatch.setitem(registry._sources, "dummy", Reader)
+        return calls
+
+    def test_update_reads_tail(self, source):
+        full = DataReader("AB", "dummy")
+        existing = full.iloc[:4].copy()
+        existing.iloc[3, 1] = np.nan
+
+        result = DataReader.update(existing, "AB", "dummy", end="2020-12-31")
+
+        # B was last observed in March
+        assert source[-1] == ("AB", pd.Timestamp("2020-03-01"), "2020-12-31")
+        expected = full.astype({"B": float})
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    def test_update_empty_reads_full_range(self, source):
+        result = data.update(DataFrame(), "AB", "dummy", start="2019-01-01")
+        assert source[-1][1] == "2019-01-01"
+        assert len(result) == 6
+
+    def test_econdb_pushes_dates(self):
+        from pandas_datareader.econdb import EcondbReader
+
+        reader = EcondbReader(
+            "ticker=CPIUS", start="2020-01-01", end="2020-06-30", api_key="key"
+        )
+        assert "&from=2020-01-01&to=2020-06-30" in reader.url
+        reader = EcondbReader("ticker=CPIUS&from=2021-01-01", api_key="key")
+        assert reader.url.count("from=") == 1
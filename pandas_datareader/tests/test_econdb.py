@@ -3,21 +3,46 @@ import os
 import numpy as np
 import pandas as pd
 import pytest
+import requests
 
 from pandas_datareader import data as web
+from pandas_datareader._utils import RemoteDataError
+from pandas_datareader.econdb import EcondbReader
+from pandas_datareader.tests.conftest import DummyResponse, fake_get
 
 TEST_API_KEY = os.getenv("ECONDB_API_KEY")
 
-pytestmark = [
-    pytest.mark.requires_api_key,
-    pytest.mark.skipif(not TEST_API_KEY, reason="ECONDB_API_KEY not set"),
-]
-
 
 def assert_equal(x, y):
     assert np.isclose(x, y, rtol=1e-2)
 
 
+@pytest.mark.stable
+class TestEcondbErrors:
+    def _reader(self, monkeypatch, responses, calls):
+        reader = EcondbReader("ticker=CPIUS", pause=0, api_key="key")
+        reader.session = fake_get(monkeypatch, requests.Session(), responses, calls)
+        reader.cache = False
+        return reader
+
+    def test_detail_raises_value_error(self, monkeypatch):
+        calls = []
+        body = b'{"detail": "Invalid token."}'
+        reader = self._reader(monkeypatch, [DummyResponse(401, body)], calls)
+        with pytest.raises(ValueError, match="Invalid token."):
+            reader.read()
+        assert len(calls) == 1
+
+    def test_error_not_retried(self, monkeypatch):
+        calls = []
+        reader = self._reader(monkeypatch, [DummyResponse(503, b"down")], calls)
+        with pytest.raises(RemoteDataError):
+            reader.read()
+        assert len(calls) == 1
+
+
+@pytest.mark.requires_api_key
+@pytest.mark.skipif(not TEST_API_KEY, reason="ECONDB_API_KEY not set")
 class TestEcondb:
     def test_override_start_end(self):
         df = web.DataReader(
@@ -1,10 +1,103 @@
+import asyncio
+from io import BytesIO
+import zipfile
+
 import numpy as np
 import pandas as pd
 from pandas import testing as tm
+import pytest
 
 from pandas_datareader import data as web
 from pandas_datareader._testing import skip_on_exception
 from pandas_datareader._utils import RemoteDataError
+from pandas_datareader.eurostat import EurostatReader
+from pandas_datareader.io import sdmx
+
+ZIPPED_NOTICE = (
+    '<message:Error xmlns:message="http://www.sdmx.org/resources/sdmxml/'
+    'schemas/v2_1/message" xmlns:common="http://www.sdmx.org/resources/'
+    'sdmxml/schemas/v2_1/common"><common:Text>413</common:Text>'
+    "<common:Text>https://example.com/data.zip</common:Text></message:Error>"
+)
+
+STATISTICS = {
+    "id": ["time"],
+    "size": [2],
+    "dimension": {
+        "time": {
+            "category": {
+                "index": {"2020": 0, "2021": 1},
+                "label": {"2020": "2020", "2021": "2021"},
+            }
+        }
+    },
+    "value": {"0": 1.5, "1": 2.5},
+}
+
+
+@pytest.mark.stable
+class TestEurostatAsync:
+    @pytest.fixture
+    def files(self, datapath):
+        with open(datapath("io", "data", "sdmx", "DSD_cdh_e_fos.xml"), "rb") as fh:
+            dsd = fh.read()
+        with open(datapath("io", "data", "sdmx", "cdh_e_fos.xml"), "rb") as fh:
+            data = fh.read()
+        return dsd, data
+
+    @staticmethod
+    def _aread(handler):
+        import httpx
+
+        reader = EurostatReader("cdh_e_fos", start="2000", end="2030", pause=0)
+        reader.cache = False
+
+        async def main():
+            transport = httpx.MockTransport(handler)
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await reader.aread(client=client)
+
+        return asyncio.run(main())
+
+    def test_zipped_data_polled_without_blocking(self, files, monkeypatch):
+        httpx = pytest.importorskip("httpx")
+        dsd, data = files
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("data.xml", data)
+        zips = [httpx.Response(404), httpx.Response(200, content=archive.getvalue())]
+        sleeps = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+
+        def handler(request):
+            if "/datastructure/" in request.url.path:
+                return httpx.Response(200, content=dsd)
+            if request.url.host == "example.com":
+                return zips.pop(0)
+            return httpx.Response(200, text=ZIPPED_NOTICE)
+
+        monkeypatch.setattr(sdmx.asyncio, "sleep", sleep)
+        monkeypatch.setattr(sdmx.time, "sleep", pytest.fail)
+        result = self._aread(handler)
+        assert zips == []
+        assert sleeps == [1]
+        assert len(result) > 0
+
+    def test_statistics_fallback(self, files):
+        httpx = pytest.importorskip("httpx")
+        dsd, _ = files
+
+        def handler(request):
+            if "/datastructure/" in request.url.path:
+                return httpx.Response(200, content=dsd)
+            if "/statistics/" in request.url.path:
+                return httpx.Response(200, json=STATISTICS)
+            raise httpx.ConnectError("connection reset")
+
+        result = self._aread(handler)
+        assert result["value"].tolist() == [1.5, 2.5]
 
 
 class TestEurostat:
@@ -1,4 +1,6 @@
 from datetime import datetime
+from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
 
 import numpy as np
 import pandas as pd
@@ -7,9 +9,37 @@ import pytest
 
 from pandas_datareader import data as web
 from pandas_datareader._utils import RemoteDataError
+from pandas_datareader.fred import FredReader
+from pandas_datareader.retry import DeadlineExceededError
 
 pytestmark = pytest.mark.stable
 
+SERIES = {
+    "GDP": {"2020-01-01": "1.0", "2020-04-01": "2.0"},
+    "UNRATE": {"2020-01-01": "3.5", "2020-02-01": ".", "2020-03-01": "4"},
+    "CPI": {"2020-02-01": "258.6"},
+}
+
+
+def _fredgraph(requested):
+    """Serve fredgraph.csv for comma-separated ids, failing on unknown ones"""
+
+    def read(url):
+        query = parse_qs(urlsplit(url).query)
+        ids = query["id"][0].split(",")
+        assert len(query["cosd"][0].split(",")) == len(ids)
+        requested.append(ids)
+        if any(i not in SERIES for i in ids):
+            error = RemoteDataError(f"Unable to read URL: {url}")
+            error.status_code = 404
+            raise error
+        dates = sorted(set().union(*(SERIES[i] for i in ids)))
+        lines = [",".join(["observation_date", *ids])]
+        lines += [",".join([d, *(SERIES[i].get(d, "") for i in ids)]) for d in dates]
+        return BytesIO(("\n".join(lines) + "\n").encode())
+
+    return read
+
 
 class TestFred:
     def test_fred(self):
@@ -79,3 +109,151 @@ class TestFred:
         names = ["NOTAREALSERIES", "CPIAUCSL", "ALSO FAKE"]
         with pytest.raises(RemoteDataError):
             web.DataReader(names, data_source="fred")
+
+    def test_iter_read(self, monkeypatch):
+        requested = []
+        reader = FredReader(["GDP", "UNRATE"], start="2020-01-01", end="2020-12-31")
+        monkeypatch.setattr(reader, "_read_url_as_stream", _fredgraph(requested))
+        pairs = dict(reader.iter_read())
+
+        assert list(pairs) == ["GDP", "UNRATE"]
+        assert requested == [["GDP"], ["UNRATE"]]
+        assert list(pairs["UNRATE"].columns) == ["UNRATE"]
+        assert pairs["UNRATE"]["UNRATE"].isna().tolist() == [False, True, False]
+        tm.assert_frame_equal(
+            reader._combine(list(pairs.values())), reader.read(), check_freq=False
+        )
+
+    def test_output_long(self, monkeypatch):
+        reader = FredReader(
+            ["GDP", "UNRATE"], start="2020-01-01", end="2020-12-31", output="long"
+        )
+        monkeypatch.setattr(reader, "_read_url_as_stream", _fredgraph([]))
+        result = reader.read()
+
+        expected = DataFrame(
+            {
+                "DATE": pd.to_datetime(
+                    ["2020-01-01", "2020-04-01", "2020-01-01", "2020-03-01"]
+                ),
+                "series_id": pd.Categorical(
+                    ["GDP", "GDP", "UNRATE", "UNRATE"], categories=["GDP", "UNRATE"]
+                ),
+                "value": [1.0, 2.0, 3.5, 4.0],
+            }
+        )
+        tm.assert_frame_equal(result, expected, check_dtype=False)
+        assert isinstance(result["series_id"].dtype, pd.CategoricalDtype)
+
+    def test_invalid_output(self):
+        with pytest.raises(ValueError, match="output"):
+            FredReader("GDP", output="tall")
+
+    def test_batches(self, monkeypatch):
+        requested = []
+        names = ["GDP", "UNRATE", "CPI"]
+        reader = FredReader(names, start="2020-01-01", end="2020-12-31", batch_size=2)
+        monkeypatch.setattr(reader, "_read_url_as_stream", _fredgraph(requested))
+        result = reader.read()
+
+        assert requested == [["GDP", "UNRATE"], ["CPI"]]
+        assert list(result.columns) == names
+        assert result.index.name == "DATE"
+        assert len(result) == 4
+        assert result.loc["2020-02-01", "CPI"] == 258.6
+        assert result["UNRATE"].isna().tolist() == [False, True, False, True]
+
+    def test_batch_falls_back_per_id(self, monkeypatch):
+        requested = []
+        reader = FredReader(["GDP", "CPI", "NOTREAL"], start="2020-01-01")
+        monkeypatch.setattr(reader, "_read_url_as_stream", _fredgraph(requested))
+        with pytest.raises(RemoteDataError, match="NOTREAL"):
+            reader.read()
+        assert requested == [["GDP", "CPI", "NOTREAL"], ["GDP"], ["CPI"], ["NOTREAL"]]
+
+        requested.clear()
+        reader = FredReader(["GDP", "CPI"], start="2020-01-01", batch_size=1)
+        monkeypatch.setattr(reader, "_read_url_as_stream", _fredgraph(requested))
+        reader.read()
+        assert requested == [["GDP"], ["CPI"]]
+
+    @pytest.mark.parametrize("status", [503, None])
+    def test_batch_does_not_fall_back_on_other_errors(self, monkeypatch, status):
+        requested = []
+
+        def read(url):
+            requested.append(url)
+            if status is None:
+                raise DeadlineExceededError(f"Deadline exceeded: {url}")
+            error = RemoteDataError(f"Unable to read URL: {url}")
+            error.status_code = status
+            raise error
+
+        reader = FredReader(["GDP", "CPI"], start="2020-01-01")
+        monkeypatch.setattr(reader, "_read_url_as_stream", read)
+        with pytest.raises(RemoteDataError):
+            reader.read()
+        assert len(requested) == 1
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            FredReader("GDP", batch_size=0)
+
+    def test_date_pushdown(self):
+        reader = FredReader(["GDP", "CPI"], start="2020-01-01", end="2020-06-30")
+        query = parse_qs(urlsplit(reader._batch_url(["GDP", "CPI"])).query)
+        assert query == {
+            "id": ["GDP,CPI"],
+            "cosd": ["2020-01-01,2020-01-01"],
+            "coed": ["2020-06-30,2020-06-30"],
+        }
+
+    @pytest.mark.parametrize(
+        "freq, expected",
+        [
+            ("MS", "Monthly"),
+            ("QE", "Quarterly"),
+            ("w-fri", "Weekly, Ending Friday"),
+            ("annual", "Annual"),
+        ],
+    )
+    def test_frequency_aggregation(self, freq, expected):
+        reader = FredReader("DGS10", start="2020-01-01", freq=freq, aggregation="eop")
+        query = parse_qs(urlsplit(reader._batch_url(["DGS10"])).query)
+        assert query["fq"] == [expected]
+        assert query["fam"] == ["eop"]
+
+        reader = FredReader(["DGS10", "DGS2"], freq=freq, aggregation="eop")
+        query = parse_qs(urlsplit(reader._batch_url(["DGS10", "DGS2"])).query)
+        assert query["fq"] == [f"{expected},{expected}"]
+        assert query["fam"] == ["eop,eop"]
+
+        query = parse_qs(urlsplit(FredReader("DGS10")._batch_url(["DGS10"])).query)
+        assert "fq" not in query and "fam" not in query
+
+    def test_invalid_frequency_aggregation(self):
+        with pytest.raises(ValueError, match="freq"):
+            FredReader("DGS10", freq="H")
+        with pytest.raises(ValueError, match="aggregation"):
+            FredReader("DGS10", freq="MS", aggregation="median")
+
+    @pytest.mark.parametrize("engine", ["c", "pyarrow"])
+    def test_csv_engine(self, monkeypatch, engine):
+        if engine == "pyarrow":
+            pytest.importorskip("pyarrow")
+        reader = FredReader(["GDP", "UNRATE"], start="2020-01-01", engine=engine)
+        monkeypatch.setattr(reader, "_read_url_as_stream", _fredgraph([]))
+        result = reader.read()
+
+        assert result.dtypes.tolist() == [np.float64, np.float64]
+        assert result.index.name == "DATE"
+        assert result.index.dtype.kind == "M"
+        assert result["UNRATE"].isna().tolist() == [False, True, False, True]
+
+    def test_missing_series_fails_to_parse(self):
+        reader = FredReader(["GDP", "UNRATE"])
+        payload = BytesIO(b"observation_date,GDP\n2020-01-01,1.0\n")
+        with pytest.raises(ValueError):
+            reader._parse_series(payload, ["GDP", "UNRATE"])
+        with pytest.raises(ValueError, match="engine"):
+            FredReader("GDP", engine="python")
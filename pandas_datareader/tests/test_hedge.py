@@ -0,0 +1,178 @@
+import asyncio
+import math
+import threading
+import time
+
+import pytest
+import requests
+
+from pandas_datareader import hedge, ratelimit
+from pandas_datareader.macro.base import MacroClientBase
+from pandas_datareader.tests.conftest import DummyResponse, make_reader
+
+pytestmark = pytest.mark.stable
+
+
+@pytest.fixture(autouse=True)
+def clear_policies():
+    hedge.clear_hedge_policies()
+    yield
+    hedge.clear_hedge_policies()
+
+
+def _warm(policy, latency=0.01, count=20):
+    for _ in range(count):
+        policy._start()
+        policy.record(latency)
+
+
+class TestHedgePolicy:
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            hedge.HedgePolicy(percentile=100)
+        with pytest.raises(ValueError):
+            hedge.HedgePolicy(window=5, min_samples=10)
+        with pytest.raises(ValueError):
+            hedge.HedgePolicy(max_in_flight=0)
+        with pytest.raises(ValueError):
+            hedge.HedgePolicy(max_ratio=0)
+
+    def test_threshold(self):
+        policy = hedge.HedgePolicy(percentile=90, window=10, min_samples=5)
+        assert policy.threshold() is None
+        policy.initial_delay = 2.0
+        assert policy.threshold() == 2.0
+        for latency in range(1, 11):
+            policy.record(latency / 10)
+        assert policy.threshold() == pytest.approx(0.9)
+        # only the last ``window`` latencies count
+        for _ in range(10):
+            policy.record(0.01)
+        assert policy.threshold() == policy.min_delay
+
+    def test_fast_request_not_hedged(self):
+        policy = hedge.HedgePolicy()
+        _warm(policy, latency=1.0)
+        calls = []
+
+        def func():
+            calls.append(True)
+            return DummyResponse(content=b"primary")
+
+        assert policy.send("https://example.com", func).content == b"primary"
+        assert len(calls) == 1
+        assert policy.stats().hedged == 0
+
+    def test_slow_request_hedged(self):
+        policy = hedge.HedgePolicy()
+        _warm(policy)
+        release = threading.Event()
+        responses = []
+
+        def func():
+            if not responses:
+                responses.append(DummyResponse(content=b"primary"))
+                release.wait(5)
+                return responses[0]
+            responses.append(DummyResponse(content=b"hedge"))
+            return responses[1]
+
+        assert policy.send("https://example.com", func).content == b"hedge"
+        release.set()
+        stats = policy.stats()
+        assert (stats.requests, stats.hedged, stats.wins) == (21, 1, 1)
+        assert stats.win_rate == 1.0
+        # the slower response is closed once it arrives
+        for _ in range(100):
+            if responses[0].closed:
+                break
+            time.sleep(0.01)
+        assert responses[0].closed
+        assert not responses[1].closed
+
+    def test_failed_hedge_falls_back(self):
+        policy = hedge.HedgePolicy()
+        _warm(policy)
+        calls = []
+
+        def func():
+            calls.append(True)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                return DummyResponse(content=b"primary")
+            raise requests.exceptions.ConnectionError("down")
+
+        assert policy.send("https://example.com", func).content == b"primary"
+        assert policy.stats().wins == 0
+
+    def test_rate_limited_hedge_not_sent_after_primary(self):
+        policy = hedge.HedgePolicy()
+        _warm(policy)
+        ratelimit.set_rate_limit("example.com", 5, burst=1)
+        try:
+            # take the only token, so the hedge waits about 0.2s for the next
+            ratelimit.acquire("https://example.com")
+            calls = []
+
+            def func():
+                calls.append(True)
+                time.sleep(0.1)
+                return DummyResponse(content=b"primary")
+
+            assert policy.send("https://example.com", func).content == b"primary"
+            time.sleep(0.3)
+        finally:
+            ratelimit.clear_rate_limits()
+        assert len(calls) == 1
+        assert policy.stats().hedged == 1
+
+    def test_caps(self):
+        policy = hedge.HedgePolicy(max_ratio=0.1)
+        _warm(policy, count=9)
+        # one hedge would exceed 10% of ten requests sent so far
+        assert policy._acquire() is False
+        policy._start()
+        policy._start()
+        assert policy._acquire() is True
+        # max_in_flight=1
+        assert policy._acquire() is False
+        policy._release()
+        assert policy.stats().win_rate == 0.0
+        assert math.isnan(hedge.HedgeStats().win_rate)
+
+    def test_asend(self):
+        policy = hedge.HedgePolicy()
+        _warm(policy)
+        calls = []
+
+        async def func():
+            calls.append(True)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+                return "primary"
+            return "hedge"
+
+        assert asyncio.run(policy.asend("https://example.com", func)) == "hedge"
+        stats = policy.stats()
+        assert (stats.hedged, stats.wins) == (1, 1)
+        assert policy._in_flight == 0
+
+
+class TestRegistry:
+    def test_set_and_remove(self):
+        policy = hedge.HedgePolicy()
+        hedge.set_hedge_policy("https://EC.europa.eu/eurostat", policy)
+        assert hedge.get_hedge_policy("ec.europa.eu") is policy
+        assert hedge.hedge_stats() == {"ec.europa.eu": hedge.HedgeStats()}
+        hedge.set_hedge_policy("ec.europa.eu", None)
+        assert hedge.get_hedge_policy("ec.europa.eu") is None
+
+    def test_readers_and_clients_hedge(self, monkeypatch):
+        hedge.set_hedge_policy("example.com", hedge.HedgePolicy())
+        reader = make_reader(monkeypatch, [], default=DummyResponse())
+        reader._get_response("https://example.com/a")
+        reader._get_response("https://other.org/a")
+
+        client = MacroClientBase(session=reader.session)
+        client._get("https://example.com/b")
+        assert hedge.hedge_stats()["example.com"].requests == 2
@@ -0,0 +1,121 @@
+from io import StringIO
+
+import pandas as pd
+import pytest
+import requests
+
+from pandas_datareader import base, hooks
+from pandas_datareader.fred import FredReader
+from pandas_datareader.macro.base import MacroClientBase, MacroProviderError
+from pandas_datareader.tests.conftest import DummyResponse, make_reader
+
+pytestmark = pytest.mark.stable
+
+
+@pytest.fixture(autouse=True)
+def _clear_hooks():
+    hooks.clear_hooks()
+    yield
+    hooks.clear_hooks()
+
+
+def _reader(monkeypatch, responses, cls=base._BaseReader, **kwargs):
+    reader = make_reader(monkeypatch, responses, cls=cls, retry_count=3, **kwargs)
+    reader.cache = False
+    monkeypatch.setattr(base.time, "sleep", lambda delay: None)
+    return reader
+
+
+def _record(target, *events):
+    seen = []
+    for event in events:
+        target.register_hook(event, seen.append)
+    return seen
+
+
+class TestHooks:
+    def test_unknown_event(self):
+        with pytest.raises(ValueError, match="Unknown hook event"):
+            hooks.register_hook("on_nothing", print)
+        with pytest.raises(ValueError, match="Unknown hook event"):
+            base._BaseReader([]).register_hook("on_nothing", print)
+
+    def test_request_and_response(self, monkeypatch):
+        seen = _record(hooks, "on_request", "on_response")
+        reader = _reader(monkeypatch, [DummyResponse(200, b"abcd")])
+        reader._get_response("https://example.com/a", params={"q": 1})
+
+        assert [e.event for e in seen] == ["on_request", "on_response"]
+        response = seen[1]
+        assert response.source == "_BaseReader"
+        assert response.url == "https://example.com/a"
+        assert response.params == {"q": 1}
+        assert response.status == 200
+        assert response.bytes == 4
+        assert response.elapsed >= 0
+
+    def test_retry_events(self, monkeypatch):
+        seen = _record(hooks, "on_retry", "on_response")
+        failure = requests.exceptions.ConnectionError("boom")
+        reader = _reader(monkeypatch, [DummyResponse(503), failure, DummyResponse(200)])
+        reader._get_response("https://example.com/a")
+
+        retries = [e for e in seen if e.event == "on_retry"]
+        assert [(e.attempt, e.status) for e in retries] == [(1, 503), (2, None)]
+        assert retries[1].error is failure
+        responses = [e for e in seen if e.event == "on_response"]
+        assert [e.status for e in responses] == [503, None, 200]
+        assert responses[1].error is failure
+
+    def test_instance_hooks(self, monkeypatch):
+        reader = _reader(monkeypatch, [DummyResponse(200), DummyResponse(200)])
+        other = _reader(monkeypatch, [DummyResponse(200)])
+        seen = _record(reader, "on_request")
+        reader._get_response("https://example.com/a")
+        other._get_response("https://example.com/b")
+        assert [e.url for e in seen] == ["https://example.com/a"]
+
+        reader.unregister_hook("on_request", seen.append)
+        reader._get_response("https://example.com/a")
+        assert len(seen) == 1
+
+    def test_parse_events(self, monkeypatch):
+        body = "DATE,GDP\n2020-01-01,1.0\n2020-04-01,2.0\n"
+        reader = FredReader("GDP", start="2020-01-01", end="2020-12-31")
+        monkeypatch.setattr(reader, "_read_url_as_stream", lambda url: StringIO(body))
+        seen = _record(reader, "on_parse_start", "on_parse_end")
+        df = reader.read()
+
+        assert [e.event for e in seen] == ["on_parse_start", "on_parse_end"]
+        assert seen[1].shape == df.shape == (2, 1)
+        assert seen[1].source == "FredReader"
+
+    def test_macro_client(self, monkeypatch):
+        client = MacroClientBase(session=requests.Session())
+        seen = _record(client, "on_request", "on_response")
+        monkeypatch.setattr(
+            client.session, "get", lambda url, **kwargs: DummyResponse(500)
+        )
+        with pytest.raises(MacroProviderError):
+            client._get("https://example.com/data")
+        assert [(e.event, e.status) for e in seen] == [
+            ("on_request", None),
+            ("on_response", 500),
+        ]
+
+    def test_macro_parse_shape(self):
+        client = MacroClientBase(session=requests.Session())
+        seen = _record(client, "on_parse_end")
+        result = client._parse(
+            "https://example.com/data",
+            lambda: type("Result", (), {"data": pd.DataFrame({"a": [1, 2]})})(),
+        )
+        assert seen[0].shape == result.data.shape
+
+    def test_no_hooks_is_cheap(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("event built without hooks")
+
+        monkeypatch.setattr(hooks, "HookEvent", fail)
+        reader = _reader(monkeypatch, [DummyResponse(200)])
+        reader._get_response("https://example.com/a")
@@ -0,0 +1,96 @@
+import pytest
+import requests
+
+from pandas_datareader import base, cache as pdr_cache, offline
+from pandas_datareader.macro.base import MacroClientBase
+from pandas_datareader.tests.conftest import DummyResponse, fake_get
+
+pytestmark = pytest.mark.stable
+
+
+@pytest.fixture(autouse=True)
+def reset(monkeypatch):
+    monkeypatch.delenv(offline.ENV_VAR, raising=False)
+    offline.set_offline(None)
+    yield
+    offline.set_offline(None)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    installed = pdr_cache.install_cache(path=str(tmp_path), ttl=0)
+    yield installed
+    pdr_cache.uninstall_cache()
+
+
+@pytest.fixture
+def session(monkeypatch):
+    calls = []
+    session = fake_get(
+        monkeypatch,
+        requests.Session(),
+        [],
+        calls,
+        default=DummyResponse(content=b"payload"),
+    )
+    session.calls = calls
+    return session
+
+
+class TestIsOffline:
+    def test_precedence(self, monkeypatch):
+        assert not offline.is_offline()
+        monkeypatch.setenv(offline.ENV_VAR, "True")
+        assert offline.is_offline()
+        assert not offline.is_offline(False)
+        offline.set_offline(False)
+        assert not offline.is_offline()
+        with offline.offline_mode():
+            assert offline.is_offline()
+        assert not offline.is_offline()
+
+
+class TestReader:
+    def test_serves_stale_cache(self, cache, session):
+        reader = base._BaseReader([], pause=0, session=session)
+        reader._get_response("https://example.com/a")
+        reader.offline = True
+        response = reader._get_response("https://example.com/a")
+        assert response.from_cache
+        assert len(session.calls) == 1
+
+    def test_miss_fails_fast(self, monkeypatch, session):
+        monkeypatch.setenv(offline.ENV_VAR, "1")
+        reader = base._BaseReader([], retry_count=5, pause=10, session=session)
+        with pytest.raises(offline.OfflineError, match="example.com/a\\?x=1"):
+            reader._get_response("https://example.com/a", params={"x": 1})
+        assert session.calls == []
+
+    def test_online_override(self, cache, session):
+        offline.set_offline(True)
+        reader = base._BaseReader([], pause=0, session=session, offline=False)
+        reader._get_response("https://example.com/a")
+        assert len(session.calls) == 1
+
+
+class TestMacroClient:
+    def test_cached_then_offline(self, cache, session):
+        client = MacroClientBase(session=session)
+        assert client._get("https://example.com/a").content == b"payload"
+        with offline.offline_mode():
+            assert client._get("https://example.com/a").from_cache
+            with pytest.raises(offline.OfflineError):
+                client._get("https://example.com/b")
+        assert [url for url, _ in session.calls] == ["https://example.com/a"]
+
+    def test_revalidation(self, cache, monkeypatch):
+        responses = [
+            DummyResponse(content=b"payload", headers={"ETag": '"v1"'}),
+            DummyResponse(status_code=304),
+        ]
+        calls = []
+        session = fake_get(monkeypatch, requests.Session(), responses, calls)
+        client = MacroClientBase(session=session)
+        client._get("https://example.com/a")
+        assert client._get("https://example.com/a").content == b"payload"
+        assert calls[1][1]["headers"]["If-None-Match"] == '"v1"'
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from pandas_datareader import base, ratelimit
+from pandas_datareader.macro.base import MacroClientBase
+
+pytestmark = pytest.mark.stable
+
+
+@pytest.fixture(autouse=True)
+def clear_limits():
+    ratelimit.clear_rate_limits()
+    yield
+    ratelimit.clear_rate_limits()
+
+
+class TestTokenBucket:
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            ratelimit.TokenBucket(0)
+        with pytest.raises(ValueError):
+            ratelimit.TokenBucket(1, burst=0)
+
+    def test_burst_then_rate(self):
+        bucket = ratelimit.TokenBucket(rate=10, burst=3)
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_shared_across_threads(self):
+        bucket = ratelimit.TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.monotonic() - start >= 0.09
+
+    def test_aacquire(self):
+        bucket = ratelimit.TokenBucket(rate=50, burst=1)
+
+        async def main():
+            await asyncio.gather(*(bucket.aacquire() for _ in range(3)))
+
+        start = time.monotonic()
+        asyncio.run(main())
+        assert time.monotonic() - start >= 0.03
+
+
+class TestRegistry:
+    def test_set_and_remove(self):
+        ratelimit.set_rate_limit("https://FRED.stlouisfed.org/graph", 5, burst=2)
+        bucket = ratelimit.get_rate_limit("fred.stlouisfed.org")
+        assert bucket.rate == 5 and bucket.burst == 2
+        ratelimit.set_rate_limit("fred.stlouisfed.org", None)
+        assert ratelimit.get_rate_limit("fred.stlouisfed.org") is None
+
+    def test_readers_and_clients_acquire(self, monkeypatch):
+        acquired = []
+
+        class DummyBucket:
+            def acquire(self):
+                acquired.append(True)
+
+        class DummyResponse:
+            status_code = requests.codes.ok
+
+        monkeypatch.setitem(ratelimit._buckets, "example.com", DummyBucket())
+        reader = base._BaseReader([], pause=0)
+        reader.session = requests.Session()
+        monkeypatch.setattr(reader.session, "get", lambda *a, **k: DummyResponse())
+        reader._get_response("https://example.com/a")
+        reader._get_response("https://other.org/a")
+
+        client = MacroClientBase(session=reader.session)
+        client._get("https://example.com/b")
+        assert len(acquired) == 2
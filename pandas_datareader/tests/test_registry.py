@@ -0,0 +1,88 @@
+import pytest
+
+from pandas_datareader import data, registry
+
+pytestmark = pytest.mark.stable
+
+
+class DummyReader:
+    def __init__(self, symbols, **kwargs):
+        self.symbols = symbols
+
+    def read(self):
+        return self.symbols
+
+    def close(self):
+        pass
+
+
+class EntryPoint:
+    name = "plugin"
+    value = "pandas_datareader.tests.test_registry:DummyReader"
+
+
+class TestRegistry:
+    def test_builtin_sources(self):
+        assert {"fred", "famafrench", "oecd", "eurostat", "wb"} <= set(
+            registry.available_sources()
+        )
+        from pandas_datareader.fred import FredReader
+
+        assert registry.get_reader("fred") is FredReader
+
+    def test_lazy_import(self, monkeypatch):
+        path = "pandas_datareader.tests.test_registry:DummyReader"
+        monkeypatch.setitem(registry._sources, "lazy", path)
+        assert registry.get_reader("lazy") is DummyReader
+        # resolved once, then cached
+        assert registry._sources["lazy"] is DummyReader
+
+    def test_register_and_unregister(self, monkeypatch):
+        monkeypatch.setattr(registry, "_sources", dict(registry._sources))
+        registry.register_source("dummy", DummyReader)
+        assert data.DataReader("X", "dummy") == "X"
+
+        registry.register_source("fred", DummyReader)
+        assert registry.get_reader("fred") is DummyReader
+        registry.unregister_source("fred")
+        assert registry._sources["fred"] == registry._BUILTIN_SOURCES["fred"]
+
+        registry.unregister_source("dummy")
+        monkeypatch.setattr(registry, "_entry_points_loaded", True)
+        with pytest.raises(NotImplementedError):
+            registry.get_reader("dummy")
+
+    def test_entry_points(self, monkeypatch):
+        import importlib.metadata
+
+        monkeypatch.setattr(registry, "_sources", dict(registry._sources))
+        monkeypatch.setattr(registry, "_entry_points_loaded", False)
+        monkeypatch.setattr(
+            importlib.metadata, "entry_points", lambda group: [EntryPoint()]
+        )
+        assert registry.get_reader("plugin") is DummyReader
+        assert "plugin" in registry.available_sources()
+
+    def test_data_module_reader_names(self):
+        from pandas_datareader.wb import WorldBankReader
+
+        assert data.WorldBankReader is WorldBankReader
+        with pytest.raises(AttributeError):
+            _ = data.NoSuchReader
+
+    def test_wb_country_codes(self):
+        from pandas_datareader import wb
+
+        assert "US" in wb.country_codes
+        assert "USA" in wb.country_codes
+        assert len(wb.country_codes) == len(set(wb.country_codes))
+
+    def test_compat_lazy_helpers(self):
+        import pandas.testing
+
+        from pandas_datareader import compat
+
+        assert compat.is_list_like([1])
+        assert compat.assert_frame_equal is pandas.testing.assert_frame_equal
+        with pytest.raises(AttributeError):
+            _ = compat.no_such_helper
@@ -0,0 +1,174 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import zipfile
+
+import pytest
+import requests
+
+from pandas_datareader import replay, session
+from pandas_datareader._utils import RemoteDataError
+from pandas_datareader.base import _BaseReader
+from pandas_datareader.fred import FredReader
+
+pytestmark = pytest.mark.stable
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = f"path={self.path}".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _restore_transport():
+    yield
+    session.set_transport(None)
+
+
+def _reader():
+    reader = _BaseReader([], retry_count=0, pause=0)
+    reader.cache = False
+    return reader
+
+
+class TestReplay:
+    def test_record_then_replay(self, server, tmp_path):
+        path = str(tmp_path / "traffic.zip")
+        with replay.record(path):
+            response = _reader()._get_response(f"{server}/a", params={"x": 1})
+            assert response.text == "path=/a?x=1"
+
+        archive = replay.Archive(path)
+        assert len(archive) == 1
+
+        with replay.replay(path, latency=0):
+            response = _reader()._get_response(f"{server}/a", params={"x": 1})
+        assert response.status_code == 200
+        assert response.text == "path=/a?x=1"
+        assert response.headers["ETag"] == '"v1"'
+
+    def test_credentials_not_archived(self, server, tmp_path):
+        path = str(tmp_path / "traffic.zip")
+        with replay.record(path):
+            _reader()._get_response(f"{server}/e", params={"api_key": "secret"})
+        with zipfile.ZipFile(path) as archive:
+            (entry,) = json.loads(archive.read("index.json"))
+        assert "secret" not in json.dumps(entry)
+        assert "api_key=REDACTED" in entry["url"]
+
+        with replay.replay(path, latency=0):
+            response = _reader()._get_response(
+                f"{server}/e", params={"api_key": "another"}
+            )
+        assert response.text == "path=/e?api_key=secret"
+
+    def test_reader_created_before_replay(self, server, tmp_path):
+        path = str(tmp_path / "traffic.zip")
+        reader = _reader()
+        with replay.record(path):
+            reader._get_response(f"{server}/f")
+        with replay.replay(path, latency=0) as adapter:
+            assert reader.session.get_adapter(f"{server}/f") is adapter
+            # not recorded, so it must not reach the live server
+            with pytest.raises(RemoteDataError):
+                reader._get_response(f"{server}/g")
+
+    def test_explicit_session(self, server, tmp_path):
+        path = str(tmp_path / "traffic.zip")
+        sess = requests.Session()
+        with replay.record(path, session=sess):
+            sess.get(f"{server}/b")
+        with replay.replay(path, session=sess, latency=0):
+            assert sess.get(f"{server}/b").text == "path=/b"
+        assert sess.get(f"{server}/b").text == "path=/b"
+
+    def test_host_pool_sizes(self, server, tmp_path):
+        path = str(tmp_path / "traffic.zip")
+        session.configure_session_pool(host_pool_sizes={"127.0.0.1": 2})
+        try:
+            with replay.record(path):
+                _reader()._get_response(f"{server}/c")
+            with replay.replay(path, latency=0) as adapter:
+                assert session.get_session().get_adapter(f"{server}/c") is adapter
+                assert _reader()._get_response(f"{server}/c").text == "path=/c"
+                # not recorded, so it must not reach the live server
+                with pytest.raises(RemoteDataError):
+                    _reader()._get_response(f"{server}/d")
+        finally:
+            session.reset_session_pool()
+
+        sess = requests.Session()
+        host_adapter = requests.adapters.HTTPAdapter()
+        sess.mount("http://127.0.0.1", host_adapter)
+        with replay.replay(path, session=sess) as adapter:
+            assert sess.get_adapter(f"{server}/c") is adapter
+        assert sess.get_adapter(f"{server}/c") is host_adapter
+
+    def test_missing_recording(self, tmp_path):
+        path = str(tmp_path / "empty.zip")
+        with replay.replay(path), pytest.raises(RemoteDataError):
+            _reader()._get_response("https://example.com/missing")
+
+    def test_recordings_in_order(self, tmp_path):
+        path = str(tmp_path / "traffic.zip")
+        archive = replay.Archive(path)
+        for body in (b"first", b"second"):
+            archive.add("GET", "https://example.com/x", 200, {}, body, 0.0)
+        archive.save()
+
+        with replay.replay(path) as adapter:
+            sess = requests.Session()
+            sess.mount("https://", adapter)
+            bodies = [sess.get("https://example.com/x").content for _ in range(3)]
+        assert bodies == [b"first", b"second", b"second"]
+
+    def test_simulated_latency_and_bandwidth(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "traffic.zip")
+        archive = replay.Archive(path)
+        archive.add("GET", "https://example.com/x", 200, {}, b"x" * 1000, 0.05)
+        archive.save()
+
+        sleeps = []
+        adapter = replay.ReplayAdapter(replay.Archive(path), bandwidth=10_000)
+        sess = requests.Session()
+        sess.mount("https://", adapter)
+        monkeypatch.setattr(replay.time, "sleep", sleeps.append)
+        sess.get("https://example.com/x")
+        assert sleeps == [pytest.approx(0.15)]
+
+    def test_reader_offline(self, tmp_path):
+        path = str(tmp_path / "fred.zip")
+        archive = replay.Archive(path)
+        archive.add(
+            "GET",
+            "https://fred.stlouisfed.org/graph/fredgraph.csv"
+            "?id=GDP&cosd=2020-01-01&coed=2020-12-31",
+            200,
+            {"Content-Type": "text/csv"},
+            b"DATE,GDP\n2020-01-01,1.0\n2020-04-01,2.0\n",
+            0.0,
+        )
+        archive.save()
+
+        with replay.replay(path):
+            df = FredReader("GDP", start="2020-01-01", end="2020-12-31").read()
+        assert df["GDP"].tolist() == [1.0, 2.0]
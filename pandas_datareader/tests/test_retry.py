@@ -0,0 +1,225 @@
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+import requests
+
+from pandas_datareader import base, retry
+from pandas_datareader._utils import RemoteDataError
+from pandas_datareader.tests.conftest import DummyResponse, make_reader
+
+pytestmark = pytest.mark.stable
+
+
+def _reader(monkeypatch, statuses, policy=None, retry_count=3, **kwargs):
+    calls = []
+    reader = make_reader(
+        monkeypatch,
+        statuses,
+        calls=calls,
+        default=500,
+        retry_count=retry_count,
+        **kwargs,
+    )
+    reader.retry_policy = policy
+    return reader, calls
+
+
+class TestRetryPolicy:
+    def test_fatal_status_fails_fast(self, monkeypatch):
+        reader, calls = _reader(monkeypatch, [404])
+        with pytest.raises(RemoteDataError):
+            reader._get_response("https://example.com/a")
+        assert len(calls) == 1
+
+    def test_retryable_status(self, monkeypatch):
+        reader, calls = _reader(monkeypatch, [503, 429, 200])
+        assert reader._get_response("https://example.com/a").status_code == 200
+        assert len(calls) == 3
+
+    def test_custom_statuses(self, monkeypatch):
+        policy = retry.RetryPolicy(retry_statuses=[404])
+        reader, calls = _reader(monkeypatch, [404, 200], policy=policy)
+        assert reader._get_response("https://example.com/a").status_code == 200
+        assert len(calls) == 2
+
+    def test_retry_after(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(base.time, "sleep", sleeps.append)
+        throttled = DummyResponse(429, headers={"Retry-After": "7"})
+        reader, _ = _reader(monkeypatch, [throttled, 200])
+        reader._get_response("https://example.com/a")
+        assert sleeps == [7.0]
+
+        policy = retry.RetryPolicy(max_retry_after=2)
+        assert policy.next_delay(0.1, 0.1, throttled) == 2
+        date = DummyResponse(
+            503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+        assert policy.retry_after(date) == 0.0
+        bad = DummyResponse(503, headers={"Retry-After": "soon"})
+        assert policy.retry_after(bad) is None
+
+    def test_decorrelated_jitter(self):
+        policy = retry.RetryPolicy(max_delay=5)
+        delay = 0.1
+        for _ in range(50):
+            new = policy.next_delay(delay, 0.1)
+            assert 0.1 <= new <= min(5, max(0.1, delay * 3))
+            delay = new
+        assert delay <= 5
+
+    def test_default_policy(self, monkeypatch):
+        policy = retry.RetryPolicy(retry_statuses=[])
+        retry.set_default_retry_policy(policy)
+        try:
+            assert base._BaseReader([])._retry_policy() is policy
+        finally:
+            retry.set_default_retry_policy(None)
+        assert retry.get_default_retry_policy() is not policy
+
+
+class TestCircuitBreaker:
+    def test_opens_and_fails_fast(self, monkeypatch):
+        breaker = retry.CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        policy = retry.RetryPolicy(circuit_breaker=breaker)
+        reader, calls = _reader(monkeypatch, [], policy=policy, retry_count=5)
+        with pytest.raises(retry.CircuitOpenError):
+            reader._get_response("https://example.com/a")
+        assert len(calls) == 3
+        assert breaker.state("example.com") == "open"
+
+        with pytest.raises(RemoteDataError):
+            reader._get_response("https://example.com/b")
+        assert len(calls) == 3
+
+        breaker.reset()
+        assert breaker.state("example.com") == "closed"
+
+    def test_connection_errors_count(self, monkeypatch):
+        breaker = retry.CircuitBreaker(failure_threshold=2)
+        policy = retry.RetryPolicy(circuit_breaker=breaker)
+        error = requests.exceptions.ConnectionError("down")
+        reader, _ = _reader(monkeypatch, [error, error], policy=policy, retry_count=1)
+        with pytest.raises(RemoteDataError):
+            reader._get_response("https://example.com/a")
+        assert breaker.state("example.com") == "open"
+
+    def test_half_open_trial(self):
+        breaker = retry.CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure("host")
+        assert not breaker.allow("host")
+        time.sleep(0.06)
+        assert breaker.allow("host")
+        assert not breaker.allow("host")
+        breaker.record_success("host")
+        assert breaker.allow("host")
+
+    def test_fatal_status_is_not_host_failure(self, monkeypatch):
+        breaker = retry.CircuitBreaker(failure_threshold=1)
+        policy = retry.RetryPolicy(circuit_breaker=breaker)
+        reader, _ = _reader(monkeypatch, [404], policy=policy)
+        with pytest.raises(RemoteDataError):
+            reader._get_response("https://example.com/a")
+        assert breaker.state("example.com") == "closed"
+
+
+class TestDeadline:
+    def test_budget(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+        deadline = retry.Deadline(10)
+        assert deadline.timeout(30) == 10
+        assert deadline.timeout(3) == 3
+        assert deadline.delay(2) == 2
+        now[0] = 108.0
+        with pytest.raises(retry.DeadlineExceededError):
+            deadline.delay(2, "https://example.com/a")
+        now[0] = 110.0
+        assert deadline.expired()
+        with pytest.raises(retry.DeadlineExceededError, match="example.com"):
+            deadline.timeout(30, "https://example.com/a")
+
+    def test_error_types(self):
+        assert issubclass(retry.DeadlineExceededError, TimeoutError)
+        assert issubclass(retry.DeadlineExceededError, RemoteDataError)
+        with pytest.raises(ValueError):
+            retry.Deadline(0)
+        with pytest.raises(ValueError):
+            base._BaseReader([], deadline=-1)
+
+    def test_timeout_cut_to_budget(self, monkeypatch):
+        reader, _ = _reader(monkeypatch, [200], deadline=5)
+        timeouts = []
+        get = reader.session.get
+
+        def record(url, **kwargs):
+            timeouts.append(kwargs["timeout"])
+            return get(url, **kwargs)
+
+        monkeypatch.setattr(reader.session, "get", record)
+        reader._get_response("https://example.com/a")
+        assert 0 < timeouts[0] <= 5
+
+    def test_retry_wait_past_deadline_fails_fast(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(base.time, "sleep", sleeps.append)
+        throttled = DummyResponse(429, headers={"Retry-After": "60"})
+        reader, calls = _reader(monkeypatch, [throttled, 200], deadline=5)
+        with pytest.raises(retry.DeadlineExceededError):
+            reader._get_response("https://example.com/a")
+        assert len(calls) == 1
+        assert sleeps == []
+
+    def test_budget_spans_requests(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+        reader, calls = _reader(monkeypatch, [200, 200, 200], deadline=5)
+        reader._get_response("https://example.com/a")
+        now[0] = 3.0
+        reader._get_response("https://example.com/b")
+        now[0] = 6.0
+        with pytest.raises(retry.DeadlineExceededError):
+            reader._get_response("https://example.com/c")
+        assert len(calls) == 2
+        # the next read gets a fresh budget
+        reader.close()
+        reader._get_response("https://example.com/c")
+
+    def test_each_read_gets_a_budget(self):
+        deadlines = []
+
+        class Reader(base._DailyBaseReader):
+            url = "https://example.com/a"
+
+            def _get_params(self, symbol):
+                return {}
+
+            def _read_one_data(self, url, params):
+                deadlines.append(self._active_deadline())
+                return pd.DataFrame()
+
+            async def _aread(self):
+                return self._read_one_data(self.url, None)
+
+        reader = Reader("A", deadline=5)
+        reader.read()
+        reader.read()
+        asyncio.run(reader.aread(client=object()))
+        assert len({id(deadline) for deadline in deadlines}) == 3
+        assert reader._deadline is None
+
+    def test_transport_timeout(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+        reader, _ = _reader(monkeypatch, [], deadline=5)
+
+        def get(url, **kwargs):
+            now[0] += kwargs["timeout"]
+            raise requests.exceptions.ReadTimeout("read timed out")
+
+        monkeypatch.setattr(reader.session, "get", get)
+        with pytest.raises(retry.DeadlineExceededError) as exc:
+            reader._get_response("https://example.com/a")
+        assert isinstance(exc.value.__cause__, requests.exceptions.ReadTimeout)
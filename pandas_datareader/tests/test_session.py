@@ -0,0 +1,76 @@
+import pytest
+import requests
+
+from pandas_datareader import base, session as pdr_session
+from pandas_datareader._utils import _init_session
+
+pytestmark = pytest.mark.stable
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    pdr_session.reset_session_pool()
+    yield
+    pdr_session.reset_session_pool()
+
+
+class TestSessionPool:
+    def test_readers_share_session(self):
+        first = base._BaseReader([])
+        second = base._BaseReader([])
+        assert first.session is second.session
+        assert pdr_session.is_shared_session(first.session)
+
+    def test_init_session_keeps_user_session(self):
+        user = requests.Session()
+        assert _init_session(user) is user
+        assert not pdr_session.is_shared_session(user)
+
+    def test_close_keeps_shared_session(self, monkeypatch):
+        reader = base._BaseReader([])
+        closed = []
+        monkeypatch.setattr(reader.session, "close", lambda: closed.append(True))
+        reader.close()
+        assert closed == []
+        assert pdr_session.get_session() is reader.session
+
+    def test_close_user_session(self, monkeypatch):
+        user = requests.Session()
+        closed = []
+        monkeypatch.setattr(user, "close", lambda: closed.append(True))
+        base._BaseReader([], session=user).close()
+        assert closed == [True]
+
+    def test_reader_follows_replaced_sessions(self):
+        reader = base._BaseReader([])
+        first = reader.session
+        adapter = requests.adapters.HTTPAdapter()
+        pdr_session.set_transport(adapter)
+        try:
+            assert reader.session is not first
+            assert reader.session.get_adapter("https://example.com/") is adapter
+        finally:
+            pdr_session.set_transport(None)
+        assert reader.session is pdr_session.get_session()
+
+    def test_named_sessions(self):
+        assert pdr_session.get_session("a") is not pdr_session.get_session("b")
+        assert pdr_session.get_session("a") is pdr_session.get_session("a")
+
+    def test_close_sessions(self):
+        first = pdr_session.get_session()
+        pdr_session.close_sessions()
+        assert pdr_session.get_session() is not first
+
+    def test_configure_pool(self):
+        pdr_session.configure_session_pool(
+            pool_maxsize=4,
+            keep_alive=False,
+            host_pool_sizes={"fred.stlouisfed.org": 32},
+        )
+        session = pdr_session.get_session()
+        default = session.get_adapter("https://example.com/")
+        fred = session.get_adapter("https://fred.stlouisfed.org/graph/")
+        assert default._pool_maxsize == 4
+        assert fred._pool_maxsize == 32
+        assert session.headers["Connection"] == "close"
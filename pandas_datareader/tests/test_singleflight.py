@@ -0,0 +1,177 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+import requests
+
+from pandas_datareader import base, singleflight
+from pandas_datareader.macro.base import MacroClientBase
+from pandas_datareader.singleflight import SingleFlight, request_key
+from pandas_datareader.tests.conftest import DummyResponse
+
+pytestmark = pytest.mark.stable
+
+
+def _wait_for_followers(flight, key, count):
+    while flight._calls[key].followers < count:
+        threading.Event().wait(0.001)
+
+
+class TestSingleFlight:
+    def test_followers_share_result(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def func():
+            calls.append(1)
+            release.wait(5)
+            return {"value": 1}
+
+        with ThreadPoolExecutor(4) as executor:
+            leader = executor.submit(flight.do, "key", func)
+            while not calls:
+                threading.Event().wait(0.001)
+            followers = [executor.submit(flight.do, "key", func) for _ in range(3)]
+            _wait_for_followers(flight, "key", 3)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert len(calls) == 1
+        assert all(result == {"value": 1} for result, _ in results)
+        assert all(shared for _, shared in results)
+        # followers get copies
+        assert results[1][0] is not results[0][0]
+        assert flight.in_flight() == 0
+
+    def test_error_propagates(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        started = threading.Event()
+
+        def func():
+            started.set()
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flight.do, "key", func)
+            started.wait(5)
+            follower = executor.submit(flight.do, "key", func)
+            _wait_for_followers(flight, "key", 1)
+            release.set()
+            errors = []
+            for future in (leader, follower):
+                with pytest.raises(ValueError, match="boom") as exc:
+                    future.result()
+                errors.append(exc.value)
+        assert flight.in_flight() == 0
+        # the follower raises its own copy, chained to the leader's error
+        assert errors[1] is not errors[0]
+        assert errors[1].__cause__ is errors[0]
+
+    def test_follower_timeout_runs_own_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return "leader"
+
+        with ThreadPoolExecutor(1) as executor:
+            leader = executor.submit(flight.do, "key", slow)
+            started.wait(5)
+            result = flight.do("key", lambda: "follower", timeout=0.05)
+            assert result == ("follower", False)
+            assert flight._calls["key"].followers == 0
+            release.set()
+            assert leader.result() == ("leader", False)
+        assert flight.in_flight() == 0
+
+    def test_sequential_calls_not_shared(self):
+        flight = SingleFlight()
+        assert flight.do("key", lambda: 1) == (1, False)
+        assert flight.do("key", lambda: 2) == (2, False)
+
+    def test_request_key(self):
+        session = requests.Session()
+        assert request_key(session, "https://a.com/x?b=2&a=1") == request_key(
+            session, "https://A.com/x", params={"a": 1, "b": 2}
+        )
+        assert request_key(session, "https://a.com/x") != request_key(
+            requests.Session(), "https://a.com/x"
+        )
+        assert request_key(session, "https://a.com/x") != request_key(
+            session, "https://a.com/x", headers={"Accept": "text/csv"}
+        )
+
+
+def _blocking_session(monkeypatch, body=b"a,b\n1,2\n"):
+    session = requests.Session()
+    release = threading.Event()
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        release.wait(5)
+        return DummyResponse(content=body)
+
+    monkeypatch.setattr(session, "get", get)
+    return session, release, calls
+
+
+def _fan_out(func, release, calls, count=4, coalesced=True):
+    def joined():
+        if not coalesced:
+            return len(calls) == count
+        return sum(c.followers for c in singleflight._group._calls.values()) == (
+            count - 1
+        )
+
+    with ThreadPoolExecutor(count) as executor:
+        futures = [executor.submit(func) for _ in range(count)]
+        while not joined():
+            threading.Event().wait(0.001)
+        release.set()
+        return [future.result() for future in futures]
+
+
+class TestCoalescedRequests:
+    def _reader(self, session):
+        reader = base._BaseReader([], session=session)
+        reader.cache = False
+        return reader
+
+    def test_reader(self, monkeypatch):
+        session, release, calls = _blocking_session(monkeypatch)
+        responses = _fan_out(
+            lambda: self._reader(session)._get_response(
+                "https://example.com/a", stream=True
+            ),
+            release,
+            calls,
+        )
+        assert len(calls) == 1
+        assert {response.content for response in responses} == {b"a,b\n1,2\n"}
+
+    def test_reader_disabled(self, monkeypatch):
+        session, release, calls = _blocking_session(monkeypatch)
+
+        def get():
+            reader = self._reader(session)
+            reader.coalesce = False
+            return reader._get_response("https://example.com/a")
+
+        _fan_out(get, release, calls, coalesced=False)
+        assert len(calls) == 4
+
+    def test_macro_client(self, monkeypatch):
+        session, release, calls = _blocking_session(monkeypatch)
+        client = MacroClientBase(session=session)
+        responses = _fan_out(
+            lambda: client._get("https://example.com/dsd"), release, calls
+        )
+        assert len(calls) == 1
+        assert all(response.content == b"a,b\n1,2\n" for response in responses)
@@ -0,0 +1,162 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_datareader import registry
+from pandas_datareader.data import DataReader
+from pandas_datareader.offline import OfflineError
+from pandas_datareader.store import Store, _missing_ranges
+
+pytest.importorskip("pyarrow")
+
+pytestmark = pytest.mark.stable
+
+FULL = pd.DataFrame(
+    {"GDP": np.arange(60.0), "UNRATE": np.arange(60.0) / 10},
+    index=pd.date_range("2018-01-01", periods=60, freq="MS", name="DATE"),
+)
+
+
+@pytest.fixture
+def source(monkeypatch):
+    calls = []
+
+    class Reader:
+        def __init__(self, symbols, start=None, end=None, **kwargs):
+            self.start, self.end = start, end
+
+        def read(self):
+            calls.append((self.start, self.end))
+            return FULL.loc[self.start : self.end]
+
+        def close(self):
+            pass
+
+    monkeypatch.setitem(registry._sources, "dummy", Reader)
+    return calls
+
+
+def ts(value):
+    return pd.Timestamp(value)
+
+
+class TestStore:
+    def test_missing_ranges(self):
+        covered = [(ts("2020-01-01"), ts("2020-12-31"))]
+        assert _missing_ranges(covered, ts("2020-03-01"), ts("2020-06-30")) == []
+        assert _missing_ranges(covered, ts("2019-01-01"), ts("2021-06-30")) == [
+            (ts("2019-01-01"), ts("2019-12-31")),
+            (ts("2021-01-01"), ts("2021-06-30")),
+        ]
+        assert _missing_ranges([], ts("2020-01-01"), ts("2020-02-01")) == [
+            (ts("2020-01-01"), ts("2020-02-01"))
+        ]
+
+    def test_get_fetches_missing_ranges_only(self, source, tmp_path):
+        store = Store(str(tmp_path))
+        first = store.get("GDP", "dummy", start="2019-01-01", end="2019-12-31")
+        assert source == [(ts("2019-01-01"), ts("2019-12-31"))]
+        assert len(first) == 12
+
+        store.get("GDP", "dummy", start="2019-03-01", end="2019-06-30")
+        assert len(source) == 1
+
+        wider = store.get("GDP", "dummy", start="2019-01-01", end="2020-06-30")
+        assert source[-1] == (ts("2020-01-01"), ts("2020-06-30"))
+        pd.testing.assert_frame_equal(
+            wider, FULL.loc["2019-01-01":"2020-06-30"], check_freq=False
+        )
+        assert store.covered("dummy", "GDP") == [(ts("2019-01-01"), ts("2020-06-30"))]
+
+    def test_layout_and_manifest(self, source, tmp_path):
+        store = Store(str(tmp_path))
+        store.get("GDP", "dummy", start="2019-06-01", end="2020-05-31")
+        directory = tmp_path / "dummy" / "GDP"
+        assert sorted(os.listdir(directory)) == ["year=2019", "year=2020"]
+        assert (tmp_path / "manifest.json").exists()
+
+        reopened = Store(str(tmp_path))
+        assert reopened.datasets()["dataset"].tolist() == ["GDP"]
+        result = reopened.read("dummy", "GDP", start="2020-01-01", columns=["UNRATE"])
+        assert list(result.columns) == ["UNRATE"]
+        assert result.index.min() == ts("2020-01-01")
+        assert len(result) == 5
+
+    def test_later_writes_win(self, tmp_path):
+        store = Store(str(tmp_path))
+        frame = FULL.iloc[:3]
+        store.write(frame, "fred", "GDP")
+        revised = frame.iloc[1:] * 10
+        store.write(revised, "fred", "GDP")
+        result = store.read("fred", "GDP")
+        assert result["GDP"].tolist() == [0.0, 10.0, 20.0]
+
+    def test_stores_sharing_a_path(self, tmp_path):
+        first, second = Store(str(tmp_path)), Store(str(tmp_path))
+        first.write(FULL.iloc[:3], "fred", "GDP")
+        second.write(FULL.iloc[3:6], "fred", "GDP")
+        second.write(FULL.iloc[:3], "fred", "UNRATE")
+        result = first.read("fred", "GDP")
+        pd.testing.assert_frame_equal(result, FULL.iloc[:6], check_freq=False)
+        assert sorted(first.datasets()["dataset"]) == ["GDP", "UNRATE"]
+
+    def test_concurrent_writers(self, tmp_path):
+        def write(n):
+            Store(str(tmp_path)).write(FULL.iloc[n : n + 1], "fred", "GDP")
+
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(write, range(24)))
+        result = Store(str(tmp_path)).read("fred", "GDP")
+        pd.testing.assert_frame_equal(result, FULL.iloc[:24], check_freq=False)
+        assert not (tmp_path / "manifest.json.lock").exists()
+
+    def test_dict_and_multiindex(self, tmp_path):
+        store = Store(str(tmp_path))
+        periods = pd.period_range("2020-11", periods=3, freq="M", name="Date")
+        ff = {0: pd.DataFrame({"Mkt-RF": [1.0, 2.0, 3.0]}, index=periods)}
+        ff["DESCR"] = "Fama/French factors"
+        store.write(ff, "famafrench", "F-F_Research_Data_Factors")
+        result = store.read("famafrench", "F-F_Research_Data_Factors")
+        assert result["DESCR"] == "Fama/French factors"
+        pd.testing.assert_frame_equal(result[0], ff[0])
+
+        columns = pd.MultiIndex.from_tuples(
+            [("PC", "DE"), ("PC", "FR")], names=["UNIT", "GEO"]
+        )
+        index = pd.DatetimeIndex(["2019-01-01", "2020-01-01"], name="TIME_PERIOD")
+        euro = pd.DataFrame([[1.0, 2.0], [3.0, 4.0]], index=index, columns=columns)
+        store.write(euro, "eurostat", "ert_h_eur_a")
+        pd.testing.assert_frame_equal(store.read("eurostat", "ert_h_eur_a"), euro)
+
+    def test_unknown_dataset(self, tmp_path):
+        with pytest.raises(KeyError):
+            Store(str(tmp_path)).read("fred", "GDP")
+
+    def test_datareader_store(self, source, tmp_path):
+        store = Store(str(tmp_path))
+        for _ in range(2):
+            result = DataReader(
+                "GDP", "dummy", start="2019-01-01", end="2019-12-31", store=store
+            )
+        assert len(source) == 1
+        assert len(result) == 12
+
+    def test_offline(self, source, tmp_path):
+        store = Store(str(tmp_path))
+        store.get("GDP", "dummy", start="2019-01-01", end="2019-12-31")
+        result = DataReader(
+            "GDP",
+            "dummy",
+            start="2019-01-01",
+            end="2020-06-30",
+            store=store,
+            offline=True,
+        )
+        assert len(source) == 1
+        assert result.index[-1] == ts("2019-12-01")
+        with pytest.raises(OfflineError, match="dummy/UNRATE"):
+            store.get("UNRATE", "dummy", offline=True)
+        assert len(source) == 1
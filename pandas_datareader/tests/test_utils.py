@@ -1,9 +1,18 @@
 import datetime as dt
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from pandas_datareader._utils import _sanitize_dates
+from pandas_datareader._utils import (
+    _last_observation,
+    _merge_tail,
+    _outer_join,
+    _sanitize_dates,
+    _to_dtype_backend,
+    _to_long,
+    _validate_dtype_backend,
+)
 
 
 class TestUtils:
@@ -44,3 +53,136 @@ class TestUtils:
         default_start = pd.to_datetime(dt.date.today() - dt.timedelta(days=365 * 5))
         default_end = pd.to_datetime(dt.date.today())
         assert _sanitize_dates(None, None) == (default_start, default_end)
+
+
+class TestIncremental:
+    def test_last_observation(self):
+        idx = pd.date_range("2020-01-01", periods=4, freq="MS")
+        df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [1, 2, None, None]}, index=idx)
+        assert _last_observation(df) == pd.Timestamp("2020-02-01")
+        assert _last_observation(df[["a"]]) == pd.Timestamp("2020-04-01")
+
+    def test_last_observation_unknown(self):
+        assert _last_observation(pd.DataFrame()) is None
+        df = pd.DataFrame({"a": [1.0], "b": [None]}, index=[pd.Timestamp("2020")])
+        assert _last_observation(df) is None
+
+    def test_last_observation_period_labels(self):
+        idx = pd.MultiIndex.from_product([["Canada", "Mexico"], ["2019", "2020"]])
+        df = pd.DataFrame({"gdp": [1, 2, 3, None]}, index=idx)
+        assert _last_observation(df) == pd.Timestamp("2020-01-01")
+        monthly = pd.DataFrame({"x": [1, 2]}, index=["2020M01", "2020M02"])
+        assert _last_observation(monthly) == pd.Timestamp("2020-02-01")
+
+    def test_merge_tail(self):
+        idx = pd.date_range("2020-01-01", periods=4, freq="MS")
+        existing = pd.DataFrame({"a": [1.0, 2, 3, 4], "b": [1.0, 2, 3, None]}, idx)
+        new_idx = pd.date_range("2020-03-01", periods=3, freq="MS")
+        new = pd.DataFrame({"a": [30.0, 4, 5], "b": [3.0, 4, None]}, new_idx)
+
+        result = _merge_tail(existing, new)
+        expected = pd.DataFrame(
+            {"a": [1.0, 2, 30, 4, 5], "b": [1.0, 2, 3, 4, None]},
+            pd.date_range("2020-01-01", periods=5, freq="MS"),
+        )
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    def test_merge_tail_empty(self):
+        existing = pd.DataFrame({"a": [1.0]}, [pd.Timestamp("2020")])
+        assert _merge_tail(existing, existing.iloc[:0]) is existing
+        assert _merge_tail(existing.iloc[:0], existing) is existing
+
+
+class TestToLong:
+    def test_to_long(self):
+        a = pd.DataFrame({"A": [1.0, None]}, index=pd.Index(["x", "y"], name="k"))
+        b = pd.DataFrame({"B": [2.0]}, index=pd.Index(["y"], name="k"))
+        result = _to_long([a, b, a.rename(columns={"A": "B"})])
+
+        assert list(result.columns) == ["k", "series_id", "value"]
+        assert result["k"].tolist() == ["x", "y", "x"]
+        assert result["series_id"].tolist() == ["A", "B", "B"]
+        assert list(result["series_id"].cat.categories) == ["A", "B"]
+        assert result["value"].tolist() == [1.0, 2.0, 1.0]
+
+    def test_multiindex(self):
+        idx = pd.MultiIndex.from_tuples(
+            [("Canada", "2020"), ("Mexico", "2020")], names=["country", "year"]
+        )
+        result = _to_long([pd.DataFrame({"gdp": [1.0, 2.0]}, index=idx)])
+        assert list(result.columns) == ["country", "year", "series_id", "value"]
+        assert len(result) == 2
+
+
+class TestOuterJoin:
+    def test_matches_concat(self):
+        rng = np.random.default_rng(0)
+        dates = pd.date_range("2000-01-01", periods=50, freq="D", name="DATE")
+        frames = [
+            pd.DataFrame(
+                {f"S{i}": rng.random(20)},
+                index=dates[np.sort(rng.choice(50, 20, replace=False))],
+            )
+            for i in range(30)
+        ]
+        expected = pd.concat(frames, axis=1, join="outer", sort=True)
+        result = _outer_join(frames)
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    def test_multiindex_and_order(self):
+        idx = pd.MultiIndex.from_tuples(
+            [("Mexico", "2020"), ("Canada", "2020")], names=["country", "year"]
+        )
+        a = pd.DataFrame({"gdp": [1, 2]}, index=idx)
+        b = pd.DataFrame({"pop": [None, 3.0]}, index=idx[::-1], dtype=object)
+        # a single frame keeps its row order
+        assert _outer_join([a]).index.equals(idx)
+        result = _outer_join([a, b])
+        assert result.index.names == ["country", "year"]
+        assert result.index.get_level_values(0).tolist() == ["Canada", "Mexico"]
+        assert result.dtypes.tolist() == [np.float64, np.float64]
+        assert result.loc[("Mexico", "2020")].tolist() == [1.0, 3.0]
+        assert result.loc[("Canada", "2020"), "gdp"] == 2.0
+        assert np.isnan(result.loc[("Canada", "2020"), "pop"])
+
+
+class TestDtypeBackend:
+    def test_validate(self):
+        assert _validate_dtype_backend(None) is None
+        assert _validate_dtype_backend("numpy_nullable") == "numpy_nullable"
+        with pytest.raises(ValueError, match="dtype_backend"):
+            _validate_dtype_backend("arrow")
+
+    def test_pyarrow(self):
+        pa = pytest.importorskip("pyarrow")
+        idx = pd.MultiIndex.from_product(
+            [["Canada", "Mexico"], ["2019", "2020"]], names=["country", "year"]
+        )
+        df = pd.DataFrame({"gdp": [1.0, 2.0, 3.0, None], "n": [1, 2, 3, 4]}, index=idx)
+
+        result = _to_dtype_backend(df, "pyarrow")
+
+        labels = pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))
+        assert result["gdp"].dtype == pd.ArrowDtype(pa.float64())
+        assert result["n"].dtype == pd.ArrowDtype(pa.int64())
+        assert result.index.levels[0].dtype == labels
+        assert result.index.levels[1].dtype == labels
+        assert result.columns.dtype == labels
+        # missing values are nulls, not NaN
+        assert result["gdp"].array._pa_array.null_count == 1
+        assert result.loc[("Mexico", "2019"), "gdp"] == 3.0
+        assert df["gdp"].dtype == float
+
+    def test_keeps_dates(self):
+        pytest.importorskip("pyarrow")
+        idx = pd.date_range("2020-01-01", periods=2, name="DATE")
+        df = pd.DataFrame({"GDP": [1.0, 2.0]}, index=idx)
+        result = _to_dtype_backend(df, "pyarrow")
+        pd.testing.assert_index_equal(result.index, idx)
+
+    def test_numpy_nullable_dict(self):
+        data = {0: pd.DataFrame({"a": [1.0, None]}), "DESCR": "text"}
+        result = _to_dtype_backend(data, "numpy_nullable")
+        assert result[0]["a"].dtype == pd.Float64Dtype()
+        assert result["DESCR"] == "text"
+        assert _to_dtype_backend(data, None) is data
@@ -347,3 +347,76 @@ class TestWB:
         result = result.sort_index()
         result = np.round(result, decimals=-1)
         tm.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_dtype_backend_pyarrow(self, monkeypatch):
+        pa = pytest.importorskip("pyarrow")
+
+        def read_one_data(url, params):
+            indicator = url.rsplit("/", 1)[-1]
+            return pd.DataFrame(
+                {
+                    "country": ["Canada", "Canada", "Mexico"],
+                    "iso_code": ["CAN", "CAN", "MEX"],
+                    "year": ["2019", "2020", "2020"],
+                    "value": [1.0, None, 3.0] if indicator == "A" else [4, 5, 6],
+                }
+            )
+
+        reader = WorldBankReader(
+            ["A", "B"], countries=["CA", "MX"], dtype_backend="pyarrow"
+        )
+        monkeypatch.setattr(reader, "_read_one_data", read_one_data)
+        result = reader.read()
+
+        labels = pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))
+        assert result.index.names == ["country", "year"]
+        assert result.index.levels[0].dtype == labels
+        assert result.index.levels[1].dtype == labels
+        assert result["A"].dtype == pd.ArrowDtype(pa.float64())
+        assert result["A"].isna().tolist() == [False, True, False]
+        assert result.loc[("Mexico", "2020"), "B"] == 6
+
+    def test_iter_read(self, monkeypatch):
+        def read_one_data(url, params):
+            if url.endswith("BAD"):
+                raise ValueError("The indicator was not found.")
+            return pd.DataFrame(
+                {
+                    "country": ["Canada", "Mexico"],
+                    "iso_code": ["CAN", "MEX"],
+                    "year": ["2020", "2020"],
+                    "value": [1.0, 2.0],
+                }
+            )
+
+        reader = WorldBankReader(["A", "BAD", "B"], countries=["CA", "MX"])
+        monkeypatch.setattr(reader, "_read_one_data", read_one_data)
+        with pytest.warns(UserWarning, match="Indicator: BAD"):
+            pairs = list(reader.iter_read())
+
+        assert [indicator for indicator, _ in pairs] == ["A", "B"]
+        frame = pairs[0][1]
+        assert frame.index.names == ["country", "year"]
+        assert list(frame.columns) == ["A"]
+        assert frame.loc[("Mexico", "2020"), "A"] == 2.0
+
+    def test_output_long(self, monkeypatch):
+        def read_one_data(url, params):
+            values = [1.0, None] if url.endswith("A") else ["5", "6"]
+            return pd.DataFrame(
+                {
+                    "country": ["Canada", "Mexico"],
+                    "iso_code": ["CAN", "MEX"],
+                    "year": ["2020", "2020"],
+                    "value": values,
+                }
+            )
+
+        reader = WorldBankReader(["A", "B"], countries=["CA", "MX"], output="long")
+        monkeypatch.setattr(reader, "_read_one_data", read_one_data)
+        result = reader.read()
+
+        assert list(result.columns) == ["country", "year", "series_id", "value"]
+        assert result["country"].tolist() == ["Canada", "Canada", "Mexico"]
+        assert result["series_id"].tolist() == ["A", "B", "B"]
+        assert result["value"].tolist() == [1.0, 5.0, 6.0]
@@ -1,9 +1,16 @@
-from functools import reduce
+import asyncio
+from functools import lru_cache
 import warnings
 
 import numpy as np
 import pandas as pd
 
+from pandas_datareader._utils import (
+    _label_dtype,
+    _outer_join,
+    _to_long,
+    _validate_output,
+)
 from pandas_datareader.base import _BaseReader
 
 # This list of country codes was pulled from wikipedia during October 2014.
@@ -14,509 +21,44 @@ from pandas_datareader.base import _BaseReader
 
 WB_API_URL = "https://api.worldbank.org/v2"
 
-country_codes = [
-    "AD",
-    "AE",
-    "AF",
-    "AG",
-    "AI",
-    "AL",
-    "AM",
-    "AO",
-    "AQ",
-    "AR",
-    "AS",
-    "AT",
-    "AU",
-    "AW",
-    "AX",
-    "AZ",
-    "BA",
-    "BB",
-    "BD",
-    "BE",
-    "BF",
-    "BG",
-    "BH",
-    "BI",
-    "BJ",
-    "BL",
-    "BM",
-    "BN",
-    "BO",
-    "BQ",
-    "BR",
-    "BS",
-    "BT",
-    "BV",
-    "BW",
-    "BY",
-    "BZ",
-    "CA",
-    "CC",
-    "CD",
-    "CF",
-    "CG",
-    "CH",
-    "CI",
-    "CK",
-    "CL",
-    "CM",
-    "CN",
-    "CO",
-    "CR",
-    "CU",
-    "CV",
-    "CW",
-    "CX",
-    "CY",
-    "CZ",
-    "DE",
-    "DJ",
-    "DK",
-    "DM",
-    "DO",
-    "DZ",
-    "EC",
-    "EE",
-    "EG",
-    "EH",
-    "ER",
-    "ES",
-    "ET",
-    "FI",
-    "FJ",
-    "FK",
-    "FM",
-    "FO",
-    "FR",
-    "GA",
-    "GB",
-    "GD",
-    "GE",
-    "GF",
-    "GG",
-    "GH",
-    "GI",
-    "GL",
-    "GM",
-    "GN",
-    "GP",
-    "GQ",
-    "GR",
-    "GS",
-    "GT",
-    "GU",
-    "GW",
-    "GY",
-    "HK",
-    "HM",
-    "HN",
-    "HR",
-    "HT",
-    "HU",
-    "ID",
-    "IE",
-    "IL",
-    "IM",
-    "IN",
-    "IO",
-    "IQ",
-    "IR",
-    "IS",
-    "IT",
-    "JE",
-    "JM",
-    "JO",
-    "JP",
-    "KE",
-    "KG",
-    "KH",
-    "KI",
-    "KM",
-    "KN",
-    "KP",
-    "KR",
-    "KW",
-    "KY",
-    "KZ",
-    "LA",
-    "LB",
-    "LC",
-    "LI",
-    "LK",
-    "LR",
-    "LS",
-    "LT",
-    "LU",
-    "LV",
-    "LY",
-    "MA",
-    "MC",
-    "MD",
-    "ME",
-    "MF",
-    "MG",
-    "MH",
-    "MK",
-    "ML",
-    "MM",
-    "MN",
-    "MO",
-    "MP",
-    "MQ",
-    "MR",
-    "MS",
-    "MT",
-    "MU",
-    "MV",
-    "MW",
-    "MX",
-    "MY",
-    "MZ",
-    "NA",
-    "NC",
-    "NE",
-    "NF",
-    "NG",
-    "NI",
-    "NL",
-    "NO",
-    "NP",
-    "NR",
-    "NU",
-    "NZ",
-    "OM",
-    "PA",
-    "PE",
-    "PF",
-    "PG",
-    "PH",
-    "PK",
-    "PL",
-    "PM",
-    "PN",
-    "PR",
-    "PS",
-    "PT",
-    "PW",
-    "PY",
-    "QA",
-    "RE",
-    "RO",
-    "RS",
-    "RU",
-    "RW",
-    "SA",
-    "SB",
-    "SC",
-    "SD",
-    "SE",
-    "SG",
-    "SH",
-    "SI",
-    "SJ",
-    "SK",
-    "SL",
-    "SM",
-    "SN",
-    "SO",
-    "SR",
-    "SS",
-    "ST",
-    "SV",
-    "SX",
-    "SY",
-    "SZ",
-    "TC",
-    "TD",
-    "TF",
-    "TG",
-    "TH",
-    "TJ",
-    "TK",
-    "TL",
-    "TM",
-    "TN",
-    "TO",
-    "TR",
-    "TT",
-    "TV",
-    "TW",
-    "TZ",
-    "UA",
-    "UG",
-    "UM",
-    "US",
-    "UY",
-    "UZ",
-    "VA",
-    "VC",
-    "VE",
-    "VG",
-    "VI",
-    "VN",
-    "VU",
-    "WF",
-    "WS",
-    "YE",
-    "YT",
-    "ZA",
-    "ZM",
-    "ZW",
-    "ABW",
-    "AFG",
-    "AGO",
-    "AIA",
-    "ALA",
-    "ALB",
-    "AND",
-    "ARE",
-    "ARG",
-    "ARM",
-    "ASM",
-    "ATA",
-    "ATF",
-    "ATG",
-    "AUS",
-    "AUT",
-    "AZE",
-    "BDI",
-    "BEL",
-    "BEN",
-    "BES",
-    "BFA",
-    "BGD",
-    "BGR",
-    "BHR",
-    "BHS",
-    "BIH",
-    "BLM",
-    "BLR",
-    "BLZ",
-    "BMU",
-    "BOL",
-    "BRA",
-    "BRB",
-    "BRN",
-    "BTN",
-    "BVT",
-    "BWA",
-    "CAF",
-    "CAN",
-    "CCK",
-    "CHE",
-    "CHL",
-    "CHN",
-    "CIV",
-    "CMR",
-    "COD",
-    "COG",
-    "COK",
-    "COL",
-    "COM",
-    "CPV",
-    "CRI",
-    "CUB",
-    "CUW",
-    "CXR",
-    "CYM",
-    "CYP",
-    "CZE",
-    "DEU",
-    "DJI",
-    "DMA",
-    "DNK",
-    "DOM",
-    "DZA",
-    "ECU",
-    "EGY",
-    "ERI",
-    "ESH",
-    "ESP",
-    "EST",
-    "ETH",
-    "FIN",
-    "FJI",
-    "FLK",
-    "FRA",
-    "FRO",
-    "FSM",
-    "GAB",
-    "GBR",
-    "GEO",
-    "GGY",
-    "GHA",
-    "GIB",
-    "GIN",
-    "GLP",
-    "GMB",
-    "GNB",
-    "GNQ",
-    "GRC",
-    "GRD",
-    "GRL",
-    "GTM",
-    "GUF",
-    "GUM",
-    "GUY",
-    "HKG",
-    "HMD",
-    "HND",
-    "HRV",
-    "HTI",
-    "HUN",
-    "IDN",
-    "IMN",
-    "IND",
-    "IOT",
-    "IRL",
-    "IRN",
-    "IRQ",
-    "ISL",
-    "ISR",
-    "ITA",
-    "JAM",
-    "JEY",
-    "JOR",
-    "JPN",
-    "KAZ",
-    "KEN",
-    "KGZ",
-    "KHM",
-    "KIR",
-    "KNA",
-    "KOR",
-    "KWT",
-    "LAO",
-    "LBN",
-    "LBR",
-    "LBY",
-    "LCA",
-    "LIE",
-    "LKA",
-    "LSO",
-    "LTU",
-    "LUX",
-    "LVA",
-    "MAC",
-    "MAF",
-    "MAR",
-    "MCO",
-    "MDA",
-    "MDG",
-    "MDV",
-    "MEX",
-    "MHL",
-    "MKD",
-    "MLI",
-    "MLT",
-    "MMR",
-    "MNE",
-    "MNG",
-    "MNP",
-    "MOZ",
-    "MRT",
-    "MSR",
-    "MTQ",
-    "MUS",
-    "MWI",
-    "MYS",
-    "MYT",
-    "NAM",
-    "NCL",
-    "NER",
-    "NFK",
-    "NGA",
-    "NIC",
-    "NIU",
-    "NLD",
-    "NOR",
-    "NPL",
-    "NRU",
-    "NZL",
-    "OMN",
-    "PAK",
-    "PAN",
-    "PCN",
-    "PER",
-    "PHL",
-    "PLW",
-    "PNG",
-    "POL",
-    "PRI",
-    "PRK",
-    "PRT",
-    "PRY",
-    "PSE",
-    "PYF",
-    "QAT",
-    "REU",
-    "ROU",
-    "RUS",
-    "RWA",
-    "SAU",
-    "SDN",
-    "SEN",
-    "SGP",
-    "SGS",
-    "SHN",
-    "SJM",
-    "SLB",
-    "SLE",
-    "SLV",
-    "SMR",
-    "SOM",
-    "SPM",
-    "SRB",
-    "SSD",
-    "STP",
-    "SUR",
-    "SVK",
-    "SVN",
-    "SWE",
-    "SWZ",
-    "SXM",
-    "SYC",
-    "SYR",
-    "TCA",
-    "TCD",
-    "TGO",
-    "THA",
-    "TJK",
-    "TKL",
-    "TKM",
-    "TLS",
-    "TON",
-    "TTO",
-    "TUN",
-    "TUR",
-    "TUV",
-    "TWN",
-    "TZA",
-    "UGA",
-    "UKR",
-    "UMI",
-    "URY",
-    "USA",
-    "UZB",
-    "VAT",
-    "VCT",
-    "VEN",
-    "VGB",
-    "VIR",
-    "VNM",
-    "VUT",
-    "WLF",
-    "WSM",
-    "YEM",
-    "ZAF",
-    "ZMB",
-    "ZWE",
-    "all",
-    "ALL",
-    "All",
-]
+_COUNTRY_CODES = """
+AD AE AF AG AI AL AM AO AQ AR AS AT AU AW AX AZ BA BB BD BE BF BG BH BI BJ
+BL BM BN BO BQ BR BS BT BV BW BY BZ CA CC CD CF CG CH CI CK CL CM CN CO CR
+CU CV CW CX CY CZ DE DJ DK DM DO DZ EC EE EG EH ER ES ET FI FJ FK FM FO FR
+GA GB GD GE GF GG GH GI GL GM GN GP GQ GR GS GT GU GW GY HK HM HN HR HT HU
+ID IE IL IM IN IO IQ IR IS IT JE JM JO JP KE KG KH KI KM KN KP KR KW KY KZ
+LA LB LC LI LK LR LS LT LU LV LY MA MC MD ME MF MG MH MK ML MM MN MO MP MQ
+MR MS MT MU MV MW MX MY MZ NA NC NE NF NG NI NL NO NP NR NU NZ OM PA PE PF
+PG PH PK PL PM PN PR PS PT PW PY QA RE RO RS RU RW SA SB SC SD SE SG SH SI
+SJ SK SL SM SN SO SR SS ST SV SX SY SZ TC TD TF TG TH TJ TK TL TM TN TO TR
+TT TV TW TZ UA UG UM US UY UZ VA VC VE VG VI VN VU WF WS YE YT ZA ZM ZW ABW
+AFG AGO AIA ALA ALB AND ARE ARG ARM ASM ATA ATF ATG AUS AUT AZE BDI BEL BEN
+BES BFA BGD BGR BHR BHS BIH BLM BLR BLZ BMU BOL BRA BRB BRN BTN BVT BWA CAF
+CAN CCK CHE CHL CHN CIV CMR COD COG COK COL COM CPV CRI CUB CUW CXR CYM CYP
+CZE DEU DJI DMA DNK DOM DZA ECU EGY ERI ESH ESP EST ETH FIN FJI FLK FRA FRO
+FSM GAB GBR GEO GGY GHA GIB GIN GLP GMB GNB GNQ GRC GRD GRL GTM GUF GUM GUY
+HKG HMD HND HRV HTI HUN IDN IMN IND IOT IRL IRN IRQ ISL ISR ITA JAM JEY JOR
+JPN KAZ KEN KGZ KHM KIR KNA KOR KWT LAO LBN LBR LBY LCA LIE LKA LSO LTU LUX
+LVA MAC MAF MAR MCO MDA MDG MDV MEX MHL MKD MLI MLT MMR MNE MNG MNP MOZ MRT
+MSR MTQ MUS MWI MYS MYT NAM NCL NER NFK NGA NIC NIU NLD NOR NPL NRU NZL OMN
+PAK PAN PCN PER PHL PLW PNG POL PRI PRK PRT PRY PSE PYF QAT REU ROU RUS RWA
+SAU SDN SEN SGP SGS SHN SJM SLB SLE SLV SMR SOM SPM SRB SSD STP SUR SVK SVN
+SWE SWZ SXM SYC SYR TCA TCD TGO THA TJK TKL TKM TLS TON TTO TUN TUR TUV TWN
+TZA UGA UKR UMI URY USA UZB VAT VCT VEN VGB VIR VNM VUT WLF WSM YEM ZAF ZMB
+ZWE all ALL All
+"""
+
+
+@lru_cache(maxsize=1)
+def _country_codes():
+    return frozenset(_COUNTRY_CODES.split())
+
+
+def __getattr__(name):
+    # the list is only built when it is asked for
+    if name == "country_codes":
+        return _COUNTRY_CODES.split()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class WorldBankReader(_BaseReader):
@@ -543,6 +85,14 @@ class WorldBankReader(_BaseReader):
         the outcome of that validation, and attempts to also apply
         to the results from world bank.
         errors='raise', will raise a ValueError on a bad country code.
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        Dtypes of the result. With 'pyarrow' the country and year index
+        levels are dictionary-encoded Arrow strings and the values nullable
+        Arrow floats.
+    output : {'wide', 'long'}, default 'wide'
+        'wide' merges the indicators into one column each. 'long' returns
+        ``country``, ``year``, ``series_id`` and ``value`` columns with a row
+        per reported value.
     """
 
     _format = "json"
@@ -558,6 +108,10 @@ class WorldBankReader(_BaseReader):
         pause=0.1,
         session=None,
         errors="warn",
+        dtype_backend=None,
+        output="wide",
+        deadline=None,
+        offline=None,
     ):
         if symbols is None:
             symbols = ["NY.GDP.MKTP.CD", "NY.GNS.ICTR.ZS"]
@@ -571,6 +125,9 @@ class WorldBankReader(_BaseReader):
             retry_count=retry_count,
             pause=pause,
             session=session,
+            dtype_backend=dtype_backend,
+            deadline=deadline,
+            offline=offline,
         )
 
         if countries is None:
@@ -578,7 +135,7 @@ class WorldBankReader(_BaseReader):
         elif isinstance(countries, str):
             countries = [countries]
 
-        bad_countries = np.setdiff1d(countries, country_codes)
+        bad_countries = sorted(set(countries) - _country_codes())
         # Validate the input
         if len(bad_countries) > 0:
             tmp = ", ".join(bad_countries)
@@ -600,6 +157,7 @@ class WorldBankReader(_BaseReader):
         self.freq = freq
         self.countries = countries
         self.errors = errors
+        self.output = _validate_output(output)
 
     @property
     def url(self):
@@ -636,36 +194,79 @@ class WorldBankReader(_BaseReader):
     def read(self):
         """Read data"""
         try:
-            return self._read()
+            return self._convert(self._read())
         finally:
             self.close()
 
     def _read(self):
+        data = [self._read_indicator(indicator) for indicator in self.symbols]
+        return self._combine([df for df in data if df is not None])
+
+    def _read_indicator(self, indicator):
+        # Build URL for api call
+        try:
+            df = self._read_one_data(self.url + indicator, self.params)
+            df.columns = ["country", "iso_code", "year", indicator]
+            return df
+
+        except ValueError as e:
+            self._indicator_error(e, indicator)
+            return None
+
+    def _names(self):
+        return self.symbols
+
+    def _read_symbol(self, indicator):
+        df = self._read_indicator(indicator)
+        return None if df is None else self._combine([df])
+
+    async def _aread(self):
+        frames = await asyncio.gather(
+            *(
+                self._aread_one_data(self.url + indicator, self.params)
+                for indicator in self.symbols
+            ),
+            return_exceptions=True,
+        )
         data = []
-        for indicator in self.symbols:
-            # Build URL for api call
+        for indicator, df in zip(self.symbols, frames, strict=True):
             try:
-                df = self._read_one_data(self.url + indicator, self.params)
+                if isinstance(df, BaseException):
+                    raise df
                 df.columns = ["country", "iso_code", "year", indicator]
                 data.append(df)
 
             except ValueError as e:
-                msg = str(e) + " Indicator: " + indicator
-                if self.errors == "raise":
-                    raise ValueError(msg) from e
-                elif self.errors == "warn":
-                    warnings.warn(msg, stacklevel=2)
+                self._indicator_error(e, indicator)
 
+        return self._combine(data)
+
+    def _indicator_error(self, e, indicator):
+        msg = str(e) + " Indicator: " + indicator
+        if self.errors == "raise":
+            raise ValueError(msg) from e
+        elif self.errors == "warn":
+            warnings.warn(msg, stacklevel=3)
+
+    def _combine(self, data):
         # Confirm we actually got some data, and build Dataframe
         if len(data) > 0:
-            out = reduce(lambda x, y: x.merge(y, how="outer"), data)
-            out = out.drop("iso_code", axis=1)
-            out = out.set_index(["country", "year"])
-            out = out.apply(pd.to_numeric, errors="coerce")
-            try:
-                string_dtype = pd.StringDtype(na_value=np.nan)
-            except TypeError:
-                string_dtype = pd.StringDtype()
+            frames = [
+                df.set_index(["country", "year"])
+                .drop(columns="iso_code")
+                .apply(pd.to_numeric, errors="coerce")
+                for df in data
+            ]
+            if self.output == "long":
+                return _to_long(frames)
+            out = _outer_join(frames)
+            if self.dtype_backend is not None:
+                string_dtype = _label_dtype(self.dtype_backend)
+            else:
+                try:
+                    string_dtype = pd.StringDtype(na_value=np.nan)
+                except TypeError:
+                    string_dtype = pd.StringDtype()
             out.index = out.index.set_levels(
                 [
                     pd.Index(out.index.levels[0], dtype=string_dtype, name="country"),
@@ -10,3 +10,17 @@ def test_import_pandas_datareader_smoke():
     ]
     proc = subprocess.run(cmd, capture_output=True, text=True)
     assert proc.returncode == 0, proc.stderr
+
+
+def test_import_is_lazy():
+    # wall-clock import budgets are flaky on loaded CI machines, so only check
+    # that the heavy dependencies and the readers are loaded on first use
+    code = (
+        "import sys, pandas_datareader\n"
+        "from pandas_datareader.registry import _BUILTIN_SOURCES\n"
+        "readers = {path.partition(':')[0] for path in _BUILTIN_SOURCES.values()}\n"
+        "print('\\n'.join(sorted(set(sys.modules) & (readers | {'pandas', 'requests'}))))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == []